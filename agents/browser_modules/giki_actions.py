@@ -5,7 +5,15 @@ GIKI Transport Actions Module - Specific GIKI Transport functionality
 import time
 from typing import Dict, Any
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# Sign-in form locators in priority order
+EMAIL_LOCATORS = ((By.NAME, "email"), (By.ID, "email"))
+PASSWORD_LOCATORS = ((By.NAME, "password"), (By.ID, "password"))
+SIGNIN_BUTTON_LOCATORS = (
+    (By.XPATH, "//button[contains(text(), 'Sign In') or contains(text(), 'Sign in') or contains(text(), 'Login') or contains(text(), 'login')]"),
+    (By.CSS_SELECTOR, "button[type='submit'], input[type='submit']")
+)
 
 class GIKITransportActions:
     """GIKI Transport specific actions"""
@@ -13,6 +21,14 @@ class GIKITransportActions:
     def __init__(self, browser_core):
         self.browser_core = browser_core
     
+    def _first_match(self, locators):
+        """Return the first element matched by any locator, or None (find_elements never raises on a miss)"""
+        for by, value in locators:
+            hits = self.browser_core.driver.find_elements(by, value)
+            if hits:
+                return hits[0]
+        return None
+    
     def handle_signin(self, email: str = None, password: str = None) -> Dict[str, Any]:
         """Handle signin process for GIKI Transport."""
         try:
@@ -33,56 +49,38 @@ class GIKITransportActions:
             # Quick page load wait
             time.sleep(1.5)  # Reduced from 3 seconds
             
-            # Find and fill email field
+            # Find and fill email field (waits for the form to render)
             try:
-                email_field = self.browser_core.wait.until(
-                    EC.presence_of_element_located((By.NAME, "email"))
-                )
-                email_field.clear()
-                email_field.send_keys(email)
-            except:
-                try:
-                    email_field = self.browser_core.driver.find_element(By.ID, "email")
-                    email_field.clear()
-                    email_field.send_keys(email)
-                except:
-                    return {
-                        "success": False,
-                        "message": "Could not find email field on signin page",
-                        "error": "Email field not found"
-                    }
+                email_field = self.browser_core.wait.until(lambda d: self._first_match(EMAIL_LOCATORS))
+            except TimeoutException:
+                return {
+                    "success": False,
+                    "message": "Could not find email field on signin page",
+                    "error": "Email field not found"
+                }
+            email_field.clear()
+            email_field.send_keys(email)
             
             # Find and fill password field
-            try:
-                password_field = self.browser_core.driver.find_element(By.NAME, "password")
-                password_field.clear()
-                password_field.send_keys(password)
-            except:
-                try:
-                    password_field = self.browser_core.driver.find_element(By.ID, "password")
-                    password_field.clear()
-                    password_field.send_keys(password)
-                except:
-                    return {
-                        "success": False,
-                        "message": "Could not find password field on signin page",
-                        "error": "Password field not found"
-                    }
+            password_field = self._first_match(PASSWORD_LOCATORS)
+            if password_field is None:
+                return {
+                    "success": False,
+                    "message": "Could not find password field on signin page",
+                    "error": "Password field not found"
+                }
+            password_field.clear()
+            password_field.send_keys(password)
             
             # Find and click signin button
-            try:
-                signin_button = self.browser_core.driver.find_element(By.XPATH, "//button[contains(text(), 'Sign In') or contains(text(), 'Sign in') or contains(text(), 'Login') or contains(text(), 'login')]")
-                signin_button.click()
-            except:
-                try:
-                    signin_button = self.browser_core.driver.find_element(By.TYPE, "submit")
-                    signin_button.click()
-                except:
-                    return {
-                        "success": False,
-                        "message": "Could not find signin button on page",
-                        "error": "Signin button not found"
-                    }
+            signin_button = self._first_match(SIGNIN_BUTTON_LOCATORS)
+            if signin_button is None:
+                return {
+                    "success": False,
+                    "message": "Could not find signin button on page",
+                    "error": "Signin button not found"
+                }
+            signin_button.click()
             
             # Quick wait for redirect to dashboard
             time.sleep(1.5)  # Reduced from 3 seconds
@@ -6,6 +6,10 @@ import time
 import threading
 from typing import Dict, Any, Optional
 
+from ..intent_parsing_agent import QA_MODEL
+
+DEMO_QA_PROMPT = "You are a professional sales agent demonstrating GIKI Transport. Answer questions briefly and enthusiastically like a human sales agent would during a product demo. Be helpful and engaging. Keep responses short."
+
 class InteractiveDemo:
     """Interactive demo with real-time Q&A capabilities"""
     
@@ -106,9 +110,13 @@ class InteractiveDemo:
     def execute_demo_steps(self) -> Dict[str, Any]:
         """Execute demo steps with Q&A support"""
         completed_steps = []
+        narrations = [f"Step {i+1}: {step['narration']}" for i, step in enumerate(self.demo_steps)]
+        next_audio = self._prefetch_narration(narrations, 0)
         
         for i, step in enumerate(self.demo_steps):
             self.current_step = i
+            # Synthesize the next narration while this step is narrated and executed
+            audio_future, next_audio = next_audio, self._prefetch_narration(narrations, i + 1)
             
             try:
                 print(f"\n📝 Step {i+1}: {step['name']}")
@@ -116,7 +124,7 @@ class InteractiveDemo:
                 # Voice narration with error handling
                 try:
                     if self.voice_agent:
-                        self.voice_agent.speak_response(f"Step {i+1}: {step['narration']}")
+                        self.voice_agent.speak_response(narrations[i], audio_future=audio_future)
                         time.sleep(0.3)  # Quick pause after narration
                 except Exception as e:
                     print(f"⚠️ Voice narration failed: {e}")
@@ -177,6 +185,16 @@ class InteractiveDemo:
             "steps_completed": len(completed_steps)
         }
     
+    def _prefetch_narration(self, narrations, index: int):
+        """Start synthesizing narrations[index] in the background (None past the end or without voice)"""
+        if not self.voice_agent or index >= len(narrations):
+            return None
+        try:
+            return self.voice_agent.prefetch(narrations[index])
+        except Exception as e:
+            print(f"⚠️ Narration prefetch failed: {e}")
+            return None
+    
     def wait_with_qa_option(self, duration: float):
         """Simple wait that can be interrupted for Q&A"""
         start_time = time.time()
@@ -198,20 +216,25 @@ class InteractiveDemo:
             self.qa_active = True
             
             # Generate answer using LLM
+            spoken = False
             try:
-                if self.intent_agent:
-                    response = self.intent_agent.groq_client.chat.completions.create(
-                        model="llama3-8b-8192",
-                        messages=[
-                            {
-                                "role": "system", 
-                                "content": "You are a professional sales agent demonstrating GIKI Transport. Answer questions briefly and enthusiastically like a human sales agent would during a product demo. Be helpful and engaging. Keep responses short."
-                            },
-                            {
-                                "role": "user", 
-                                "content": f"During GIKI Transport demo, customer asks: {question}"
-                            }
-                        ],
+                if self.intent_agent and self.voice_agent:
+                    # Speak each sentence as soon as the LLM has produced it
+                    answer = self.voice_agent.speak_token_stream(self.intent_agent.stream_completion(
+                        f"During GIKI Transport demo, customer asks: {question}",
+                        system=DEMO_QA_PROMPT,
+                        model=QA_MODEL,
+                        max_tokens=40,  # Shorter for faster responses
+                        temperature=0.4
+                    ))
+                    spoken = bool(answer)
+                    if not answer:
+                        answer = "That's a great question! GIKI Transport is designed to be user-friendly and efficient."
+                elif self.intent_agent:
+                    response = self.intent_agent._chat(
+                        [{"role": "user", "content": f"During GIKI Transport demo, customer asks: {question}"}],
+                        system=DEMO_QA_PROMPT,
+                        model=QA_MODEL,
                         max_tokens=40,  # Shorter for faster responses
                         temperature=0.4
                     )
@@ -238,7 +261,8 @@ class InteractiveDemo:
             
             # Speak the answer
             if self.voice_agent:
-                self.voice_agent.speak_response(answer)
+                if not spoken:
+                    self.voice_agent.speak_response(answer)
                 
                 # Simple transition message based on demo state
                 if self.demo_active and self.current_step < len(self.demo_steps) - 1:
@@ -254,7 +278,7 @@ class InteractiveDemo:
                 "question": question,
                 "answer": answer,
                 "demo_step": self.current_step,
-                "timestamp": time.strftime("%H:%M:%S")
+                "timestamp": time.time_ns() // 1_000_000  # epoch ms
             }
             
         except Exception as e:
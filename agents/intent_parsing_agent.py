@@ -6,7 +6,8 @@ Uses Groq API for natural language understanding.
 import json
 import re
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+import httpx
 from groq import Groq
 # Settings removed
 from dotenv import load_dotenv
@@ -14,6 +15,23 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# HTTP/2 needs the optional h2 package; without it the pool still reuses HTTP/1.1 connections
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled client shared by every agent, so concurrent Groq calls reuse warm TLS connections
+_HTTP = httpx.Client(
+    http2=HTTP2_AVAILABLE,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    timeout=httpx.Timeout(30.0, connect=5.0)
+)
+
+# Short Q&A answers (one or two sentences) use Groq's fastest tier
+QA_MODEL = "llama-3.1-8b-instant"
+
 class IntentParsingAgent:
     """
     Intent Parsing Agent responsible for:
@@ -24,8 +42,10 @@ class IntentParsingAgent:
     """
     
     def __init__(self):
-        self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        # Shares the module connection pool and retries transient failures
+        self.groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"), max_retries=2, http_client=_HTTP)
         self.model = "llama3-8b-8192"  # Fast and efficient model
+        self.service_tier = "auto"  # Let Groq pick the fastest available tier
         
         # Intent templates for consistent parsing
         self.intent_examples = {
@@ -78,6 +98,70 @@ class IntentParsingAgent:
         
         # Success: Intent agent
     
+    def _chat(self, messages: List[Dict[str, str]], *, max_tokens: int, temperature: float = 0,
+              stream: bool = False, system: Optional[str] = None,
+              response_format: Optional[Dict[str, str]] = None,
+              model: Optional[str] = None, stop: Optional[List[str]] = None):
+        """
+        Single entry point for Groq chat completions.
+        
+        Args:
+            messages: Chat messages (without the system prompt)
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
+            stream: Return a chunk iterator instead of a completed response
+            system: Optional system prompt prepended to the messages
+            response_format: Optional response format, e.g. {"type": "json_object"}
+            model: Model override (defaults to self.model)
+            stop: Optional stop sequences
+            
+        Returns:
+            Groq completion response (or stream when stream=True)
+        """
+        if system:
+            messages = [{"role": "system", "content": system}, *messages]
+        
+        kwargs = {
+            "model": model or self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": stream,
+            "service_tier": self.service_tier,
+        }
+        if response_format:
+            kwargs["response_format"] = response_format
+        if stop:
+            kwargs["stop"] = stop
+        
+        return self.groq_client.chat.completions.create(**kwargs)
+    
+    def stream_completion(self, prompt: str, *, system: str, max_tokens: int,
+                          temperature: float = 0, model: Optional[str] = None,
+                          stop: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yield the text of a chat completion as Groq streams it.
+        
+        Args:
+            prompt: User message
+            system: System prompt
+            max_tokens: Completion token limit
+            temperature: Sampling temperature
+            model: Model override (defaults to self.model)
+            stop: Optional stop sequences
+            
+        Returns:
+            Iterator of text fragments
+        """
+        stream = self._chat([{"role": "user", "content": prompt}], max_tokens=max_tokens,
+                            temperature=temperature, stream=True, system=system,
+                            model=model, stop=stop)
+        for chunk in stream:
+            if chunk.choices:
+                text = chunk.choices[0].delta.content
+                if text:
+                    yield text
+    
     def create_parsing_prompt(self, user_command: str) -> str:
         """
         Create a structured prompt for intent parsing.
@@ -136,7 +220,8 @@ Return only the JSON response:
             user_command: Raw command text from user
             
         Returns:
-            Structured intent dictionary
+            Structured intent dictionary ("fallback": True when the LLM call failed
+            and keyword matching produced it)
         """
         try:
             # Debug: Intent agent action
@@ -145,14 +230,12 @@ Return only the JSON response:
             prompt = self.create_parsing_prompt(user_command)
             
             # Call Groq API
-            response = self.groq_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert intent parser. Return only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
+            response = self._chat(
+                [{"role": "user", "content": prompt}],
+                system="You are an expert intent parser. Return only valid JSON.",
                 max_tokens=1000,
-                temperature=0.7
+                temperature=0.7,
+                response_format={"type": "json_object"}
             )
             
             # Extract and parse JSON response
@@ -174,11 +257,11 @@ Return only the JSON response:
             
         except json.JSONDecodeError as e:
             # Error: Intent agent}")
-            return self.fallback_parsing(user_command)
+            return {**self.fallback_parsing(user_command), "fallback": True}
             
         except Exception as e:
             # Error: Intent agent}")
-            return self.fallback_parsing(user_command)
+            return {**self.fallback_parsing(user_command), "fallback": True}
     
     def validate_and_enrich_intent(self, intent_data: Dict[str, Any], original_command: str) -> Dict[str, Any]:
         """
@@ -493,12 +576,9 @@ USER QUESTION: {question}
 Provide a helpful, concise answer based on the GIKI Transport System context above. If the question is not related to transport or the system, politely redirect to transport-related topics.
 """
             
-            response = self.groq_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant for the GIKI Transport System. Provide clear, concise answers."},
-                    {"role": "user", "content": context_prompt}
-                ],
+            response = self._chat(
+                [{"role": "user", "content": context_prompt}],
+                system="You are a helpful assistant for the GIKI Transport System. Provide clear, concise answers.",
                 max_tokens=300,
                 temperature=0.7
             )
@@ -5,15 +5,31 @@ Uses Google Speech Recognition (FREE) for STT and ElevenLabs for TTS.
 
 import time
 import io
+import functools
+import json
 import tempfile
 import os
+import re
+import queue
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 import pygame
 import speech_recognition as sr
 from elevenlabs.client import ElevenLabs
 from dotenv import load_dotenv
 
+@functools.cache
+def _load_env() -> bool:
+    """Parse .env once per process"""
+    load_dotenv()
+    return True
+
 # Load environment variables
-load_dotenv()
+_load_env()
 
 # Try to import audio libraries
 try:
@@ -29,6 +45,102 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
+# Optional streaming STT (Google Cloud Speech gRPC)
+try:
+    from google.cloud import speech
+    GOOGLE_SPEECH_AVAILABLE = True
+except ImportError:
+    GOOGLE_SPEECH_AVAILABLE = False
+
+DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"
+VOICE_ID_RE = re.compile(r'^[A-Za-z0-9]{20}$')
+DEFAULT_TTS_MODEL = "eleven_turbo_v2_5"  # Low-latency streaming model
+DEFAULT_TTS_FORMAT = "mp3_22050_32"
+
+# Measured microphone energy threshold, reused across restarts
+CALIBRATION_FILE = Path.home() / ".voice_agent_calib.json"
+CALIBRATION_MAX_AGE = 3600  # seconds
+
+# Posted by pygame when mixer.music finishes a clip
+MUSIC_END_EVENT = pygame.USEREVENT + 1
+
+# Safety cap on a single utterance; endpointing is driven by silence
+MAX_PHRASE_SECONDS = 30
+
+# Sentence boundaries used to pipeline synthesis with playback
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+class TTSCache:
+    """
+    Cache of synthesized MP3 audio keyed by SHA-1(text|voice_id|model).
+    Keeps an in-memory LRU and optionally persists clips to disk so repeated
+    demo scripts never hit ElevenLabs twice.
+    """
+    
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        # Shared by the narration, TTS and prefetch threads
+        self._lock = threading.Lock()
+        
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"⚠️ TTS disk cache disabled: {e}")
+                self.cache_dir = None
+    
+    @staticmethod
+    def make_key(text: str, voice_id: str, model: str) -> str:
+        """Build the cache key for a phrase"""
+        return hashlib.sha1(f"{text}|{voice_id}|{model}".encode()).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio or None"""
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+                return audio
+        
+        if self.cache_dir:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    audio = f.read()
+            except OSError:
+                return None
+            self._remember(key, audio)
+        
+        return audio
+    
+    def put(self, key: str, audio: bytes):
+        """Store audio in memory and on disk"""
+        self._remember(key, audio)
+        
+        if self.cache_dir:
+            # Write to a temp file and rename, so a concurrent get() never reads a partial clip
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(audio)
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                print(f"⚠️ TTS cache write failed: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    def _remember(self, key: str, audio: bytes):
+        with self._lock:
+            self._entries[key] = audio
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
 class VoiceAgent:
     """
     Voice Agent responsible for:
@@ -39,30 +151,60 @@ class VoiceAgent:
     """
     
     def __init__(self):
+        # Synthesized audio cache (memory + temp dir)
+        self.tts_model = DEFAULT_TTS_MODEL
+        self.tts_output_format = DEFAULT_TTS_FORMAT
+        self._cache = TTSCache(cache_dir=os.path.join(tempfile.gettempdir(), "tts_cache"))
+        # Background synthesis so the next phrase is ready while the current one plays
+        self._tts_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+        # Syntheses currently running, keyed like the cache, so duplicate requests share one API call
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # Set while idle, cleared while speaking, so callers can wait without polling
+        self.speaking_done = threading.Event()
+        self.speaking_done.set()
+        
         # Initialize Google Speech Recognition (FREE)
         self.recognizer = sr.Recognizer()
+        # End the phrase after 700 ms of silence instead of waiting out a fixed window
+        self.recognizer.pause_threshold = 0.7
+        self.recognizer.non_speaking_duration = 0.3
         
         # Try to initialize microphone, handle PyAudio errors gracefully
         try:
             self.microphone = sr.Microphone()
             self.use_microphone = True
-            # Adjust for ambient noise
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source)
+            # Adjust for ambient noise, unless a recent calibration is on disk
+            if not self._load_calibration():
+                with self.microphone as source:
+                    self.recognizer.adjust_for_ambient_noise(source)
+                self._save_calibration()
             print("✅ Microphone initialized successfully")
         except Exception as e:
             self.use_microphone = False
             print(f"⚠️  Microphone initialization failed: {str(e)}")
             print("💡 Will use text input as fallback")
         
+        # Streaming STT returns interim results while the user is still talking
+        self.speech_client = None
+        if GOOGLE_SPEECH_AVAILABLE and self.use_microphone:
+            try:
+                self.speech_client = speech.SpeechClient()
+                print("✅ Streaming speech recognition enabled")
+            except Exception as e:
+                print(f"⚠️ Streaming STT unavailable, using Google Web Speech: {str(e)}")
+        
         # Initialize ElevenLabs (your API)
+        _load_env()
+        self.voice_id = os.getenv('ELEVENLABS_VOICE_ID') or DEFAULT_VOICE_ID
+        self._voice_ids = {}  # voice name -> resolved ID
         try:
             elevenlabs_api_key = os.getenv('ELEVENLABS_API_KEY')
             if elevenlabs_api_key:
                 self.elevenlabs_client = ElevenLabs(api_key=elevenlabs_api_key)
                 
-                # Initialize pygame mixer for audio playback with higher volume
-                pygame.mixer.init()
+                # Initialize pygame mixer once; re-initializing per clip causes pops and stalls
+                self._ensure_mixer()
                 pygame.mixer.music.set_volume(1.0)  # Set maximum volume
                 self.volume = 0.8  # Default volume (0.0 to 1.0)
                 self.audio_enabled = True
@@ -83,8 +225,63 @@ class VoiceAgent:
             self.is_speaking = False
             self.volume = 1.0 # Default volume even without TTS
         
+        # Resolve the playback backend once rather than on every clip
+        self._play_impl = self._select_play_backend() if self.audio_enabled else None
+        
         print("✅ VoiceAgent initialized with Google STT (FREE) + ElevenLabs TTS")
     
+    @property
+    def is_speaking(self) -> bool:
+        """True while a response is being synthesized or played"""
+        return not self.speaking_done.is_set()
+    
+    @is_speaking.setter
+    def is_speaking(self, value: bool):
+        if value:
+            self.speaking_done.clear()
+        else:
+            self.speaking_done.set()
+    
+    def _load_calibration(self) -> bool:
+        """Apply a cached energy threshold if it is less than an hour old"""
+        try:
+            with open(CALIBRATION_FILE) as f:
+                data = json.load(f)
+            if time.time() - data["ts"] > CALIBRATION_MAX_AGE:
+                return False
+            self.recognizer.energy_threshold = data["energy_threshold"]
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+    
+    def _save_calibration(self):
+        """Persist the measured energy threshold for the next startup"""
+        try:
+            with open(CALIBRATION_FILE, 'w') as f:
+                json.dump({"energy_threshold": self.recognizer.energy_threshold, "ts": time.time()}, f)
+        except OSError as e:
+            print(f"⚠️ Could not save microphone calibration: {e}")
+    
+    @staticmethod
+    def _ensure_mixer():
+        """Initialize the pygame mixer if it is not running yet"""
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=4096)
+            pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+    
+    @staticmethod
+    def _wait_for_music_end():
+        """Block until mixer.music finishes playing"""
+        # The event queue needs the video subsystem and must be pumped from the main thread
+        if pygame.display.get_init() and threading.current_thread() is threading.main_thread():
+            while pygame.mixer.music.get_busy():
+                event = pygame.event.wait(timeout=100)
+                if event.type == MUSIC_END_EVENT:
+                    break
+        else:
+            while pygame.mixer.music.get_busy():
+                time.sleep(0.02)
+    
     def listen_and_transcribe(self, use_silence_detection: bool = True) -> str:
         """
         Complete workflow: Record audio and transcribe to text using FREE Google STT.
@@ -100,13 +297,18 @@ class VoiceAgent:
             # Debug: Voice agent action
             
             if self.use_microphone:
+                if self.speech_client is not None:
+                    text = self._transcribe_streaming()
+                    if text is not None:
+                        return text
+                
                 # Use microphone if available
                 with self.microphone as source:
                     print("🎤 Listening... (speak now)")
                     # Debug: Voice agent action
                     
-                    # Listen for audio with timeout
-                    audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=5)
+                    # Silence ends the phrase; the limit only guards against runaway capture
+                    audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=MAX_PHRASE_SECONDS)
                 
                 # Transcribe using Google STT (FREE)
                 # Debug: Voice agent action
@@ -140,10 +342,396 @@ class VoiceAgent:
             text = input("Type your command: ").strip()
             return text if text else "An error occurred while processing your input."
     
-    def speak_response(self, text: str, voice_id: str = None):
+    def _transcribe_streaming(self, timeout: float = 15) -> Optional[str]:
+        """
+        Stream microphone audio to Google Cloud Speech and return the first final transcript.
+        
+        Args:
+            timeout: Maximum seconds of audio to send
+            
+        Returns:
+            Transcript, or None if the streaming service failed (caller falls back)
+        """
+        audio_chunks = queue.Queue()
+        stop = threading.Event()
+        
+        with self.microphone as source:
+            print("🎤 Listening... (speak now)")
+            sample_rate = source.SAMPLE_RATE
+            chunk_frames = max(source.CHUNK, sample_rate // 10)  # ~100 ms per request
+            
+            def capture():
+                # Background reader so the gRPC request generator never blocks on the device
+                while not stop.is_set():
+                    try:
+                        audio_chunks.put(source.stream.read(chunk_frames))
+                    except Exception:
+                        break
+                audio_chunks.put(None)
+            
+            def audio_requests():
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    chunk = audio_chunks.get()
+                    if chunk is None:
+                        return
+                    yield speech.StreamingRecognizeRequest(audio_content=chunk)
+            
+            streaming_config = speech.StreamingRecognitionConfig(
+                config=speech.RecognitionConfig(
+                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=sample_rate,
+                    language_code="en-US"
+                ),
+                interim_results=True,
+                single_utterance=True  # Server ends the stream on silence
+            )
+            
+            capture_thread = threading.Thread(target=capture, daemon=True)
+            capture_thread.start()
+            try:
+                responses = self.speech_client.streaming_recognize(streaming_config, audio_requests())
+                for response in responses:
+                    for result in response.results:
+                        if result.is_final and result.alternatives:
+                            return result.alternatives[0].transcript.strip()
+            except Exception as e:
+                print(f"⚠️ Streaming STT failed, falling back: {str(e)}")
+                return None
+            finally:
+                stop.set()
+                capture_thread.join(timeout=1)
+        
+        raise sr.UnknownValueError()
+    
+    def _resolve_voice(self, voice: Optional[str]) -> str:
+        """
+        Map a voice name or ID to an ElevenLabs voice ID, looking names up only once.
+        The SDK otherwise lists every voice on each generate call given a name.
+        """
+        voice = voice or self.voice_id
+        if VOICE_ID_RE.match(voice):
+            return voice
+        
+        voice_id = self._voice_ids.get(voice)
+        if voice_id is None:
+            matches = [v.voice_id for v in self.elevenlabs_client.voices.get_all().voices if v.name == voice]
+            voice_id = matches[0] if matches else DEFAULT_VOICE_ID
+            self._voice_ids[voice] = voice_id
+        return voice_id
+    
+    def synthesize(self, text: str, voice_id: str = None) -> bytes:
+        """
+        Convert text to MP3 bytes, serving repeated phrases from the TTS cache.
+        
+        Args:
+            text: Text to synthesize
+            voice_id: ElevenLabs voice ID or name (defaults to the configured voice)
+            
+        Returns:
+            MP3 audio bytes
+        """
+        voice_id = self._resolve_voice(voice_id)
+        key = TTSCache.make_key(text, voice_id, self.tts_model)
+        
+        audio_data = self._cache.get(key)
+        if audio_data is not None:
+            return audio_data
+        
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._inflight[key] = Future()
+        
+        if not is_owner:
+            # Someone is already synthesizing this phrase - wait for their result
+            return pending.result()
+        
+        try:
+            audio_data = self._cache.get(key)
+            if audio_data is None:
+                audio_generator = self.elevenlabs_client.generate(
+                    text=text,
+                    voice=voice_id,
+                    model=self.tts_model,
+                    output_format=self.tts_output_format
+                )
+                audio_data = b"".join(audio_generator)
+                self._cache.put(key, audio_data)
+            pending.set_result(audio_data)
+            return audio_data
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _stream_synthesize(self, text: str, voice_id: str):
+        """Yield MP3 chunks from the ElevenLabs streaming endpoint as they arrive"""
+        return self.elevenlabs_client.text_to_speech.convert_as_stream(
+            voice_id=voice_id,
+            text=text,
+            model_id=self.tts_model,
+            output_format=self.tts_output_format
+        )
+    
+    def _play_sentences(self, sentences: Iterable[str], voice_id: str):
+        """
+        Pipeline synthesis with playback: a producer thread streams each
+        sentence from ElevenLabs while the caller plays the previous one.
+        
+        Returns:
+            (clips played in order, exception that stopped the producer or None)
+        """
+        clips = queue.Queue()
+        
+        def producer():
+            try:
+                for sentence in sentences:
+                    clips.put(b"".join(self._stream_synthesize(sentence, voice_id)))
+            except Exception as e:
+                clips.put(e)
+            finally:
+                clips.put(None)
+        
+        threading.Thread(target=producer, daemon=True).start()
+        
+        played = []
+        while True:
+            clip = clips.get()
+            if clip is None:
+                return played, None
+            if isinstance(clip, Exception):
+                return played, clip
+            self.play_audio(clip)
+            played.append(clip)
+    
+    def _speak_streaming(self, text: str, voice_id: str):
+        """
+        Speak text sentence by sentence as each one is synthesized.
+        The full clip is cached once every sentence has been received.
+        """
+        sentences = [part for part in SENTENCE_SPLIT_RE.split(text.strip()) if part]
+        played, error = self._play_sentences(sentences, voice_id)
+        
+        if error is not None:
+            if played:
+                raise error
+            # Nothing played yet - fall back to one-shot synthesis
+            print(f"⚠️ TTS streaming failed, using full synthesis: {error}")
+            self.play_audio(self.synthesize(text, voice_id))
+            return
+        
+        self._cache.put(TTSCache.make_key(text, voice_id, self.tts_model), b"".join(played))
+    
+    def speak_token_stream(self, tokens: Iterable[str], voice_id: str = None) -> str:
+        """
+        Speak text while it is still being generated (e.g. an LLM token stream):
+        each sentence is synthesized as soon as it is complete.
+        
+        Args:
+            tokens: Text fragments in order
+            voice_id: ElevenLabs voice ID or name
+            
+        Returns:
+            The full text that was received
+            
+        Raises:
+            Whatever the token source raised, if it failed before anything was spoken
+        """
+        received = []
+        
+        def sentences():
+            pending = ""
+            for token in tokens:
+                if not token:
+                    continue
+                received.append(token)
+                pending += token
+                *complete, pending = SENTENCE_SPLIT_RE.split(pending)
+                for sentence in complete:
+                    if sentence.strip():
+                        yield sentence.strip()
+            if pending.strip():
+                yield pending.strip()
+        
+        if not self.elevenlabs_client or not self.audio_enabled:
+            text = " ".join(sentences())
+            print(f"🔊 System: {text}")
+            return text
+        
+        try:
+            self.is_speaking = True
+            played, error = self._play_sentences(sentences(), self._resolve_voice(voice_id))
+        finally:
+            self.is_speaking = False
+        
+        if error is not None:
+            if not played:
+                raise error
+            print(f"⚠️ Streamed speech cut short: {error}")
+        return "".join(received).strip()
+    
+    def stream_text_to_speech(self, tokens: Iterable[str], voice_id: str = None) -> Iterator[bytes]:
+        """
+        Yield MP3 chunks for text that is still being generated, over the
+        ElevenLabs input-streaming WebSocket. The full clip is cached under
+        the complete text once the stream ends.
+        
+        Args:
+            tokens: Text fragments in order
+            voice_id: ElevenLabs voice ID or name
+            
+        Returns:
+            Iterator of MP3 byte chunks (empty if TTS is unavailable)
+        """
+        if not self.elevenlabs_client:
+            for _ in tokens:
+                pass
+            return
+        
+        voice_id = self._resolve_voice(voice_id)
+        received = []
+        
+        def text_chunks():
+            for token in tokens:
+                if token:
+                    received.append(token)
+                    yield token
+        
+        audio = []
+        for chunk in self.elevenlabs_client.text_to_speech.convert_realtime(
+            voice_id=voice_id,
+            text=text_chunks(),
+            model_id=self.tts_model,
+            output_format=self.tts_output_format
+        ):
+            if chunk:
+                audio.append(chunk)
+                yield chunk
+        
+        text = "".join(received).strip()
+        if text and audio:
+            self._cache.put(TTSCache.make_key(text, voice_id, self.tts_model), b"".join(audio))
+    
+    def speak_response_stream(self, text: str, voice_id: str = None) -> Iterator[bytes]:
+        """
+        Yield MP3 chunks for text as ElevenLabs produces them, without local playback.
+        Used to stream answers to the browser; the full clip is cached once complete.
+
+        Args:
+            text: Text to synthesize
+            voice_id: ElevenLabs voice ID or name
+
+        Returns:
+            Iterator of MP3 byte chunks (empty if TTS is unavailable)
+        """
+        if not text or not text.strip() or not self.elevenlabs_client:
+            return
+
+        voice_id = self._resolve_voice(voice_id)
+        key = TTSCache.make_key(text, voice_id, self.tts_model)
+
+        audio_data = self._cache.get(key)
+        if audio_data is not None:
+            yield audio_data
+            return
+
+        received = []
+        for chunk in self._stream_synthesize(text, voice_id):
+            if chunk:
+                received.append(chunk)
+                yield chunk
+
+        self._cache.put(key, b"".join(received))
+
+    def prefetch(self, text: str, voice_id: str = None) -> Optional[Future]:
+        """
+        Start synthesizing a phrase in the background.
+        
+        Args:
+            text: Phrase that will be spoken next
+            voice_id: ElevenLabs voice ID
+            
+        Returns:
+            Future resolving to MP3 bytes, or None if TTS is unavailable
+        """
+        if not text or not self.elevenlabs_client or not self.audio_enabled:
+            return None
+        return self._tts_executor.submit(self.synthesize, text, voice_id)
+    
+    def preload_phrases(self, texts: Iterable[str], voice_id: str = None):
+        """
+        Synthesize a batch of static phrases ahead of time so later
+        speak_response calls are served from the cache.
+        
+        Args:
+            texts: Phrases to synthesize (empty entries are skipped)
+            voice_id: ElevenLabs voice ID
+        """
+        if not self.elevenlabs_client or not self.audio_enabled:
+            return
+        
+        loaded = 0
+        for text in texts:
+            if not text:
+                continue
+            try:
+                self.synthesize(text, voice_id)
+                loaded += 1
+            except Exception as e:
+                print(f"⚠️ TTS preload failed for '{text[:30]}': {e}")
+        
+        print(f"✅ Preloaded {loaded} voice phrases")
+    
+    def load_sound(self, text: str, voice_id: str = None):
+        """
+        Synthesize a phrase and decode it into a pygame Sound for instant replay.
+        
+        Returns:
+            pygame.mixer.Sound, or None if TTS/playback is unavailable
+        """
+        if not text or not self.elevenlabs_client or not self.audio_enabled:
+            return None
+        try:
+            audio_data = self.synthesize(text, voice_id)
+            self._ensure_mixer()
+            return pygame.mixer.Sound(io.BytesIO(audio_data))
+        except Exception as e:
+            print(f"⚠️ Sound preload failed for '{text[:30]}': {e}")
+            return None
+    
+    def speak_preloaded(self, sound):
+        """Play an already decoded pygame Sound and wait for it to finish"""
+        try:
+            self.is_speaking = True
+            sound.set_volume(self.volume)
+            channel = sound.play()
+            while channel is not None and channel.get_busy():
+                time.sleep(0.05)
+        except Exception as e:
+            print(f"❌ Voice error: {e}")
+        finally:
+            self.is_speaking = False
+    
+    def speak_response(self, text: str, voice_id: str = None, audio_future: Optional[Future] = None):
         """
         Simple text-to-speech conversion and playback
+        
+        Args:
+            text: Text to speak
+            voice_id: ElevenLabs voice ID
+            audio_future: Result of an earlier prefetch() for this text
         """
+        # Nothing worth synthesizing - don't spend a TTS round trip on it
+        if not text or not text.strip():
+            return
+        if len(text.strip()) < 3:
+            print(f"🔊 {text}")
+            return
+        
         try:
             self.is_speaking = True  # Set speaking state
             print(f"🔊 Speaking: '{text[:30]}{'...' if len(text) > 30 else ''}'")
@@ -153,19 +741,28 @@ class VoiceAgent:
                 self.is_speaking = False
                 return
             
-            if not voice_id:
-                voice_id = "21m00Tcm4TlvDq8ikWAM"
+            voice_id = self._resolve_voice(voice_id)
             
-            # Generate speech
-            audio_generator = self.elevenlabs_client.generate(
-                text=text,
-                voice=voice_id,
-                model="eleven_monolingual_v1"
-            )
+            audio_data = None
+            if audio_future is not None:
+                try:
+                    audio_data = audio_future.result()
+                except Exception as e:
+                    print(f"⚠️ Prefetched audio failed, synthesizing now: {e}")
             
-            # Convert to bytes and play
-            audio_data = b"".join(audio_generator)
-            self.play_audio(audio_data)
+            # Cached phrases play immediately, everything else is streamed
+            if audio_data is None:
+                key = TTSCache.make_key(text, voice_id, self.tts_model)
+                audio_data = self._cache.get(key)
+                if audio_data is None:
+                    with self._inflight_lock:
+                        pending = self._inflight.get(key)
+                    if pending is not None:
+                        audio_data = pending.result()
+            if audio_data is not None:
+                self.play_audio(audio_data)
+            else:
+                self._speak_streaming(text, voice_id)
             
         except Exception as e:
             print(f"❌ Voice error: {e}")
@@ -173,76 +770,51 @@ class VoiceAgent:
         finally:
             self.is_speaking = False  # Clear speaking state
     
+    def _select_play_backend(self):
+        """Return the playback method to use: pygame if the mixer works, else pydub"""
+        try:
+            self._ensure_mixer()
+            return self.play_audio_pygame
+        except Exception as e:
+            print(f"⚠️ Pygame mixer unavailable: {e}")
+        
+        if PYDUB_AVAILABLE:
+            print("💡 Using pydub for audio playback")
+            return self._play_audio_pydub
+        
+        print("❌ No audio playback backend available")
+        return None
+    
     def play_audio(self, audio_data: bytes):
         """
         Simple audio playback - just play it completely
         """
-        # Try pygame first (most reliable)
-        try:
-            self.play_audio_pygame(audio_data)
+        if self._play_impl is None:
             return
+        try:
+            self._play_impl(audio_data)
         except Exception as e:
-            print(f"Pygame failed: {e}")
-        
-        # Try pydub as backup
-        if PYDUB_AVAILABLE:
-            try:
-                audio_segment = AudioSegment.from_mp3(io.BytesIO(audio_data))
-                play(audio_segment)
-                # Simple wait for completion
-                duration_seconds = len(audio_segment) / 1000.0
-                time.sleep(duration_seconds + 0.5)  # Wait full duration + buffer
-                print("✅ Pydub playback completed")
-                return
-            except Exception as e:
-                print(f"Pydub failed: {e}")
-        
-        print("❌ All audio methods failed")
+            print(f"❌ Audio playback failed: {e}")
     
-    def play_audio_windows(self, audio_data: bytes):
+    def _play_audio_pydub(self, audio_data: bytes):
         """
-        Play audio using Windows PowerShell.
+        Play audio via pydub, blocking only for the clip's actual length.
         
         Args:
-            audio_data: Audio bytes to play
+            audio_data: MP3 bytes to play
         """
-        import subprocess
-        import uuid
-        
-        # Create a unique temporary file
-        unique_id = str(uuid.uuid4())
-        temp_file_path = os.path.join(tempfile.gettempdir(), f"voice_{unique_id}.mp3")
-        
-        try:
-            # Write audio data to file
-            with open(temp_file_path, 'wb') as temp_file:
-                temp_file.write(audio_data)
-            
-            # Use PowerShell to play the audio
-            powershell_cmd = f'''
-            Add-Type -AssemblyName presentationCore
-            $mediaPlayer = New-Object system.windows.media.mediaplayer
-            $mediaPlayer.open("{temp_file_path}")
-            $mediaPlayer.Play()
-            Start-Sleep -Seconds 5
-            $mediaPlayer.Stop()
-            $mediaPlayer.Close()
-            '''
-            
-            result = subprocess.run([
-                'powershell', '-command', powershell_cmd
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode != 0:
-                raise Exception(f"PowerShell command failed: {result.stderr}")
-            
-        finally:
-            # Clean up the temporary file
-            try:
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-            except:
-                pass  # File might still be in use
+        audio_segment = AudioSegment.from_mp3(io.BytesIO(audio_data))
+        if SIMPLEAUDIO_AVAILABLE:
+            play_obj = sa.play_buffer(
+                audio_segment.raw_data,
+                num_channels=audio_segment.channels,
+                bytes_per_sample=audio_segment.sample_width,
+                sample_rate=audio_segment.frame_rate
+            )
+            play_obj.wait_done()
+        else:
+            play(audio_segment)  # Blocks until playback finishes
+        print("✅ Pydub playback completed")
     
     def play_audio_pygame(self, audio_data: bytes):
         """
@@ -251,47 +823,21 @@ class VoiceAgent:
         Args:
             audio_data: Audio bytes to play
         """
-        import uuid
+        self._ensure_mixer()
         
-        # Create a unique temporary file
-        unique_id = str(uuid.uuid4())
-        temp_file_path = os.path.join(tempfile.gettempdir(), f"pygame_{unique_id}.mp3")
+        # Load straight from memory - no temp file round-trip
+        buffer = io.BytesIO(audio_data)
+        pygame.mixer.music.load(buffer, "mp3")
+        pygame.mixer.music.set_volume(self.volume)
+        if pygame.display.get_init():
+            pygame.event.clear(MUSIC_END_EVENT)
+        pygame.mixer.music.play()
         
-        try:
-            # Write audio data to file
-            with open(temp_file_path, 'wb') as temp_file:
-                temp_file.write(audio_data)
-            
-            # Initialize pygame mixer properly
-            pygame.mixer.quit()  # Clean slate
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=1024)
-            
-            # Load and play the audio
-            pygame.mixer.music.load(temp_file_path)
-            pygame.mixer.music.set_volume(self.volume)
-            pygame.mixer.music.play()
-            
-            print(f"🔊 Playing audio... Volume: {self.volume}")
-            
-            # Simple blocking wait - let it complete naturally
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-            
-            print(f"✅ Audio completed")
-            
-            # Small pause for natural flow
-            time.sleep(0.2)
-            
-        finally:
-            # Clean up the temporary file
-            try:
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-                    print(f"🗑️ Cleaned up temp file: {temp_file_path}")
-            except Exception as cleanup_error:
-                print(f"⚠️ Cleanup warning: {cleanup_error}")
-            except:
-                pass  # File might still be in use
+        print(f"🔊 Playing audio... Volume: {self.volume}")
+        
+        self._wait_for_music_end()
+        
+        print(f"✅ Audio completed")
     
     def stop_audio(self):
         """Gentle audio stop if needed"""
@@ -305,3 +851,94 @@ class VoiceAgent:
     def get_voice_input(self):
         """Alias for listen_and_transcribe for backward compatibility"""
         return self.listen_and_transcribe()
+
+class AudioStreamTranscriber:
+    """
+    Incremental transcription of 16-bit mono PCM pushed chunk by chunk (e.g. from a browser).
+    With Google Cloud Speech the chunks are forwarded as they arrive and interim
+    text is reported through on_partial; otherwise the audio is buffered and
+    recognized with Google Web Speech on commit.
+    """
+    
+    def __init__(self, agent: VoiceAgent, sample_rate: int = 16000, on_partial=None):
+        self.agent = agent
+        self.sample_rate = sample_rate
+        self.on_partial = on_partial
+        self._buffer = bytearray()
+        self._chunks = queue.Queue()
+        self._finals = []
+        self._failed = False
+        self._thread = None
+        
+        if agent.speech_client is not None:
+            self._thread = threading.Thread(target=self._stream, daemon=True)
+            self._thread.start()
+    
+    def push(self, chunk: bytes):
+        """Add the next PCM chunk"""
+        self._buffer.extend(chunk)
+        if self._thread is not None:
+            self._chunks.put(bytes(chunk))
+    
+    def _stream(self):
+        """Feed queued chunks to streaming_recognize and collect results"""
+        def audio_requests():
+            while True:
+                chunk = self._chunks.get()
+                if chunk is None:
+                    return
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+        
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=self.sample_rate,
+                language_code="en-US"
+            ),
+            interim_results=True
+        )
+        
+        try:
+            responses = self.agent.speech_client.streaming_recognize(streaming_config, audio_requests())
+            for response in responses:
+                for result in response.results:
+                    if not result.alternatives:
+                        continue
+                    text = result.alternatives[0].transcript.strip()
+                    if result.is_final:
+                        self._finals.append(text)
+                        text = ""
+                    if self.on_partial:
+                        self.on_partial(" ".join(self._finals + [text]).strip())
+        except Exception as e:
+            print(f"⚠️ Streaming STT failed, will transcribe on commit: {str(e)}")
+            self._failed = True
+    
+    def commit(self, timeout: float = 10) -> str:
+        """
+        End the utterance and return the final transcript.
+        
+        Args:
+            timeout: Seconds to wait for the streaming service to finish
+            
+        Returns:
+            Transcript ("" if nothing was recognized)
+        """
+        if self._thread is not None:
+            self._chunks.put(None)
+            self._thread.join(timeout)
+            if not self._failed and self._finals:
+                return " ".join(self._finals)
+        
+        if not self._buffer:
+            return ""
+        audio = sr.AudioData(bytes(self._buffer), self.sample_rate, 2)
+        try:
+            return self.agent.recognizer.recognize_google(audio)
+        except sr.UnknownValueError:
+            return ""
+    
+    def close(self):
+        """Abandon the stream without transcribing"""
+        if self._thread is not None:
+            self._chunks.put(None)
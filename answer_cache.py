@@ -0,0 +1,168 @@
+"""
+Answer Cache - Reuses LLM answers for repeated or reworded questions
+Exact matches come from an LRU; paraphrases are matched by sentence-embedding
+similarity when sentence-transformers is installed
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+# Optional semantic tier
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY = 0.92
+
+class AnswerCache:
+    """
+    Two-tier cache of question -> answer.
+    Tier 1 is an exact LRU on the normalized question; tier 2 compares the
+    question's embedding against every cached one (inner product of unit vectors).
+    Set ANSWER_CACHE_SEMANTIC=0 to keep only the exact tier.
+    """
+
+    def __init__(self, max_entries: int = 512, similarity: float = DEFAULT_SIMILARITY,
+                 model_name: str = DEFAULT_EMBEDDING_MODEL):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.model_name = model_name
+        self.semantic = SEMANTIC_CACHE_AVAILABLE and os.getenv('ANSWER_CACHE_SEMANTIC', '1') != '0'
+        self._exact = OrderedDict()
+        self._lock = threading.Lock()
+        # Generations in progress by key, so concurrent identical questions share one LLM call
+        self._inflight = {}
+        self._model = None
+        # Guards only the one-time model load, so a slow load/download never blocks _lock
+        self._model_lock = threading.Lock()
+        # Ring buffer of embeddings and their answers
+        self._embeddings = None
+        self._answers = [None] * max_entries
+        self._next = 0
+        self._count = 0
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Cache key for a question"""
+        return question.lower().strip().rstrip('?').strip()
+
+    def lookup(self, question: str) -> Optional[str]:
+        """Cached answer for question (exact or similar), or None"""
+        answer, _ = self._lookup(self.normalize(question))
+        return answer
+
+    def store(self, question: str, answer: str):
+        """Cache an answer produced outside get_or_create (e.g. streamed)"""
+        key = self.normalize(question)
+        self._store(key, answer, self._embed(key))
+
+    def get_or_create(self, question: str, generate: Callable[[], str]) -> str:
+        """
+        Return a cached answer for question, or generate and cache one.
+
+        Args:
+            question: Question as asked
+            generate: Produces the answer on a miss (exceptions propagate, nothing is cached)
+
+        Returns:
+            Answer text
+        """
+        key = self.normalize(question)
+        answer, embedding = self._lookup(key)
+        if answer is not None:
+            return answer
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._inflight[key] = Future()
+
+        if not is_owner:
+            # Someone is already generating this answer - wait for their result
+            return pending.result()
+
+        try:
+            answer = generate()
+            self._store(key, answer, embedding)
+            pending.set_result(answer)
+            return answer
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _lookup(self, key: str):
+        """(answer or None, embedding computed for the semantic tier or None)"""
+        with self._lock:
+            answer = self._exact.get(key)
+            if answer is not None:
+                self._exact.move_to_end(key)
+                return answer, None
+
+        embedding = self._embed(key)
+        if embedding is not None:
+            answer = self._nearest(embedding)
+            if answer is not None:
+                self._remember(key, answer)
+                return answer, embedding
+        return None, embedding
+
+    def _store(self, key: str, answer: str, embedding):
+        self._remember(key, answer)
+        if embedding is not None:
+            self._add_embedding(embedding, answer)
+
+    def _embed(self, text: str):
+        """Unit-length embedding of text, or None without the semantic tier"""
+        if not self.semantic:
+            return None
+        try:
+            model = self._model
+            if model is None:
+                with self._model_lock:
+                    if self._model is None:
+                        self._model = SentenceTransformer(self.model_name)
+                    model = self._model
+            return model.encode(text, normalize_embeddings=True).astype(np.float32)
+        except Exception as e:
+            print(f"⚠️ Semantic answer cache disabled: {e}")
+            self.semantic = False
+            return None
+
+    def _nearest(self, embedding) -> Optional[str]:
+        """Answer of the most similar cached question above the threshold"""
+        with self._lock:
+            if not self._count:
+                return None
+            scores = self._embeddings[:self._count] @ embedding
+            best = int(scores.argmax())
+            if scores[best] >= self.similarity:
+                return self._answers[best]
+        return None
+
+    def _remember(self, key: str, answer: str):
+        with self._lock:
+            self._exact[key] = answer
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+    def _add_embedding(self, embedding, answer: str):
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+            # Overwrite the oldest slot once full
+            self._embeddings[self._next] = embedding
+            self._answers[self._next] = answer
+            self._next = (self._next + 1) % self.max_entries
+            self._count = min(self._count + 1, self.max_entries)
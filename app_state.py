@@ -0,0 +1,78 @@
+"""
+App State - Immutable snapshots of the web interface state
+Writers swap in a new snapshot under a short lock; readers never see a half-applied update
+"""
+
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional
+
+@dataclass(frozen=True)
+class SystemState:
+    """Agent initialization and command loop status"""
+    initialized: bool = False
+    listening: bool = False
+    last_command: str = ""
+    last_response: str = ""
+    error: Optional[str] = None
+
+@dataclass(frozen=True)
+class VoiceRecordingState:
+    """Push-to-talk recording on the Q&A page"""
+    is_recording: bool = False
+    transcription: str = ""
+    error: Optional[str] = None
+
+@dataclass(frozen=True)
+class DemoState:
+    """Interactive demo worker status"""
+    is_running: bool = False
+    qa_enabled: bool = False
+    demo_agent: Any = None
+
+@dataclass(frozen=True)
+class CustomDemoState:
+    """Dynamic demo executor and the product configuration last loaded into it"""
+    executor: Any = None
+    config: Any = None
+
+class AtomicRef:
+    """
+    Holds one immutable value. get() returns the current snapshot without
+    locking; swap() applies a function to it and publishes the result atomically.
+    """
+
+    def __init__(self, value):
+        self._value = value
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Current snapshot"""
+        return self._value
+
+    def swap(self, fn: Callable[[Any], Any]):
+        """
+        Replace the value with fn(value).
+
+        Returns:
+            The new value
+        """
+        with self._lock:
+            self._value = fn(self._value)
+            return self._value
+
+    def get_and_swap(self, fn: Callable[[Any], Any]):
+        """
+        Replace the value with fn(value).
+
+        Returns:
+            The value it replaced, so callers can tell whether their swap changed anything
+        """
+        with self._lock:
+            old = self._value
+            self._value = fn(old)
+            return old
+
+    def update(self, **changes):
+        """Swap in a copy of the current dataclass value with the given fields changed"""
+        return self.swap(lambda value: replace(value, **changes))
@@ -3,11 +3,34 @@ Demo Configuration System
 Allows product owners to configure custom demos for their websites/products
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
-import json
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+import glob
+import os
+import threading
+import uuid
 
-@dataclass
+# Faster JSON encode/decode when orjson is installed
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _dumps_compact = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+    
+    def _dumps_compact(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    _loads = json.loads
+
+@dataclass(slots=True)
 class DemoStep:
     """Single step in a demo"""
     name: str
@@ -17,8 +40,10 @@ class DemoStep:
     element_selector: Optional[str] = None
     wait_time: int = 3
     voice_script: Optional[str] = None
+    # Consecutive URL steps sharing a group are loaded together in background tabs
+    parallel_group: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProductConfig:
     """Complete product demo configuration"""
     product_name: str
@@ -28,13 +53,45 @@ class ProductConfig:
     login_credentials: Optional[Dict[str, str]] = None
     welcome_message: Optional[str] = None
     closing_message: Optional[str] = None
+    # False runs the browser headless without images (for unattended/recorded runs)
+    visual_mode: bool = True
+    # Registry key, assigned when the config is added to a DemoConfigManager
+    config_id: Optional[str] = field(default=None, compare=False)
+    # Per-field step views for bulk scans, rebuilt by index_steps()
+    _urls: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _voice_scripts: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _action_types: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.index_steps()
+    
+    def index_steps(self):
+        """Rebuild the parallel step tuples after demo_steps changes"""
+        steps = self.demo_steps
+        self._urls = tuple(step.url for step in steps)
+        self._voice_scripts = tuple(step.voice_script or "" for step in steps)
+        self._action_types = tuple(step.action_type for step in steps)
+
+# Where custom demo configurations are saved and reloaded from
+DEMO_CONFIG_DIR = 'demo_configs'
 
 class DemoConfigManager:
     """Manages demo configurations for different products"""
     
     def __init__(self):
+        # Writers copy, modify and republish the registry under _lock;
+        # readers just take the current dict, which is never mutated after publishing
         self.configs = {}
+        self._list_cache = {}
+        self._lock = threading.RLock()
+        # (format, config_id) -> (config, encoded bytes); an entry only answers
+        # for the exact config object it was built from
+        self._encoded = {}
+        # (config_id, step index) -> (step, decoded pygame Sound), filled in by
+        # preload_voice_scripts; kept off DemoStep so configs stay JSON-serializable
+        self._sounds = {}
         self._load_default_configs()
+        self.load_config_dir(DEMO_CONFIG_DIR)
     
     def _load_default_configs(self):
         """Load default demo configurations"""
@@ -108,24 +165,78 @@ class DemoConfigManager:
             closing_message="Thank you for exploring GIKI Transport! We're revolutionizing campus transportation with seamless booking and user-friendly design."
         )
         
-        self.configs["giki_transport"] = giki_config
+        giki_config.config_id = "giki_transport"
+        self.add_custom_config(giki_config)
     
     def add_custom_config(self, config: ProductConfig) -> str:
-        """Add a new product configuration"""
-        config_id = config.product_name.lower().replace(" ", "_")
-        self.configs[config_id] = config
-        return config_id
+        """Add a new product configuration (keeps an existing config_id, else assigns a UUID)"""
+        with self._lock:
+            config_id = config.config_id = config.config_id or uuid.uuid4().hex
+            configs = dict(self.configs)
+            configs[config_id] = config
+            self._publish(configs)
+            return config_id
+    
+    def _publish(self, configs: Dict[str, ProductConfig]):
+        """Swap in a new registry snapshot and reset everything derived from the old one"""
+        self.configs = configs
+        self._list_cache = {
+            config_id: config.product_name
+            for config_id, config in configs.items()
+        }
+        # Only frees memory - stale entries are already rejected by the identity check
+        self._encoded = {}
+    
+    def load_config_dir(self, config_dir: str) -> int:
+        """Register every saved configuration in config_dir, skipping invalid files"""
+        loaded = 0
+        for filename in sorted(glob.glob(os.path.join(config_dir, '*.json'))):
+            try:
+                self.add_custom_config(self.load_config_from_file(filename))
+                loaded += 1
+            except Exception as e:
+                print(f"⚠️ Skipping demo config {filename}: {e}")
+        return loaded
+    
+    def voice_scripts(self) -> List[str]:
+        """Collect every static phrase spoken by the configured demos"""
+        texts = []
+        for config in self.configs.values():
+            texts.append(config.welcome_message)
+            texts.extend(config._voice_scripts)
+            texts.append(config.closing_message)
+        return [text for text in texts if text]
+    
+    def preload_voice_scripts(self, voice_agent):
+        """Synthesize all demo voice scripts once so demo runs hit the TTS cache"""
+        if voice_agent and hasattr(voice_agent, 'preload_phrases'):
+            voice_agent.preload_phrases(self.voice_scripts())
+        
+        # Decode step narration once so playback is a single channel.play()
+        if voice_agent and hasattr(voice_agent, 'load_sound'):
+            for config_id, config in self.configs.items():
+                for i, step in enumerate(config.demo_steps):
+                    if step.voice_script and self.preloaded_sound(config_id, i, step) is None:
+                        sound = voice_agent.load_sound(step.voice_script)
+                        if sound is not None:
+                            self._sounds[(config_id, i)] = (step, sound)
+    
+    def preloaded_sound(self, config_id: Optional[str], index: int, step: DemoStep):
+        """Decoded narration for a step, or None if it was not preloaded (or the step was replaced)"""
+        cached = self._sounds.get((config_id, index))
+        if cached is not None and cached[0] is step:
+            return cached[1]
+        return None
     
     def get_config(self, config_id: str) -> Optional[ProductConfig]:
         """Get configuration by ID"""
+        # One dict lookup on the published snapshot - already as cheap as an LRU hit,
+        # and always current after add_custom_config
         return self.configs.get(config_id)
     
     def list_configs(self) -> Dict[str, str]:
         """List all available configurations"""
-        return {
-            config_id: config.product_name 
-            for config_id, config in self.configs.items()
-        }
+        return self._list_cache
     
     def create_config_from_input(self, product_data: Dict) -> ProductConfig:
         """Create configuration from user input"""
@@ -138,7 +249,8 @@ class DemoConfigManager:
                 action_type=step_data.get('action_type', 'navigate'),
                 element_selector=step_data.get('element_selector'),
                 wait_time=step_data.get('wait_time', 3),
-                voice_script=step_data.get('voice_script', f"Here's {step_data['name']} - {step_data['description']}")
+                voice_script=step_data.get('voice_script', f"Here's {step_data['name']} - {step_data['description']}"),
+                parallel_group=step_data.get('parallel_group')
             )
             steps.append(step)
         
@@ -149,18 +261,22 @@ class DemoConfigManager:
             demo_steps=steps,
             login_credentials=product_data.get('login_credentials'),
             welcome_message=product_data.get('welcome_message'),
-            closing_message=product_data.get('closing_message')
+            closing_message=product_data.get('closing_message'),
+            visual_mode=product_data.get('visual_mode', True)
         )
     
-    def save_config_to_file(self, config: ProductConfig, filename: str):
-        """Save configuration to JSON file"""
-        config_dict = {
+    @staticmethod
+    def _config_to_dict(config: ProductConfig) -> Dict:
+        """Convert a configuration to a JSON-ready dictionary"""
+        return {
+            'config_id': config.config_id,
             'product_name': config.product_name,
             'base_url': config.base_url,
             'description': config.description,
             'login_credentials': config.login_credentials,
             'welcome_message': config.welcome_message,
             'closing_message': config.closing_message,
+            'visual_mode': config.visual_mode,
             'demo_steps': [
                 {
                     'name': step.name,
@@ -169,20 +285,74 @@ class DemoConfigManager:
                     'action_type': step.action_type,
                     'element_selector': step.element_selector,
                     'wait_time': step.wait_time,
-                    'voice_script': step.voice_script
+                    'voice_script': step.voice_script,
+                    'parallel_group': step.parallel_group
                 }
                 for step in config.demo_steps
             ]
         }
+    
+    def _encode(self, config: ProductConfig, fmt: str, encode) -> bytes:
+        """encode(config) cached per config object, so a body built from an old snapshot never serves a new one"""
+        key = (fmt, config.config_id)
+        cached = self._encoded.get(key)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        payload = encode(config)
+        self._encoded[key] = (config, payload)
+        return payload
+    
+    def _config_json(self, config: ProductConfig) -> bytes:
+        """Serialized (file) form of a registered configuration"""
+        return self._encode(config, 'file', lambda c: _dumps(self._config_to_dict(c)))
+    
+    def config_response_json(self, config_id: str) -> Optional[bytes]:
+        """Compact API response body for a configuration, or None if unknown"""
+        config = self.configs.get(config_id)
+        if config is None:
+            # Misses are not cached, so a config added later is found straight away
+            return None
+        return self._encode(config, 'response',
+                            lambda c: _dumps_compact({'success': True, 'config': self._config_to_dict(c)}))
+    
+    def save_config_to_file(self, config: ProductConfig, filename: str):
+        """Save configuration to JSON file"""
+        if config.config_id and self.configs.get(config.config_id) is config:
+            payload = self._config_json(config)
+        else:
+            payload = _dumps(self._config_to_dict(config))
         
-        with open(filename, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        # Write beside the target and rename so readers never see a partial file
+        with self._lock:
+            tmp_filename = f"{filename}.tmp"
+            with open(tmp_filename, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_filename, filename)
     
     def load_config_from_file(self, filename: str) -> ProductConfig:
         """Load configuration from JSON file"""
-        with open(filename, 'r') as f:
-            data = json.load(f)
-        return self.create_config_from_input(data)
+        with open(filename, 'rb') as f:
+            data = _loads(f.read())
+        # Saved files use the same layout as _config_to_dict
+        if 'steps' not in data:
+            data['steps'] = data.get('demo_steps', [])
+        config = self.create_config_from_input(data)
+        config.config_id = data.get('config_id') or os.path.splitext(os.path.basename(filename))[0]
+        return config
+
+# Global demo config manager (created on first use)
+_singleton = None
+
+def get_demo_config_manager() -> DemoConfigManager:
+    """Return the shared demo config manager, building it on first access"""
+    global _singleton
+    if _singleton is None:
+        _singleton = DemoConfigManager()
+    return _singleton
 
-# Global demo config manager
-demo_config_manager = DemoConfigManager()
+def __getattr__(name):
+    # Keeps `from demo_config import demo_config_manager` working without
+    # building the default configs when only the dataclasses are imported
+    if name == "demo_config_manager":
+        return get_demo_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,278 @@
 Dynamic Demo Executor - Handles demo execution for any configured product
 """
 
+import os
+import json
 import time
+import queue
 import threading
-from typing import Dict, Any, Optional, List
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from demo_config import ProductConfig, DemoStep
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+# selenium.webdriver is imported lazily: importing any of its submodules loads every browser backend
+from selenium.common.exceptions import TimeoutException
+from demo_config import ProductConfig, DemoStep, get_demo_config_manager
+from keyword_matcher import KeywordClassifier
+
+# Explicit wait timeouts (seconds) - steps continue as soon as the condition holds
+PAGE_LOAD_TIMEOUT = 15
+NAVIGATION_START_TIMEOUT = 3
+LOGIN_TIMEOUT = 10
+CLICK_SETTLE_TIMEOUT = 2
+NARRATION_TIMEOUT = 30
+CLICKABLE_TIMEOUT = 10
+
+# Resolves as soon as the selector matches a visible, enabled element, using a
+# MutationObserver in the page instead of polling over the driver connection.
+# Returns the element, or null after the timeout (ms).
+WAIT_CLICKABLE_JS = """
+const [sel, timeoutMs, done] = arguments;
+const ready = () => {
+    const e = document.querySelector(sel);
+    return e && e.getClientRects().length && !e.disabled ? e : null;
+};
+let e = ready();
+if (e) { done(e); return; }
+const observer = new MutationObserver(() => {
+    e = ready();
+    if (e) { observer.disconnect(); clearTimeout(timer); done(e); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+observer.observe(document, {subtree: true, childList: true, attributes: true});
+"""
+
+# Outcome of one demo step, converted to dicts only for the API response
+StepResult = namedtuple("StepResult", "name success message")
+
+# Keyword buckets for demo questions, in priority order, matched against whole words
+WHAT_WORDS = frozenset({'what', 'about', 'tell me'})
+HOW_WORDS = frozenset({'how', 'work', 'works', 'use', 'using'})
+FEATURE_WORDS = frozenset({'feature', 'features', 'functionality'})
+QUESTION_CLASSIFIER = KeywordClassifier((
+    ('what', WHAT_WORDS),
+    ('how', HOW_WORDS),
+    ('features', FEATURE_WORDS)
+))
+
+# Step types that only load a URL and can be opened ahead of time in another tab
+PREFETCHABLE_ACTIONS = frozenset(("navigate", "showcase"))
+
+# Common login form selectors, combined so each field is a single DOM query
+EMAIL_SELECTORS = (
+    'input[type="email"]',
+    'input[name="email"]',
+    'input[name="username"]',
+    '#email',
+    '#username',
+    '.email-input'
+)
+PASSWORD_SELECTORS = (
+    'input[type="password"]',
+    'input[name="password"]',
+    '#password',
+    '.password-input'
+)
+SUBMIT_SELECTORS = (
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button.login-btn',
+    'button.submit-btn',
+    '.login-button'
+)
+LOGIN_SELECTORS = {
+    'email': EMAIL_SELECTORS,
+    'password': PASSWORD_SELECTORS,
+    'submit': SUBMIT_SELECTORS
+}
+COMBINED_LOGIN_SELECTORS = {field: ",".join(selectors) for field, selectors in LOGIN_SELECTORS.items()}
+
+# Locates all login elements, fills the credentials and clicks submit in a
+# single CDP Runtime.evaluate call. Values go through the native setter and
+# fire input/change so React/Vue-controlled inputs pick them up. Returns the
+# matched selectors and the URL before submitting.
+LOGIN_FILL_JS = """
+(function (combined, groups, cached, creds) {
+    const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    const pick = sel => {
+        for (const e of document.querySelectorAll(sel)) { if (visible(e)) return e; }
+        return null;
+    };
+    const found = {}, matched = {};
+    for (const field of Object.keys(combined)) {
+        let e = cached[field] ? pick(cached[field]) : null;
+        if (!e) e = pick(combined[field]);
+        found[field] = e;
+        matched[field] = e ? (groups[field].find(s => e.matches(s)) || null) : null;
+    }
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const field of ['email', 'password']) {
+        const e = found[field];
+        if (!e) continue;
+        e.focus();
+        if (e instanceof HTMLInputElement) setter.call(e, creds[field] || ''); else e.value = creds[field] || '';
+        e.dispatchEvent(new Event('input', {bubbles: true}));
+        e.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    const url = location.href;
+    if (found.submit) found.submit.click();
+    return {submitted: !!found.submit, matched: matched, url: url};
+})
+"""
+
+# Attach demos to one long-lived Chrome instead of launching a browser per demo
+BROWSER_SHARED = os.getenv('BROWSER_SHARED', 'false').lower() == 'true'
+BROWSER_DEBUG_PORT = int(os.getenv('BROWSER_DEBUG_PORT', '9222'))
+# "eager" returns from driver.get at DOMContentLoaded instead of waiting for every image/font
+PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'eager')
+
+# Number of pre-launched browsers kept warm for new demos (0 disables the pool)
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '0'))
+
+def _build_chrome_options(headless: bool = False):
+    """Chrome options shared by standalone and pooled browsers"""
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+    if headless:
+        # Nobody is watching - skip image decoding and GPU compositing
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    return chrome_options
+
+class BrowserPool:
+    """Owns a single Chrome with remote debugging enabled that executors attach to"""
+    
+    def __init__(self, port: int = BROWSER_DEBUG_PORT):
+        self.port = port
+        self.driver = None
+        self.headless = None  # Mode the running browser was launched in
+        self._lock = threading.Lock()
+    
+    @property
+    def debugger_address(self) -> str:
+        return f"127.0.0.1:{self.port}"
+    
+    def ensure_started(self, headless: bool = False) -> bool:
+        """Launch the shared browser if it is not running yet (False if it runs in the other mode)"""
+        with self._lock:
+            if self.driver is not None:
+                if self.headless != headless:
+                    print(f"⚠️ Shared browser is {'headless' if self.headless else 'visible'}; "
+                          f"this demo needs {'headless' if headless else 'visible'} - using its own browser")
+                    return False
+                return True
+            try:
+                from selenium import webdriver
+                
+                chrome_options = _build_chrome_options(headless)
+                chrome_options.add_argument(f"--remote-debugging-port={self.port}")
+                self.driver = webdriver.Chrome(options=chrome_options)
+                self.driver.maximize_window()
+                self.headless = headless
+                print(f"✅ Shared demo browser started on {self.debugger_address}")
+                return True
+            except Exception as e:
+                print(f"❌ Shared browser launch failed: {e}")
+                return False
+    
+    def attach(self):
+        """Return a new WebDriver session connected to the shared browser"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
+        chrome_options = Options()
+        chrome_options.add_experimental_option("debuggerAddress", self.debugger_address)
+        return webdriver.Chrome(options=chrome_options)
+    
+    def shutdown(self):
+        """Close the shared browser"""
+        with self._lock:
+            if self.driver:
+                self.driver.quit()
+                self.driver = None
+
+# Global shared browser (only launched when BROWSER_SHARED is enabled)
+browser_pool = BrowserPool()
+
+class DriverPool:
+    """Pre-launched Chrome drivers handed out to demos and recycled on cleanup"""
+    
+    def __init__(self, size: int = DRIVER_POOL_SIZE, headless: bool = False):
+        self.size = size
+        self.headless = headless
+        self._q = queue.Queue()
+    
+    def _make(self):
+        from selenium import webdriver
+        
+        driver = webdriver.Chrome(options=_build_chrome_options(self.headless))
+        driver.maximize_window()
+        return driver
+    
+    def warm(self):
+        """Fill the pool up to its size (run at service startup)"""
+        while self._q.qsize() < self.size:
+            try:
+                self._q.put(self._make())
+            except Exception as e:
+                print(f"⚠️ Driver pool warm-up failed: {e}")
+                break
+        if self.size:
+            print(f"✅ Driver pool ready with {self._q.qsize()} browsers")
+    
+    @staticmethod
+    def _healthy(driver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _discard(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def acquire(self):
+        """Take a warm driver, launching a new one if the pool is empty"""
+        while True:
+            try:
+                driver = self._q.get_nowait()
+            except queue.Empty:
+                return self._make()
+            if self._healthy(driver):
+                return driver
+            self._discard(driver)
+    
+    def release(self, driver):
+        """Reset a driver's session state and return it to the pool"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.get("about:blank")
+        except Exception:
+            self._discard(driver)
+            return
+        
+        if self._q.qsize() < self.size:
+            self._q.put(driver)
+        else:
+            self._discard(driver)
+
+# Global warm driver pool (empty unless DRIVER_POOL_SIZE is set)
+driver_pool = DriverPool()
 
 class DynamicDemoExecutor:
     """Execute demos dynamically based on configuration"""
@@ -23,19 +285,52 @@ class DynamicDemoExecutor:
         self.demo_running = False
         self.question_queue = []
         self.current_step_index = 0
+        self._tab = None  # Window handle owned by this executor in the shared browser
+        self._pooled = False  # Driver came from driver_pool and goes back to it on cleanup
+        self._waits = {}  # timeout -> WebDriverWait for the current driver
+        self._last_url = None  # URL last loaded with _load_page, cleared when the page may have moved
+        self._step_plan = ()  # (step, handler, narration) per step, built in set_demo_config
+        self._answers = {}  # Canned answers per question bucket, built in set_demo_config
         
-    def initialize_browser(self, headless=False):
-        """Initialize Chrome browser"""
+        # action_type -> handler taking the step
+        self._dispatch = {
+            "navigate": self._navigate_step,
+            "login": self.handle_login,
+            "click": self._click_step,
+            "form_fill": self.fill_form,
+            "showcase": self.showcase_page
+        }
+        self._selector_cache = {}  # product_name -> {field: selector that matched}
+        # Single worker so narration overlaps the browser action but never overlaps itself
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="narration")
+        self._last_speech = None  # Most recently queued utterance
+        
+    def initialize_browser(self, headless=None):
+        """Initialize Chrome browser (headless defaults to the config's visual_mode)"""
+        if headless is None:
+            headless = bool(self.demo_config) and not self.demo_config.visual_mode
+        self._waits = {}
         try:
-            chrome_options = Options()
-            if headless:
-                chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
+            if BROWSER_SHARED and browser_pool.ensure_started(headless):
+                # Isolate this demo in its own tab of the shared browser
+                self.driver = browser_pool.attach()
+                self.driver.switch_to.new_window('tab')
+                self._tab = self.driver.current_window_handle
+                print("✅ Dynamic demo attached to shared browser")
+                return True
+            
+            if driver_pool.size:
+                if driver_pool.headless == headless:
+                    self.driver = driver_pool.acquire()
+                    self._pooled = True
+                    print("✅ Dynamic demo browser taken from pool")
+                    return True
+                print(f"⚠️ Driver pool is {'headless' if driver_pool.headless else 'visible'}; "
+                      f"launching a {'headless' if headless else 'visible'} browser for this demo")
+            
+            from selenium import webdriver
+            
+            chrome_options = _build_chrome_options(headless)
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.maximize_window()
             print("✅ Dynamic demo browser initialized")
@@ -49,10 +344,27 @@ class DynamicDemoExecutor:
         """Set the demo configuration"""
         self.demo_config = config
         self.current_step_index = 0
+        # Resolve each step's handler and narration once instead of per run
+        self._step_plan = tuple(
+            (step,
+             self._dispatch.get(step.action_type, self._navigate_step),
+             step.voice_script or f"Step {i+1}: {step.description}")
+            for i, step in enumerate(config.demo_steps)
+        )
+        
+        # Demo Q&A answers only depend on the config, so format them once
+        name = config.product_name
+        base_answer = f"That's a great question about {name}! "
+        self._answers = {
+            'what': base_answer + f"This demo showcases {name}, which is {config.description}. You're seeing how users can interact with our platform seamlessly!",
+            'how': base_answer + f"{name} works by providing an intuitive interface that makes complex tasks simple. As you can see in the demo, everything is designed for ease of use!",
+            'features': base_answer + f"{name} includes all the features you're seeing in this demo and much more. Each step shows different capabilities of our platform!",
+            'default': base_answer + f"{name} is designed to provide the best user experience. Would you like me to show you a specific feature?"
+        }
         print(f"📋 Demo configuration set: {config.product_name}")
     
-    def run_interactive_demo(self) -> Dict[str, Any]:
-        """Run interactive demo based on current configuration"""
+    def run_interactive_demo(self, stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """Run interactive demo based on current configuration (stops between steps once stop_event is set)"""
         if not self.demo_config:
             return {
                 'success': False,
@@ -73,27 +385,55 @@ class DynamicDemoExecutor:
             
             # Welcome message
             if self.demo_config.welcome_message and self.voice_agent:
-                self.voice_agent.speak_response(self.demo_config.welcome_message)
+                self._say(self.demo_config.welcome_message)
             
             # Execute demo steps
-            completed_steps = []
-            
-            for i, step in enumerate(self.demo_config.demo_steps):
+            plan = self._step_plan
+            completed_steps = [None] * len(plan)
+            pending_audio = self.voice_agent.prefetch(plan[0][2]) if self.voice_agent and plan else None
+            prepared_tabs = {}  # step index -> window handle already loading that step
+            # Narration decoded at startup by preload_voice_scripts
+            sounds = get_demo_config_manager()
+            config_id = self.demo_config.config_id
+
+            stopped = False
+            for i, (step, handler, narration) in enumerate(plan):
+                if stop_event is not None and stop_event.is_set():
+                    print(f"🛑 Demo stopped before step {i+1}")
+                    stopped = True
+                    break
                 self.current_step_index = i
                 print(f"📝 Step {i+1}: {step.name}")
                 
-                # Speak step narration
-                narration = step.voice_script or f"Step {i+1}: {step.description}"
+                # Entering a parallel group: start loading the rest of it in background tabs
+                group = step.parallel_group
+                if group and (i == 0 or plan[i-1][0].parallel_group != group):
+                    prepared_tabs.update(self._open_group_tabs(i))
+                
+                # Speak step narration in the background while the browser works
+                tts_future = None
                 if self.voice_agent:
-                    self.voice_agent.speak_response(narration)
+                    current_audio = pending_audio
+                    pending_audio = self.voice_agent.prefetch(plan[i+1][2]) if i + 1 < len(plan) else None
+                    sound = sounds.preloaded_sound(config_id, i, step)
+                    if sound is not None:
+                        tts_future = self._say(sound, preloaded=True)
+                    else:
+                        tts_future = self._say(narration, audio_future=current_audio)
                 
                 # Execute step action
-                step_result = self.execute_step(step)
-                completed_steps.append({
-                    'name': step.name,
-                    'success': step_result['success'],
-                    'message': step_result.get('message', '')
-                })
+                if i in prepared_tabs:
+                    step_result = self._show_prepared_tab(step, prepared_tabs.pop(i))
+                else:
+                    step_result = self.execute_step(step, handler)
+                completed_steps[i] = StepResult(step.name, step_result['success'], step_result.get('message', ''))
+                
+                # Let the narration finish before moving on
+                if tts_future is not None:
+                    try:
+                        tts_future.result(timeout=NARRATION_TIMEOUT)
+                    except Exception as e:
+                        print(f"⚠️ Narration did not finish: {e}")
                 
                 # Wait between steps
                 time.sleep(step.wait_time)
@@ -102,16 +442,19 @@ class DynamicDemoExecutor:
                 self.check_for_questions()
             
             # Closing message
-            if self.demo_config.closing_message and self.voice_agent:
-                self.voice_agent.speak_response(self.demo_config.closing_message)
+            if self.demo_config.closing_message and self.voice_agent and not stopped:
+                self._say(self.demo_config.closing_message)
+            self._wait_for_speech()
             
             self.demo_running = False
             
+            steps = [result._asdict() for result in completed_steps if result is not None]
             return {
                 'success': True,
-                'message': f'🎬 Interactive Demo Completed: {self.demo_config.product_name}',
-                'steps_completed': len(completed_steps),
-                'steps': completed_steps
+                'message': f'🎬 Interactive Demo {"Stopped" if stopped else "Completed"}: {self.demo_config.product_name}',
+                'stopped': stopped,
+                'steps_completed': len(steps),
+                'steps': steps
             }
             
         except Exception as e:
@@ -123,27 +466,40 @@ class DynamicDemoExecutor:
                 'message': error_msg
             }
     
-    def execute_step(self, step: DemoStep) -> Dict[str, Any]:
+    def _say(self, message, preloaded: bool = False, audio_future=None):
+        """
+        Queue an utterance on the narration worker and return immediately.
+        
+        Args:
+            message: Text to speak, or a preloaded Sound when preloaded=True
+            preloaded: Play message with speak_preloaded
+            audio_future: Prefetched audio for the text
+            
+        Returns:
+            Future that completes when the utterance has been spoken
+        """
+        if preloaded:
+            future = self._tts_pool.submit(self.voice_agent.speak_preloaded, message)
+        else:
+            future = self._tts_pool.submit(self.voice_agent.speak_response, message, audio_future=audio_future)
+        self._last_speech = future
+        return future
+    
+    def _wait_for_speech(self):
+        """Block until everything queued with _say has been spoken"""
+        if self._last_speech is not None:
+            try:
+                self._last_speech.result(timeout=NARRATION_TIMEOUT)
+            except Exception as e:
+                print(f"⚠️ Narration did not finish: {e}")
+    
+    def execute_step(self, step: DemoStep, handler=None) -> Dict[str, Any]:
         """Execute a single demo step"""
         try:
-            if step.action_type == "navigate":
-                return self.navigate_to_url(step.url)
-            
-            elif step.action_type == "login":
-                return self.handle_login(step)
-            
-            elif step.action_type == "click":
-                return self.click_element(step.element_selector)
-            
-            elif step.action_type == "form_fill":
-                return self.fill_form(step)
-            
-            elif step.action_type == "showcase":
-                return self.showcase_page(step)
-            
-            else:
-                # Default to navigation
-                return self.navigate_to_url(step.url)
+            if handler is None:
+                # Unknown action types default to navigation
+                handler = self._dispatch.get(step.action_type, self._navigate_step)
+            return handler(step)
                 
         except Exception as e:
             return {
@@ -151,20 +507,107 @@ class DynamicDemoExecutor:
                 'message': f"Step execution failed: {str(e)}"
             }
     
+    def _open_group_tabs(self, start: int) -> Dict[int, str]:
+        """
+        Open the URL steps that follow `start` in the same parallel group in
+        background tabs, so the browser loads them concurrently while earlier
+        steps are being shown. WebDriver stays on the current tab.
+        
+        Returns:
+            Mapping of step index to the window handle loading it
+        """
+        tabs = {}
+        group = self._step_plan[start][0].parallel_group
+        try:
+            for j in range(start + 1, len(self._step_plan)):
+                step = self._step_plan[j][0]
+                if step.parallel_group != group:
+                    break
+                if step.action_type not in PREFETCHABLE_ACTIONS or not step.url:
+                    continue
+                known = set(self.driver.window_handles)
+                self.driver.execute_script("window.open(arguments[0], '_blank');", step.url)
+                new_handles = [h for h in self.driver.window_handles if h not in known]
+                if new_handles:
+                    tabs[j] = new_handles[0]
+        except Exception as e:
+            print(f"⚠️ Could not open background tabs: {e}")
+        return tabs
+    
+    def _show_prepared_tab(self, step: DemoStep, handle: str) -> Dict[str, Any]:
+        """Bring a background tab to the front and close the one it replaces"""
+        try:
+            previous = self.driver.current_window_handle
+            self.driver.close()
+            self.driver.switch_to.window(handle)
+            if self._tab == previous:
+                self._tab = handle
+            self._last_url = step.url
+            self._wait_for_page_load()
+            
+            return {
+                'success': True,
+                'message': f'Successfully navigated to {step.url}',
+                **self._page_meta()
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Navigation failed: {str(e)}'
+            }
+    
+    def _page_meta(self) -> Dict[str, str]:
+        """Current URL and title in one round trip"""
+        return self.driver.execute_script("return {url: location.href, title: document.title};")
+    
+    def _navigate_step(self, step: DemoStep) -> Dict[str, Any]:
+        return self.navigate_to_url(step.url)
+    
+    def _click_step(self, step: DemoStep) -> Dict[str, Any]:
+        return self.click_element(step.element_selector)
+    
+    def _wait(self, timeout: float):
+        """WebDriverWait for the current driver, built once per timeout and reused"""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            from selenium.webdriver.support.ui import WebDriverWait
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
+    
+    def _wait_for_page_load(self, old_body=None):
+        """Wait for the previous document to be replaced and the new one to be parsed"""
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        if old_body is not None:
+            try:
+                self._wait(NAVIGATION_START_TIMEOUT).until(EC.staleness_of(old_body))
+            except TimeoutException:
+                pass  # Same-document navigation - nothing was replaced
+        
+        self._wait(PAGE_LOAD_TIMEOUT).until(
+            lambda d: d.execute_script("return document.readyState !== 'loading';")
+        )
+    
+    def _load_page(self, url: str):
+        """Open a URL and block until the page is ready (no-op if it is already showing)"""
+        if not url or url == self._last_url:
+            return
+        
+        old_body = self.driver.execute_script("return document.body;")
+        self.driver.get(url)
+        self._last_url = url
+        self._wait_for_page_load(old_body)
+    
     def navigate_to_url(self, url: str) -> Dict[str, Any]:
         """Navigate to a URL"""
         try:
-            self.driver.get(url)
-            time.sleep(2)  # Wait for page load
-            
-            title = self.driver.title
-            current_url = self.driver.current_url
+            self._load_page(url)
             
             return {
                 'success': True,
                 'message': f'Successfully navigated to {url}',
-                'url': current_url,
-                'title': title
+                **self._page_meta()
             }
             
         except Exception as e:
@@ -184,78 +627,46 @@ class DynamicDemoExecutor:
             
             # Navigate to login page first
             if step.url:
-                self.driver.get(step.url)
-                time.sleep(2)
-            
-            # Try common login form selectors
-            email_selectors = [
-                'input[type="email"]',
-                'input[name="email"]',
-                'input[name="username"]',
-                '#email',
-                '#username',
-                '.email-input'
-            ]
-            
-            password_selectors = [
-                'input[type="password"]',
-                'input[name="password"]',
-                '#password',
-                '.password-input'
-            ]
-            
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button.login-btn',
-                'button.submit-btn',
-                '.login-button'
-            ]
-            
-            # Fill email/username
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    email_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if email_field:
-                email_field.clear()
-                email_field.send_keys(self.demo_config.login_credentials.get('email', ''))
-            
-            # Fill password
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if password_field:
-                password_field.clear()
-                password_field.send_keys(self.demo_config.login_credentials.get('password', ''))
-            
-            # Submit form
-            submit_button = None
-            for selector in submit_selectors:
+                self._load_page(step.url)
+            
+            credentials = self.demo_config.login_credentials
+            cache = self._selector_cache.setdefault(self.demo_config.product_name, {})
+            
+            # Find, fill and submit in one round trip, preferring the selectors that worked last time
+            creds = {'email': credentials.get('email', ''), 'password': credentials.get('password', '')}
+            expression = "{}({}, {}, {}, {})".format(
+                LOGIN_FILL_JS,
+                json.dumps(COMBINED_LOGIN_SELECTORS),
+                json.dumps(LOGIN_SELECTORS),
+                json.dumps(cache),
+                json.dumps(creds)
+            )
+            response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "returnByValue": True
+            })
+            if 'exceptionDetails' in response:
+                raise RuntimeError(response['exceptionDetails'].get('text', 'login script failed'))
+            result = response['result']['value']
+            for field, selector in result['matched'].items():
+                if selector:
+                    cache[field] = selector
+            
+            if result['submitted']:
+                prev_url = result['url']
+                self._last_url = None
+                # Wait for the post-login redirect rather than a fixed delay
+                from selenium.webdriver.support import expected_conditions as EC
                 try:
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if submit_button:
-                submit_button.click()
-                time.sleep(3)  # Wait for login to complete
+                    self._wait(LOGIN_TIMEOUT).until(EC.url_changes(prev_url))
+                    self._wait_for_page_load()
+                except TimeoutException:
+                    print("⚠️ Login did not redirect - continuing on current page")
             
             return {
                 'success': True,
                 'message': f'Login attempt completed for {self.demo_config.product_name}',
-                'url': self.driver.current_url,
-                'title': self.driver.title
+                **self._page_meta()
             }
             
         except Exception as e:
@@ -273,11 +684,20 @@ class DynamicDemoExecutor:
                     'message': 'No element selector provided'
                 }
             
-            wait = WebDriverWait(self.driver, 10)
-            element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
+            self.driver.set_script_timeout(CLICKABLE_TIMEOUT + 1)
+            element = self.driver.execute_async_script(WAIT_CLICKABLE_JS, selector, CLICKABLE_TIMEOUT * 1000)
+            if element is None:
+                raise TimeoutException(selector)
             element.click()
+            self._last_url = None
             
-            time.sleep(2)  # Wait for action to complete
+            # If the click navigates, wait for the new page; otherwise move on quickly
+            from selenium.webdriver.support import expected_conditions as EC
+            try:
+                self._wait(CLICK_SETTLE_TIMEOUT).until(EC.staleness_of(element))
+                self._wait_for_page_load()
+            except TimeoutException:
+                pass
             
             return {
                 'success': True,
@@ -301,8 +721,7 @@ class DynamicDemoExecutor:
         try:
             # Navigate to the URL first
             if step.url:
-                self.driver.get(step.url)
-                time.sleep(2)
+                self._load_page(step.url)
             
             # This is a placeholder - in a real implementation,
             # you would define form field mappings in the step configuration
@@ -331,8 +750,7 @@ class DynamicDemoExecutor:
             return {
                 'success': True,
                 'message': f'Page showcase completed: {step.name}',
-                'url': self.driver.current_url,
-                'title': self.driver.title
+                **self._page_meta()
             }
             
         except Exception as e:
@@ -352,43 +770,42 @@ class DynamicDemoExecutor:
         try:
             print(f"🤔 Demo question: {question}")
             
-            # Generate contextual answer based on current demo config
-            if self.demo_config:
-                product_context = f"about {self.demo_config.product_name}"
-                base_answer = f"That's a great question {product_context}! "
-            else:
-                base_answer = "That's a great question! "
+            if not self._answers:
+                raise ValueError("no demo configuration loaded")
             
             # Simple question handling based on keywords
-            question_lower = question.lower()
-            
-            if any(word in question_lower for word in ['what', 'about', 'tell me']):
-                answer = base_answer + f"This demo showcases {self.demo_config.product_name}, which is {self.demo_config.description}. You're seeing how users can interact with our platform seamlessly!"
-            
-            elif any(word in question_lower for word in ['how', 'work', 'use']):
-                answer = base_answer + f"{self.demo_config.product_name} works by providing an intuitive interface that makes complex tasks simple. As you can see in the demo, everything is designed for ease of use!"
-            
-            elif any(word in question_lower for word in ['features', 'functionality']):
-                answer = base_answer + f"{self.demo_config.product_name} includes all the features you're seeing in this demo and much more. Each step shows different capabilities of our platform!"
-            
-            else:
-                answer = base_answer + f"{self.demo_config.product_name} is designed to provide the best user experience. Would you like me to show you a specific feature?"
+            answer = self._answers[QUESTION_CLASSIFIER.classify(question.lower(), 'default')]
             
             if self.voice_agent:
-                self.voice_agent.speak_response(answer)
+                self._say(answer)
             
             return answer
             
         except Exception as e:
             error_msg = f"I apologize, I encountered an issue: {str(e)}"
             if self.voice_agent:
-                self.voice_agent.speak_response(error_msg)
+                self._say(error_msg)
             return error_msg
     
     def cleanup(self):
         """Clean up browser resources"""
+        self._last_url = None
+        self._waits = {}
         try:
-            if self.driver:
+            if self.driver and self._tab:
+                # Shared browser: close only our tab and detach, leaving Chrome running
+                self.driver.switch_to.window(self._tab)
+                self.driver.close()
+                self.driver.service.stop()
+                self.driver = None
+                self._tab = None
+                print("🧹 Demo tab closed")
+            elif self.driver and self._pooled:
+                driver_pool.release(self.driver)
+                self.driver = None
+                self._pooled = False
+                print("🧹 Browser returned to pool")
+            elif self.driver:
                 self.driver.quit()
                 self.driver = None
                 print("🧹 Browser cleanup completed")
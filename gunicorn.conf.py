@@ -0,0 +1,36 @@
+"""
+Gunicorn settings for serving the web interface
+Run with: gunicorn web_interface:app
+"""
+
+import os
+import threading
+
+# Real threads (gthread) by default: microphone capture (PyAudio) and pygame playback
+# block in C, which under gevent would stall every greenlet in the worker.
+# GUNICORN_WORKER_CLASS=gevent is only suitable without server-side audio.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+
+# Picked up by web_interface at import so Socket.IO matches the worker type
+os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent' if worker_class == 'gevent' else 'threading')
+
+bind = os.getenv('BIND', '0.0.0.0:5001')
+
+# One process: the agents, browser, microphone and demo state all live in it,
+# and Socket.IO would need sticky sessions to span several.
+# Concurrency comes from greenlets (gevent) or threads (gthread) inside it.
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))  # gthread
+worker_connections = 1000  # gevent
+
+# Demo runs and voice capture hold a request for a long time
+timeout = 120
+
+# The UI polls status endpoints every few seconds; reuse its connections.
+# Gunicorn already sets TCP_NODELAY on its listeners, so small responses aren't held back by Nagle.
+keepalive = 5
+
+def post_worker_init(worker):
+    """Build the agents once per worker, in the background like `python web_interface.py`"""
+    from web_interface import initialize_agents
+    threading.Thread(target=initialize_agents, daemon=True).start()
@@ -0,0 +1,123 @@
+"""
+Keyword Matcher - Classifies free-text questions into keyword buckets
+Uses a single Aho-Corasick pass when pyahocorasick is installed
+"""
+
+import re
+from typing import Iterable, Optional, Sequence, Set, Tuple
+
+# Optional multi-pattern matcher
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Runs of letters - the same notion of a word boundary as str.isalpha() in _iter_matches
+_TOKEN_RE = re.compile(r"[^\W\d_]+")
+
+class KeywordClassifier:
+    """
+    Maps text to the first bucket (in priority order) that has a matching keyword.
+    Keywords match whole words (multi-word keywords as phrases) unless
+    whole_words is False, in which case any substring occurrence counts.
+    """
+
+    def __init__(self, buckets: Sequence[Tuple[str, Iterable[str]]], whole_words: bool = True):
+        self.buckets = tuple((label, frozenset(words)) for label, words in buckets)
+        self.whole_words = whole_words
+        # Single-word keywords per bucket: a set intersection with the question's
+        # tokens settles most matches before any substring scan (fallback path only)
+        self._single_words = tuple(
+            frozenset(word for word in words if _TOKEN_RE.fullmatch(word)) for _, words in self.buckets
+        )
+        # Everything else (phrases, keywords with digits or punctuation) as one
+        # letter-bounded alternation per bucket, for the whole_words fallback
+        self._bounded = tuple(
+            re.compile(r'(?<![^\W\d_])(?:' + '|'.join(re.escape(word) for word in sorted(rest, key=len, reverse=True)) + r')(?![^\W\d_])')
+            if rest else None
+            for rest in (words - singles for (_, words), singles in zip(self.buckets, self._single_words))
+        )
+        # One alternation per bucket so a substring test is a single C-level scan
+        # (longest keywords first; only used without pyahocorasick)
+        self._patterns = tuple(
+            re.compile('|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True)) or '(?!)')
+            for _, words in self.buckets
+        )
+        self._automaton = None
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for priority, (label, words) in enumerate(self.buckets):
+                for word in words:
+                    # Keep the highest-priority bucket if a word is listed twice
+                    if word not in automaton:
+                        automaton.add_word(word, (priority, label, len(word)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def classify(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Return the label of the highest-priority bucket matched by text.
+
+        Args:
+            text: Lower-cased text to classify
+            default: Label returned when nothing matches
+        """
+        if self._automaton is not None:
+            best = None
+            for priority, label in self._iter_matches(text):
+                if best is None or priority < best[0]:
+                    best = (priority, label)
+                    if priority == 0:
+                        break
+            return best[1] if best else default
+
+        if not self.whole_words:
+            tokens = frozenset(_TOKEN_RE.findall(text))
+            for (label, _), singles, pattern in zip(self.buckets, self._single_words, self._patterns):
+                if singles & tokens or pattern.search(text):
+                    return label
+            return default
+
+        tokens = frozenset(_TOKEN_RE.findall(text))
+        for (label, _), singles, bounded in zip(self.buckets, self._single_words, self._bounded):
+            if singles & tokens or (bounded is not None and bounded.search(text)):
+                return label
+        return default
+
+    def matches(self, text: str) -> Set[str]:
+        """
+        Return the labels of every bucket matched by text.
+
+        Args:
+            text: Lower-cased text to scan
+        """
+        if self._automaton is not None:
+            return {label for _, label in self._iter_matches(text)}
+
+        if not self.whole_words:
+            tokens = frozenset(_TOKEN_RE.findall(text))
+            return {
+                label for (label, _), singles, pattern in zip(self.buckets, self._single_words, self._patterns)
+                if singles & tokens or pattern.search(text)
+            }
+
+        tokens = frozenset(_TOKEN_RE.findall(text))
+        return {
+            label for (label, _), singles, bounded in zip(self.buckets, self._single_words, self._bounded)
+            if singles & tokens or (bounded is not None and bounded.search(text))
+        }
+
+    def _iter_matches(self, text: str):
+        """Yield (priority, label) for each automaton hit, honouring whole_words"""
+        last = len(text) - 1
+        for end, (priority, label, length) in self._automaton.iter(text):
+            if self.whole_words:
+                start = end - length + 1
+                # Reject matches inside longer words ("show" must not hit "how")
+                if start > 0 and text[start - 1].isalpha():
+                    continue
+                if end < last and text[end + 1].isalpha():
+                    continue
+            yield priority, label
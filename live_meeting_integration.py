@@ -3,28 +3,288 @@ Live Meeting Integration System
 Handles video conferencing, screen sharing, and live demo sessions
 """
 
+import os
+import re
+import sys
+import queue
+import logging
+import logging.handlers
 import time
+import functools
 import threading
 import subprocess
 import webbrowser
 import json
+import atexit
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Iterator
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import deque
+import secrets
+import importlib.util
+from types import MappingProxyType
+from keyword_matcher import KeywordClassifier
 
+# Screen sharing pulls in pyautogui/psutil, so only check they are installed
+# here and import the manager on first use
+SCREEN_SHARE_AVAILABLE = all(importlib.util.find_spec(mod) is not None for mod in ("pyautogui", "psutil"))
+if not SCREEN_SHARE_AVAILABLE:
+    print("⚠️ Screen sharing not available - install pyautogui and psutil for full functionality")
+
+_screen_share_manager = None
+
+def _get_screen_share():
+    """Import and return the shared ScreenShareManager, or None if unavailable"""
+    global _screen_share_manager, SCREEN_SHARE_AVAILABLE
+    if _screen_share_manager is None and SCREEN_SHARE_AVAILABLE:
+        try:
+            from screen_share_integration import get_screen_share_manager
+            _screen_share_manager = get_screen_share_manager()
+        except Exception as e:
+            SCREEN_SHARE_AVAILABLE = False
+            print(f"⚠️ Screen sharing not available: {e}")
+    return _screen_share_manager
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking or erroring when the queue is full"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+# Demo/Q&A messages go through a bounded queue and are written to stdout by one
+# listener thread, so worker threads never wait on the console
+_LOG_QUEUE = queue.Queue(maxsize=1024)
+_log = logging.getLogger("live_meeting")
+_log.setLevel(logging.INFO)
+_log.propagate = False
+_log.addHandler(_DroppingQueueHandler(_LOG_QUEUE))
+_console = logging.StreamHandler(sys.stdout)
+_console.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_LOG_QUEUE, _console)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Optional: open meetings in one reused Playwright Chromium context instead of the system browser
 try:
-    from screen_share_integration import screen_share_manager
-    SCREEN_SHARE_AVAILABLE = True
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
 except ImportError:
-    SCREEN_SHARE_AVAILABLE = False
-    print("⚠️ Screen sharing not available - install pyautogui and psutil for full functionality")
+    PLAYWRIGHT_AVAILABLE = False
+
+# "playwright" opts in to the reused context; anything else uses webbrowser.open
+MEETING_BROWSER = os.getenv('MEETING_BROWSER', 'system').lower()
+MEETING_PROFILE_DIR = os.getenv('MEETING_PROFILE_DIR', os.path.join(os.path.expanduser("~"), ".live_demo_meeting_profile"))
+# Auto-grant camera/mic and pick the entire screen when the meeting asks to share
+MEETING_BROWSER_ARGS = (
+    "--use-fake-ui-for-media-stream",
+    "--auto-select-desktop-capture-source=Entire screen",
+)
+
+class MeetingBrowser:
+    """
+    Persistent Chromium context shared by all meetings.
+    Playwright's sync API is bound to the thread that started it, so every call
+    runs on one dedicated worker thread.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="meeting-browser")
+        self._playwright = None
+        self._context = None
+        self.enabled = PLAYWRIGHT_AVAILABLE and MEETING_BROWSER == 'playwright'
+
+    def _ensure_context(self):
+        if self._context is None:
+            self._playwright = sync_playwright().start()
+            self._context = self._playwright.chromium.launch_persistent_context(
+                user_data_dir=MEETING_PROFILE_DIR,
+                headless=False,
+                args=list(MEETING_BROWSER_ARGS)
+            )
+            print("🌐 Meeting browser context started")
+        return self._context
+
+    def _open(self, url: str):
+        self._ensure_context().new_page().goto(url)
+
+    def open(self, url: str) -> bool:
+        """Open url in a new tab of the shared context; False if it is unavailable"""
+        if not self.enabled:
+            return False
+        try:
+            self._executor.submit(self._open, url).result(timeout=60)
+            return True
+        except Exception as e:
+            print(f"⚠️ Meeting browser unavailable, using system browser: {e}")
+            self.enabled = False
+            return False
+
+    def _close(self):
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def close(self):
+        """Close the shared context (registered with atexit)"""
+        if self._context is None and self._playwright is None:
+            return
+        try:
+            self._executor.submit(self._close).result(timeout=10)
+        except Exception:
+            pass
+
+meeting_browser = MeetingBrowser()
+atexit.register(meeting_browser.close)
+
+# Shared keep-alive session for provider REST calls (Calendar/Zoom APIs),
+# so each meeting creation reuses the pooled TCP/TLS connection
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=2))
+atexit.register(_HTTP.close)
+
+HTTP_TIMEOUT = 10  # seconds
+
+# Live Q&A categories in priority order; keywords match anywhere in the question
+_ANSWER_CLASSIFIER = KeywordClassifier((
+    ("sign_in", ("sign in", "login", "log in", "sign up", "register", "account")),
+    ("getting_started", ("how to use", "how do i", "getting started", "first time", "begin")),
+    ("pricing", ("price", "cost", "pricing", "expensive", "cheap", "fee", "payment")),
+    ("features", ("feature", "functionality", "capability", "what can", "does it", "can you")),
+    ("security", ("security", "safe", "secure", "privacy", "data protection", "encryption")),
+    ("integration", ("integration", "api", "connect", "third party", "integrate", "sync")),
+    ("support", ("support", "help", "assistance", "training", "onboarding")),
+    ("performance", ("fast", "speed", "performance", "slow", "latency", "response time")),
+    ("customization", ("customize", "custom", "personalize", "configure", "settings")),
+    ("comparison", ("competitor", "compare", "alternative", "versus", "better than", "different from")),
+    ("technical", ("technical", "requirements", "system", "server", "database", "infrastructure")),
+    ("scale", ("scale", "growth", "expand", "users", "volume", "enterprise")),
+    ("demo", ("demo", "showing", "screen", "example", "sample")),
+), whole_words=False)
+
+# Answer per category (plus the general fallback), formatted with the product name
+_ANSWER_TEMPLATES = {
+    "sign_in": "To sign in to {product_name}, simply click the 'Sign In' button on our homepage. You'll be taken to a secure login page where you can enter your credentials. If you don't have an account yet, click 'Register' to create one. The process is quick and straightforward - just provide your email, create a password, and you'll have immediate access to all platform features.",
+    "getting_started": "Getting started with {product_name} is simple! After signing in, you'll land on your personalized dashboard where you can see all available features. For first-time users, I recommend starting with the booking system to see how easy it is to manage your transport needs. Everything is designed to be intuitive - just click through the menu options and explore!",
+    "pricing": "Our pricing for {product_name} is very competitive and designed to provide excellent value. We offer flexible plans starting from basic packages for individual users up to enterprise solutions. Contact our sales team for detailed pricing that fits your specific needs and usage requirements.",
+    "features": "{product_name} offers a comprehensive set of features designed to streamline your workflow. As you can see in our demo, we provide intuitive user interfaces, powerful automation capabilities, and seamless integration options. The platform is built with scalability in mind and includes advanced analytics, real-time processing, and customizable workflows. Would you like me to demonstrate any specific feature you're interested in?",
+    "security": "Security is a top priority for {product_name}. We implement industry-standard security measures including end-to-end encryption, secure data transmission, regular security audits, and compliance with major regulations like GDPR and SOC 2. Your data is protected with multi-layered security protocols, and we provide detailed security documentation for enterprise customers. Our platform also includes role-based access controls and audit trails for complete transparency.",
+    "integration": "{product_name} is designed for seamless integration with your existing tools and systems. We provide RESTful APIs, webhooks, and pre-built integrations with popular platforms like Salesforce, HubSpot, Slack, and many others. Our integration platform allows you to connect virtually any system, and we also offer custom integration support for enterprise clients. The demo you're seeing can actually be integrated into your existing workflow quite easily.",
+    "support": "We provide comprehensive support for {product_name} users. This includes 24/7 technical support, detailed documentation, video tutorials, live training sessions, and dedicated customer success managers for enterprise accounts. We also have an active community forum and regular webinars. Our onboarding process is designed to get you up and running quickly, with personalized setup assistance and training tailored to your team's needs.",
+    "performance": "{product_name} is built for high performance with sub-second response times and 99.9% uptime SLA. Our platform uses cloud-native architecture with global CDN distribution, ensuring fast performance regardless of your location. We continuously monitor performance metrics and have built-in optimization features that adapt to your usage patterns. The system scales automatically to handle peak loads without any performance degradation.",
+    "customization": "Absolutely! {product_name} is highly customizable to fit your specific business needs. You can customize workflows, user interfaces, data fields, reporting dashboards, and notification settings. We also support custom branding, white-labeling options, and can develop custom features for enterprise clients. The platform includes a visual configuration interface, so you don't need technical expertise to make most customizations.",
+    "comparison": "Great question! {product_name} stands out from alternatives through our focus on user experience, comprehensive feature set, and exceptional customer support. Unlike many competitors, we provide unlimited customization options, transparent pricing, and dedicated account management. Our platform is also designed with future-proofing in mind, ensuring that your investment continues to provide value as your business grows. I'd be happy to show you specific features that differentiate us from other solutions.",
+    "technical": "{product_name} is built on modern, cloud-native infrastructure that requires minimal technical requirements from your end. It's a web-based solution that works on any modern browser, with mobile apps available for iOS and Android. We handle all the backend infrastructure, databases, and server management, so you don't need to worry about technical maintenance. For enterprise clients, we also offer on-premise deployment options with full technical support.",
+    "scale": "{product_name} is designed to scale with your business from startup to enterprise level. Our architecture automatically scales to handle increased users, data volume, and transaction loads. We support unlimited users on our enterprise plans and have customers processing millions of transactions daily. The platform grows with you, adding new features and capabilities as your needs evolve, without requiring migration or system changes.",
+    "demo": "In this live demo of {product_name}, I'm showing you our core features in action using real-world scenarios. What you're seeing represents the actual user experience - this isn't a mock-up or simulation. The interface you see is exactly what you and your team would use daily. I can demonstrate any specific workflow or feature you're curious about. Feel free to ask me to show you particular use cases that are relevant to your business needs.",
+    "fallback": "That's an excellent question about {product_name}! Based on what we're demonstrating here, our platform is designed to address exactly these kinds of business challenges. Let me give you a comprehensive answer: {product_name} provides robust solutions that are user-friendly, scalable, and designed with your success in mind. We've built this platform based on years of customer feedback and industry best practices. Would you like me to demonstrate a specific aspect that relates to your question, or would you prefer to see how this would work in your particular use case?"
+}
+
+# Session-summary topics and their keywords (substring match, every topic hit counts)
+_TOPIC_CLASSIFIER = KeywordClassifier((
+    ("Pricing", ("price", "cost", "pricing")),
+    ("Features", ("feature", "functionality", "capability")),
+    ("Security", ("security", "safe", "secure")),
+    ("Integration", ("integration", "api", "connect")),
+    ("Support", ("support", "help", "assistance")),
+), whole_words=False)
+
+def _short_id() -> str:
+    """8-hex-char id for meetings and sessions (one 4-byte urandom read)"""
+    return secrets.token_hex(4)
+
+_last_ts = (0, "")  # (epoch second, ISO string) of the last formatted timestamp
+
+def _format_ts(epoch: float) -> str:
+    """Epoch seconds as a local ISO string at one-second resolution (repeat seconds reuse the last string)"""
+    global _last_ts
+    second = int(epoch)
+    if second != _last_ts[0]:
+        _last_ts = (second, datetime.fromtimestamp(second).isoformat())
+    return _last_ts[1]
+
+def _now_iso() -> str:
+    """Local time as an ISO string at one-second resolution"""
+    return _format_ts(time.time())
+
+_NON_WORD_RE = re.compile(r'\W+')
+
+def _normalize_question(question: str) -> str:
+    """Lower-case and collapse punctuation/whitespace so repeats share a cache entry"""
+    return _NON_WORD_RE.sub(' ', question.lower()).strip()
+
+# Leading words that settle the category without a scan. Only keywords of the
+# highest-priority bucket qualify - a later word can never outrank them, whereas
+# e.g. "how much ... login" must still resolve to sign_in rather than pricing
+_FIRST_TOKEN = {
+    word: _ANSWER_CLASSIFIER.buckets[0][0]
+    for word in _ANSWER_CLASSIFIER.buckets[0][1] if ' ' not in word
+}
+
+@functools.lru_cache(maxsize=512)
+def _category_for(question_norm: str) -> Optional[str]:
+    """Answer category for a normalized question, or None if no category matches"""
+    category = _FIRST_TOKEN.get(question_norm.split(' ', 1)[0])
+    if category is None:
+        category = _ANSWER_CLASSIFIER.classify(question_norm)
+    return category
+
+def _render_answers(product_name: str) -> Dict[str, str]:
+    """Every answer template formatted for one product, keyed by category"""
+    ctx = {"product_name": product_name}
+    return {category: template.format_map(ctx) for category, template in _ANSWER_TEMPLATES.items()}
+
+# Step-by-step instructions returned with each provider's meeting info
+_GM_INSTRUCTIONS = (
+    "1. Click the meeting link to create a new Google Meet",
+    "2. Share the generated link with your customer",
+    "3. Wait for customer to join",
+    "4. Start screen sharing for the demo"
+)
+
+_ZOOM_INSTRUCTIONS = (
+    "1. Click the meeting link to start instant Zoom meeting",
+    "2. Copy the meeting ID and share with customer",
+    "3. Wait for customer to join",
+    "4. Start screen sharing for the demo"
+)
+
+_GENERIC_INSTRUCTIONS = (
+    "1. Choose your preferred video conferencing platform",
+    "2. Create a new meeting using the provided links",
+    "3. Share the meeting link with your customer",
+    "4. Start screen sharing when customer joins",
+    "5. Begin your interactive demo"
+)
+
+_NEXT_STEPS = (
+    "Share your screen in the video call",
+    "Start the interactive demo",
+    "Engage with customer questions in real-time"
+)
+
+# Popular meeting platforms offered by GenericMeetProvider (shared, treat as read-only)
+_MEETING_PLATFORMS = (
+    {"name": "Google Meet", "url": "https://meet.google.com/new"},
+    {"name": "Zoom", "url": "https://zoom.us/start/videomeeting"},
+    {"name": "Microsoft Teams", "url": "https://teams.microsoft.com/"},
+    {"name": "Webex", "url": "https://www.webex.com/start-meeting.html"},
+)
 
 class MeetingProvider:
     """Base class for meeting providers"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.http = _HTTP
         self.meeting_id = None
         self.meeting_url = None
         self.is_active = False
@@ -37,6 +297,11 @@ class MeetingProvider:
         """Join an existing meeting"""
         raise NotImplementedError
     
+    def _open_meeting(self, meeting_url: str):
+        """Open the meeting in the shared meeting browser, or the system browser as fallback"""
+        if not meeting_browser.open(meeting_url):
+            webbrowser.open(meeting_url)
+    
     def start_screen_share(self) -> bool:
         """Start screen sharing"""
         raise NotImplementedError
@@ -57,31 +322,31 @@ class MeetingProvider:
 class GoogleMeetProvider(MeetingProvider):
     """Google Meet integration"""
     
+    # Constant part of every create_meeting response
+    _TEMPLATE = MappingProxyType({
+        "success": True,
+        "provider": "Google Meet",
+        "instructions": _GM_INSTRUCTIONS
+    })
+    
     def create_meeting(self, title: str, description: str = "", duration_minutes: int = 60) -> Dict[str, Any]:
         """Create a Google Meet meeting"""
         try:
             # Generate a simple Google Meet URL (for MVP - in production, use Google Calendar API)
-            self.meeting_id = f"demo-{uuid.uuid4().hex[:8]}"
+            self.meeting_id = f"demo-{_short_id()}"
             
             # For now, we'll use the simple meet.google.com/new approach
             # In production, you'd integrate with Google Calendar API
             self.meeting_url = f"https://meet.google.com/new"
             
-            meeting_info = {
-                "success": True,
-                "meeting_id": self.meeting_id,
-                "meeting_url": self.meeting_url,
-                "title": title,
-                "description": description,
-                "duration_minutes": duration_minutes,
-                "provider": "Google Meet",
-                "instructions": [
-                    "1. Click the meeting link to create a new Google Meet",
-                    "2. Share the generated link with your customer",
-                    "3. Wait for customer to join",
-                    "4. Start screen sharing for the demo"
-                ]
-            }
+            meeting_info = dict(self._TEMPLATE)
+            meeting_info.update(
+                meeting_id=self.meeting_id,
+                meeting_url=self.meeting_url,
+                title=title,
+                description=description,
+                duration_minutes=duration_minutes
+            )
             
             print(f"✅ Google Meet session prepared: {title}")
             return meeting_info
@@ -95,7 +360,7 @@ class GoogleMeetProvider(MeetingProvider):
     def join_meeting(self, meeting_url: str) -> bool:
         """Join Google Meet meeting"""
         try:
-            webbrowser.open(meeting_url)
+            self._open_meeting(meeting_url)
             self.meeting_url = meeting_url
             self.is_active = True
             print(f"🎥 Opening Google Meet: {meeting_url}")
@@ -107,31 +372,31 @@ class GoogleMeetProvider(MeetingProvider):
 class ZoomProvider(MeetingProvider):
     """Zoom integration"""
     
+    # Constant part of every create_meeting response
+    _TEMPLATE = MappingProxyType({
+        "success": True,
+        "provider": "Zoom",
+        "instructions": _ZOOM_INSTRUCTIONS
+    })
+    
     def create_meeting(self, title: str, description: str = "", duration_minutes: int = 60) -> Dict[str, Any]:
         """Create a Zoom meeting"""
         try:
             # For MVP, use Zoom's instant meeting feature
             # In production, integrate with Zoom API
-            self.meeting_id = f"zoom-demo-{uuid.uuid4().hex[:8]}"
+            self.meeting_id = f"zoom-demo-{_short_id()}"
             
             # Zoom instant meeting URL
             self.meeting_url = "https://zoom.us/start/videomeeting"
             
-            meeting_info = {
-                "success": True,
-                "meeting_id": self.meeting_id,
-                "meeting_url": self.meeting_url,
-                "title": title,
-                "description": description,
-                "duration_minutes": duration_minutes,
-                "provider": "Zoom",
-                "instructions": [
-                    "1. Click the meeting link to start instant Zoom meeting",
-                    "2. Copy the meeting ID and share with customer", 
-                    "3. Wait for customer to join",
-                    "4. Start screen sharing for the demo"
-                ]
-            }
+            meeting_info = dict(self._TEMPLATE)
+            meeting_info.update(
+                meeting_id=self.meeting_id,
+                meeting_url=self.meeting_url,
+                title=title,
+                description=description,
+                duration_minutes=duration_minutes
+            )
             
             print(f"✅ Zoom session prepared: {title}")
             return meeting_info
@@ -145,7 +410,7 @@ class ZoomProvider(MeetingProvider):
     def join_meeting(self, meeting_url: str) -> bool:
         """Join Zoom meeting"""
         try:
-            webbrowser.open(meeting_url)
+            self._open_meeting(meeting_url)
             self.meeting_url = meeting_url
             self.is_active = True
             print(f"🎥 Opening Zoom: {meeting_url}")
@@ -157,36 +422,32 @@ class ZoomProvider(MeetingProvider):
 class GenericMeetProvider(MeetingProvider):
     """Generic meeting provider for any video conferencing platform"""
     
+    # Constant part of every create_meeting response
+    _TEMPLATE = MappingProxyType({
+        "success": True,
+        "provider": "Multi-Platform",
+        "instructions": _GENERIC_INSTRUCTIONS
+    })
+    
     def create_meeting(self, title: str, description: str = "", duration_minutes: int = 60) -> Dict[str, Any]:
         """Create a generic meeting session"""
         try:
-            self.meeting_id = f"generic-demo-{uuid.uuid4().hex[:8]}"
+            self.meeting_id = f"generic-demo-{_short_id()}"
             
-            # List of popular meeting platforms
+            # Static platforms plus a Jitsi room named after this meeting
             platforms = [
-                {"name": "Google Meet", "url": "https://meet.google.com/new"},
-                {"name": "Zoom", "url": "https://zoom.us/start/videomeeting"},
-                {"name": "Microsoft Teams", "url": "https://teams.microsoft.com/"},
-                {"name": "Webex", "url": "https://www.webex.com/start-meeting.html"},
+                *_MEETING_PLATFORMS,
                 {"name": "Jitsi Meet", "url": "https://meet.jit.si/DemoSession" + self.meeting_id}
             ]
             
-            meeting_info = {
-                "success": True,
-                "meeting_id": self.meeting_id,
-                "title": title,
-                "description": description,
-                "duration_minutes": duration_minutes,
-                "provider": "Multi-Platform",
-                "platforms": platforms,
-                "instructions": [
-                    "1. Choose your preferred video conferencing platform",
-                    "2. Create a new meeting using the provided links",
-                    "3. Share the meeting link with your customer",
-                    "4. Start screen sharing when customer joins",
-                    "5. Begin your interactive demo"
-                ]
-            }
+            meeting_info = dict(self._TEMPLATE)
+            meeting_info.update(
+                meeting_id=self.meeting_id,
+                title=title,
+                description=description,
+                duration_minutes=duration_minutes,
+                platforms=platforms
+            )
             
             print(f"✅ Multi-platform meeting options prepared: {title}")
             return meeting_info
@@ -197,9 +458,67 @@ class GenericMeetProvider(MeetingProvider):
                 "error": f"Failed to prepare meeting options: {str(e)}"
             }
 
+MAX_SESSION_QUESTIONS = 500  # Oldest Q&A entries are dropped beyond this
+
+@dataclass(slots=True)
+class QAEntry:
+    """One answered live question"""
+    ts: float  # time.time() when asked; formatted only on export
+    participant: str
+    question: str
+    answer: str
+    answered_by: str = "AI Assistant"
+    question_norm: str = field(default="", repr=False)  # Normalized once at ingestion, not exported
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "timestamp": _format_ts(self.ts),
+            "participant": self.participant,
+            "question": self.question,
+            "answered_by": self.answered_by,
+            "answer": self.answer
+        }
+
+@dataclass(slots=True)
+class LiveSession:
+    """State of the current live demo session"""
+    session_id: str
+    created_at: str
+    provider: str
+    meeting_info: Dict[str, Any]
+    demo_config: Any = None
+    customer_info: Optional[Dict[str, Any]] = None
+    status: str = "created"
+    questions: deque = field(default_factory=lambda: deque(maxlen=MAX_SESSION_QUESTIONS))
+    demo_started_at: Optional[str] = None
+    demo_completed_at: Optional[str] = None
+    demo_result: Optional[Dict[str, Any]] = None
+    ended_at: Optional[str] = None
+    duration_minutes: Optional[float] = None
+    demo_started_monotonic: Optional[float] = field(default=None, repr=False)  # For duration, not exported
+    topics: set = field(default_factory=set, repr=False)  # Summary topics, collected as questions arrive
+
+    # Only included in to_dict() once they have been set
+    _OPTIONAL = frozenset(("demo_started_at", "demo_completed_at", "demo_result", "ended_at", "duration_minutes"))
+    _INTERNAL = frozenset(("demo_started_monotonic", "topics"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Session as a plain dict for API responses"""
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name in self._INTERNAL or (value is None and f.name in self._OPTIONAL):
+                continue
+            data[f.name] = value
+        data["questions"] = [entry.to_dict() for entry in self.questions]
+        return data
+
 class LiveDemoMeetingManager:
     """Manages live demo meetings with video conferencing"""
     
+    # Shared worker threads for speech and other blocking work that can overlap
+    _EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="live-demo")
+    
     def __init__(self, voice_agent=None, demo_executor=None):
         self.voice_agent = voice_agent
         self.demo_executor = demo_executor
@@ -212,7 +531,49 @@ class LiveDemoMeetingManager:
         self.meeting_active = False
         self.demo_active = False
         self.participants = []
+        self._speech_future = None  # Last queued announcement
+        self._demo_future = None  # Running demo_worker, if any
+        self._demo_stop = threading.Event()  # Set by end_live_demo; demo_worker checks it between steps
+        self._demo_lock = threading.Lock()  # Guards the demo_active check-and-set
+        self._answer_product = None  # Product the answer cache was rendered for
+        self._answer_cache = {}  # category -> answer text for _answer_product
+        
+    @property
+    def demo_executor(self):
+        return self._demo_executor
+    
+    @demo_executor.setter
+    def demo_executor(self, executor):
+        # Resolve the Q&A hook once per executor rather than on every unmatched question
+        self._demo_executor = executor
+        self._demo_question_fn = getattr(executor, 'handle_demo_question', None)
+    
+    def _speak_async(self, text: str):
+        """Speak on a worker thread, after any earlier announcement has finished"""
+        previous = self._speech_future
         
+        def speak():
+            if previous is not None:
+                try:
+                    previous.result()
+                except Exception:
+                    pass
+            self.voice_agent.speak_response(text)
+        
+        self._speech_future = self._EXECUTOR.submit(speak)
+        return self._speech_future
+
+    def _speak_batch(self, *parts: str):
+        """Speak adjacent announcements as a single utterance (one TTS request)"""
+        text = " ".join(part for part in parts if part)
+        if text:
+            self.voice_agent.speak_response(text)
+
+    def _on_demo_done(self, future):
+        """Done callback for demo_worker - clears the active flag exactly once"""
+        if future is self._demo_future:
+            self.demo_active = False
+
     def create_demo_meeting(self, provider: str, demo_config, customer_info: Dict = None) -> Dict[str, Any]:
         """Create a live demo meeting"""
         try:
@@ -241,26 +602,25 @@ class LiveDemoMeetingManager:
             
             if meeting_result.get("success"):
                 # Store session information
-                self.current_session = {
-                    "session_id": f"live-demo-{uuid.uuid4().hex[:8]}",
-                    "created_at": datetime.now().isoformat(),
-                    "provider": provider,
-                    "meeting_info": meeting_result,
-                    "demo_config": demo_config,
-                    "customer_info": customer_info,
-                    "status": "created"
-                }
+                self.current_session = LiveSession(
+                    session_id=f"live-demo-{_short_id()}",
+                    created_at=_now_iso(),
+                    provider=provider,
+                    meeting_info=meeting_result,
+                    demo_config=demo_config,
+                    customer_info=customer_info
+                )
                 
                 # Prepare voice announcement
                 if self.voice_agent and demo_config:
                     announcement = f"Live demo meeting created for {demo_config.product_name}! The meeting link has been generated and is ready to share with your customer."
-                    self.voice_agent.speak_response(announcement)
+                    self._speak_async(announcement)  # Don't hold up the response
                 
-                print(f"🎬 Live demo session created: {self.current_session['session_id']}")
+                print(f"🎬 Live demo session created: {self.current_session.session_id}")
                 
                 return {
                     "success": True,
-                    "session": self.current_session,
+                    "session": self.current_session.to_dict(),
                     "message": "Live demo meeting created successfully!"
                 }
             else:
@@ -284,15 +644,21 @@ class LiveDemoMeetingManager:
                 }
             
             session = self.current_session
-            meeting_info = session["meeting_info"]
-            demo_config = session["demo_config"]
+            meeting_info = session.meeting_info
+            demo_config = session.demo_config
+            
+            # Start the welcome message first so it plays while the meeting loads
+            welcome = None
+            if self.demo_executor and demo_config and self.voice_agent:
+                welcome_msg = f"Welcome to our live demonstration of {demo_config.product_name}! I'm your AI assistant and I'll be guiding you through our platform. Feel free to ask questions anytime during the demo."
+                welcome = self._speak_async(welcome_msg)
             
             # Join the meeting if requested
             if join_meeting and meeting_info.get("meeting_url"):
-                provider = self.providers[session["provider"]]
+                provider = self.providers[session.provider]
                 if provider.join_meeting(meeting_info["meeting_url"]):
                     self.meeting_active = True
-                    session["status"] = "meeting_joined"
+                    session.status = "meeting_joined"
                     
                     # Wait a moment for meeting to load
                     time.sleep(3)
@@ -300,33 +666,28 @@ class LiveDemoMeetingManager:
             # Prepare for demo
             if self.demo_executor and demo_config:
                 self.demo_executor.set_demo_config(demo_config)
+                self._answers_for(demo_config.product_name)
                 
-                # Welcome message for live demo
-                if self.voice_agent:
+                if welcome is not None:
                     try:
-                        welcome_msg = f"Welcome to our live demonstration of {demo_config.product_name}! I'm your AI assistant and I'll be guiding you through our platform. Feel free to ask questions anytime during the demo."
-                        self.voice_agent.speak_response(welcome_msg)
+                        welcome.result()
                     except Exception as voice_error:
                         print(f"⚠️ Voice error during welcome: {voice_error}")
                         print(f"💬 Welcome message (text only): Welcome to live demo of {demo_config.product_name}")
                 
-                session["status"] = "demo_ready"
+                session.status = "demo_ready"
                 
                 return {
                     "success": True,
                     "message": "Live demo session started! Ready to begin demonstration.",
-                    "session": session,
-                    "next_steps": [
-                        "Share your screen in the video call",
-                        "Start the interactive demo",
-                        "Engage with customer questions in real-time"
-                    ]
+                    "session": session.to_dict(),
+                    "next_steps": _NEXT_STEPS
                 }
             else:
                 return {
                     "success": True,
                     "message": "Meeting joined successfully! Manual demo control enabled.",
-                    "session": session
+                    "session": session.to_dict()
                 }
                 
         except Exception as e:
@@ -346,17 +707,30 @@ class LiveDemoMeetingManager:
                     "error": "No active session"
                 }
             
+            # Single-flight: claim the demo slot so concurrent calls can't start a second worker
+            with self._demo_lock:
+                # An ended demo whose worker is still unwinding counts as running too
+                worker_running = self._demo_future is not None and not self._demo_future.done()
+                if self.demo_active or worker_running:
+                    return {
+                        "success": False,
+                        "error": "A live demo is already running"
+                    }
+                self.demo_active = True
+                stop_event = self._demo_stop = threading.Event()
+            
             session = self.current_session
-            demo_config = session.get("demo_config")
+            demo_config = session.demo_config
             
             # If no demo config in session, use default GIKI Transport
             if not demo_config:
-                from demo_config import demo_config_manager
-                demo_config = demo_config_manager.get_config("giki_transport")
-                session["demo_config"] = demo_config
+                from demo_config import get_demo_config_manager
+                demo_config = get_demo_config_manager().get_config("giki_transport")
+                session.demo_config = demo_config
                 print("🔄 Using default GIKI Transport demo configuration")
             
             if not demo_config:
+                self.demo_active = False
                 return {
                     "success": False,
                     "error": "No demo configuration available"
@@ -370,20 +744,14 @@ class LiveDemoMeetingManager:
             
             # Set the demo configuration
             self.demo_executor.set_demo_config(demo_config)
+            self._answers_for(demo_config.product_name)
             
-            # Mark demo as active
-            self.demo_active = True
-            session["status"] = "demo_running"
-            session["demo_started_at"] = datetime.now().isoformat()
+            session.status = "demo_running"
+            session.demo_started_at = _now_iso()
+            session.demo_started_monotonic = time.monotonic()
             
-            # Announce demo start
-            if self.voice_agent:
-                try:
-                    start_msg = f"Starting our interactive demonstration of {demo_config.product_name}. I'll walk you through each feature and you can ask questions at any time!"
-                    self.voice_agent.speak_response(start_msg)
-                except Exception as voice_error:
-                    print(f"⚠️ Voice error during demo start: {voice_error}")
-                    print(f"💬 Demo starting for: {demo_config.product_name}")
+            # Demo start is announced together with the screen share status
+            start_msg = f"Starting our interactive demonstration of {demo_config.product_name}. I'll walk you through each feature and you can ask questions at any time!"
             
             # Run the demo in a separate thread to allow for real-time interaction
             def demo_worker():
@@ -393,63 +761,50 @@ class LiveDemoMeetingManager:
                         self.demo_executor.initialize_browser()
                     
                     # Start screen sharing automatically
-                    if SCREEN_SHARE_AVAILABLE:
-                        print("🖥️ Attempting to start screen sharing...")
+                    screen_share_manager = _get_screen_share()
+                    if screen_share_manager is not None:
+                        _log.info("🖥️ Attempting to start screen sharing...")
                         share_result = screen_share_manager.auto_detect_and_share()
                         if share_result["success"]:
-                            print(f"✅ {share_result['message']}")
-                            
-                            # Announce successful screen sharing
-                            if self.voice_agent:
-                                try:
-                                    share_msg = "Screen sharing has been activated! Your audience can now see your demonstration."
-                                    self.voice_agent.speak_response(share_msg)
-                                except Exception as voice_error:
-                                    print(f"⚠️ Voice error during screen share announcement: {voice_error}")
+                            _log.info(f"✅ {share_result['message']}")
+                            share_msg = "Screen sharing has been activated! Your audience can now see your demonstration."
                         else:
-                            print(f"⚠️ Automatic screen sharing failed: {share_result.get('error', 'Manual sharing required')}")
+                            _log.warning(f"⚠️ Automatic screen sharing failed: {share_result.get('error', 'Manual sharing required')}")
                             
                             # Provide detailed instructions if auto-sharing fails
                             instructions = screen_share_manager.show_screen_share_instructions()
-                            print("📋 Manual screen sharing instructions:")
+                            _log.info("📋 Manual screen sharing instructions:")
                             for i, instruction in enumerate(instructions["instructions"], 1):
-                                print(f"   {i}. {instruction}")
-                            
-                            # Announce manual instructions
-                            if self.voice_agent:
-                                try:
-                                    manual_msg = "Please start screen sharing manually in your meeting platform. Look for the screen share button in your meeting controls and select 'Entire Screen' to share your demonstration."
-                                    self.voice_agent.speak_response(manual_msg)
-                                except Exception as voice_error:
-                                    print(f"⚠️ Voice error during manual screen share instructions: {voice_error}")
+                                _log.info(f"   {i}. {instruction}")
+                            share_msg = "Please start screen sharing manually in your meeting platform. Look for the screen share button in your meeting controls and select 'Entire Screen' to share your demonstration."
                     else:
-                        print("📋 Screen sharing dependencies not available. Please install pyautogui and psutil for automatic screen sharing.")
-                        print("💡 Manual screen sharing: Look for the screen share button in your meeting platform")
-                        
-                        # Announce manual requirement
-                        if self.voice_agent:
-                            try:
-                                deps_msg = "Screen sharing automation is not available. Please manually start screen sharing in your meeting platform before we begin the demonstration."
-                                self.voice_agent.speak_response(deps_msg)
-                            except Exception as voice_error:
-                                print(f"⚠️ Voice error during dependency warning: {voice_error}")
+                        _log.info("📋 Screen sharing dependencies not available. Please install pyautogui and psutil for automatic screen sharing.")
+                        _log.info("💡 Manual screen sharing: Look for the screen share button in your meeting platform")
+                        share_msg = "Screen sharing automation is not available. Please manually start screen sharing in your meeting platform before we begin the demonstration."
                     
-                    # Wait a moment for screen sharing to initialize
-                    time.sleep(2)
+                    # Announce demo start and screen share status in one utterance
+                    if self.voice_agent:
+                        try:
+                            self._speak_batch(start_msg, share_msg)
+                        except Exception as voice_error:
+                            _log.warning(f"⚠️ Voice error during demo start: {voice_error}")
+                            _log.info(f"💬 Demo starting for: {demo_config.product_name}")
                     
-                    result = self.demo_executor.run_interactive_demo()
-                    session["demo_result"] = result
-                    session["status"] = "demo_completed" if result.get("success") else "demo_failed"
-                    session["demo_completed_at"] = datetime.now().isoformat()
-                    self.demo_active = False
+                    # Wait a moment for screen sharing to initialize (returns early if the demo is ended)
+                    stop_event.wait(2)
+                    
+                    result = self.demo_executor.run_interactive_demo(stop_event)
+                    session.demo_result = result
+                    session.status = "demo_completed" if result.get("success") else "demo_failed"
+                    session.demo_completed_at = _now_iso()
                     
                     # Stop screen sharing when demo ends
-                    if SCREEN_SHARE_AVAILABLE and screen_share_manager.is_sharing:
+                    if screen_share_manager is not None and screen_share_manager.is_sharing:
                         stop_result = screen_share_manager.stop_screen_share()
-                        print(f"🛑 Screen sharing stopped: {stop_result.get('message', '')}")
+                        _log.info(f"🛑 Screen sharing stopped: {stop_result.get('message', '')}")
                     
-                    # Final message with error handling
-                    if self.voice_agent:
+                    # Final message with error handling (end_live_demo says its own goodbye)
+                    if self.voice_agent and not stop_event.is_set():
                         try:
                             if result.get("success"):
                                 final_msg = f"That completes our demonstration of {demo_config.product_name}! Thank you for your time. Do you have any final questions about what we've shown?"
@@ -457,24 +812,23 @@ class LiveDemoMeetingManager:
                                 final_msg = "I apologize, but we encountered some technical difficulties during the demo. Let me answer any questions you might have about our platform."
                             self.voice_agent.speak_response(final_msg)
                         except Exception as voice_error:
-                            print(f"⚠️ Voice error during final message: {voice_error}")
+                            _log.warning(f"⚠️ Voice error during final message: {voice_error}")
                     
-                    print(f"🎬 Live demo completed: {session['session_id']}")
+                    _log.info(f"🎬 Live demo completed: {session.session_id}")
                     
                 except Exception as e:
-                    print(f"❌ Demo execution error: {e}")
-                    session["demo_result"] = {"success": False, "error": str(e)}
-                    session["status"] = "demo_failed"
-                    self.demo_active = False
+                    _log.error(f"❌ Demo execution error: {e}")
+                    session.demo_result = {"success": False, "error": str(e)}
+                    session.status = "demo_failed"
             
-            # Start demo in background
-            demo_thread = threading.Thread(target=demo_worker, daemon=True)
-            demo_thread.start()
+            # Start demo on the shared pool; the callback clears demo_active once it finishes
+            self._demo_future = self._EXECUTOR.submit(demo_worker)
+            self._demo_future.add_done_callback(self._on_demo_done)
             
             return {
                 "success": True,
                 "message": f"Live demo of {demo_config.product_name} started! Screen sharing will begin automatically.",
-                "session": session
+                "session": session.to_dict()
             }
             
         except Exception as e:
@@ -486,6 +840,44 @@ class LiveDemoMeetingManager:
                 "error": error_msg
             }
     
+    def demo_progress(self, interval: float = 0.5) -> Iterator[Dict[str, Any]]:
+        """
+        Follow the demo started by run_live_demo.
+        
+        Args:
+            interval: Seconds between checks while the demo runs
+            
+        Returns:
+            Iterator of progress updates (status and current step, sent when they change),
+            ending with one carrying done=True and the demo result
+        """
+        future = self._demo_future
+        session = self.current_session
+        if future is None or session is None:
+            return
+        
+        steps = session.demo_config.demo_steps if session.demo_config else []
+        last = None
+        while True:
+            # Wakes early when the demo finishes
+            done = bool(wait([future], timeout=interval).done)
+            if done:
+                yield {"status": session.status, "done": True, "result": session.demo_result}
+                return
+            
+            executor = self.demo_executor
+            index = executor.current_step_index if executor and executor.demo_running else None
+            update = {
+                "status": session.status,
+                "done": False,
+                "step": index,
+                "step_name": steps[index].name if index is not None and index < len(steps) else None,
+                "total_steps": len(steps)
+            }
+            if update != last:
+                last = update
+                yield update
+    
     def handle_live_question(self, question: str, participant_name: str = "Customer") -> Dict[str, Any]:
         """Handle questions during live demo with improved context and answers"""
         try:
@@ -496,40 +888,32 @@ class LiveDemoMeetingManager:
                 }
 
             session = self.current_session
-            demo_config = session.get("demo_config")
-
-            # Log the question
-            if "questions" not in session:
-                session["questions"] = []
-
-            question_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "participant": participant_name,
-                "question": question,
-                "answered_by": "AI Assistant"
-            }
+            demo_config = session.demo_config
 
             # Generate contextual answer with better logic
-            answer = self._generate_contextual_answer(question, demo_config)
+            question_norm = _normalize_question(question)
+            answer = self._generate_contextual_answer(question, demo_config, question_norm)
             
-            question_entry["answer"] = answer
-            session["questions"].append(question_entry)
+            # Log the question
+            session.questions.append(QAEntry(time.time(), participant_name, question, answer, question_norm=question_norm))
+            session.topics |= _TOPIC_CLASSIFIER.matches(question_norm)
 
             # Speak the answer with error handling - WAIT for demo to finish speaking
             if self.voice_agent:
                 try:
-                    # Wait if demo is currently speaking to avoid overlap
-                    if hasattr(self.voice_agent, 'is_speaking') and self.voice_agent.is_speaking:
-                        time.sleep(2)  # Brief pause
+                    # Wait until the demo finishes speaking to avoid overlap
+                    speaking_done = getattr(self.voice_agent, 'speaking_done', None)
+                    if speaking_done is not None:
+                        speaking_done.wait(timeout=10.0)
                     
                     response = f"Great question! {answer}"
                     self.voice_agent.speak_response(response)
                 except Exception as voice_error:
-                    print(f"⚠️ Voice error during Q&A: {voice_error}")
-                    print(f"💬 Answer (text only): {answer}")
+                    _log.warning(f"⚠️ Voice error during Q&A: {voice_error}")
+                    _log.info(f"💬 Answer (text only): {answer}")
 
-            print(f"❓ Live Q&A - {participant_name}: {question}")
-            print(f"💬 AI Response: {answer}")
+            _log.info(f"❓ Live Q&A - {participant_name}: {question}")
+            _log.info(f"💬 AI Response: {answer}")
 
             return {
                 "success": True,
@@ -540,82 +924,41 @@ class LiveDemoMeetingManager:
 
         except Exception as e:
             error_msg = f"Failed to handle live question: {str(e)}"
-            print(f"❌ {error_msg}")
+            _log.error(f"❌ {error_msg}")
             return {
                 "success": False,
                 "error": error_msg
             }
     
-    def _generate_contextual_answer(self, question: str, demo_config) -> str:
+    def _answers_for(self, product_name: str) -> Dict[str, str]:
+        """Rendered answers for product_name, rebuilt only when the product changes"""
+        if product_name != self._answer_product:
+            self._answer_cache = _render_answers(product_name)
+            self._answer_product = product_name
+        return self._answer_cache
+    
+    def _generate_contextual_answer(self, question: str, demo_config, question_norm: Optional[str] = None) -> str:
         """Generate a contextual answer based on the question and demo context"""
-        question_lower = question.lower()
-        
         # Get product name
         product_name = demo_config.product_name if demo_config else "our platform"
         
-        # Sign-in/Login questions - SPECIFIC MATCH
-        if any(word in question_lower for word in ["sign in", "login", "log in", "sign up", "register", "account"]):
-            return f"To sign in to {product_name}, simply click the 'Sign In' button on our homepage. You'll be taken to a secure login page where you can enter your credentials. If you don't have an account yet, click 'Register' to create one. The process is quick and straightforward - just provide your email, create a password, and you'll have immediate access to all platform features."
-        
-        # How to use/getting started questions
-        elif any(phrase in question_lower for phrase in ["how to use", "how do i", "getting started", "first time", "begin"]):
-            return f"Getting started with {product_name} is simple! After signing in, you'll land on your personalized dashboard where you can see all available features. For first-time users, I recommend starting with the booking system to see how easy it is to manage your transport needs. Everything is designed to be intuitive - just click through the menu options and explore!"
-        
-        # Pricing questions
-        elif any(word in question_lower for word in ["price", "cost", "pricing", "expensive", "cheap", "fee", "payment"]):
-            return f"Our pricing for {product_name} is very competitive and designed to provide excellent value. We offer flexible plans starting from basic packages for individual users up to enterprise solutions. Contact our sales team for detailed pricing that fits your specific needs and usage requirements."
-        
-        # Feature questions
-        elif any(word in question_lower for word in ["feature", "functionality", "capability", "what can", "does it", "can you"]):
-            return f"{product_name} offers a comprehensive set of features designed to streamline your workflow. As you can see in our demo, we provide intuitive user interfaces, powerful automation capabilities, and seamless integration options. The platform is built with scalability in mind and includes advanced analytics, real-time processing, and customizable workflows. Would you like me to demonstrate any specific feature you're interested in?"
-        
-        # Security questions
-        elif any(word in question_lower for word in ["security", "safe", "secure", "privacy", "data protection", "encryption"]):
-            return f"Security is a top priority for {product_name}. We implement industry-standard security measures including end-to-end encryption, secure data transmission, regular security audits, and compliance with major regulations like GDPR and SOC 2. Your data is protected with multi-layered security protocols, and we provide detailed security documentation for enterprise customers. Our platform also includes role-based access controls and audit trails for complete transparency."
-        
-        # Integration questions
-        elif any(word in question_lower for word in ["integration", "api", "connect", "third party", "integrate", "sync"]):
-            return f"{product_name} is designed for seamless integration with your existing tools and systems. We provide RESTful APIs, webhooks, and pre-built integrations with popular platforms like Salesforce, HubSpot, Slack, and many others. Our integration platform allows you to connect virtually any system, and we also offer custom integration support for enterprise clients. The demo you're seeing can actually be integrated into your existing workflow quite easily."
-        
-        # Support questions
-        elif any(word in question_lower for word in ["support", "help", "assistance", "training", "onboarding"]):
-            return f"We provide comprehensive support for {product_name} users. This includes 24/7 technical support, detailed documentation, video tutorials, live training sessions, and dedicated customer success managers for enterprise accounts. We also have an active community forum and regular webinars. Our onboarding process is designed to get you up and running quickly, with personalized setup assistance and training tailored to your team's needs."
-        
-        # Performance questions
-        elif any(word in question_lower for word in ["fast", "speed", "performance", "slow", "latency", "response time"]):
-            return f"{product_name} is built for high performance with sub-second response times and 99.9% uptime SLA. Our platform uses cloud-native architecture with global CDN distribution, ensuring fast performance regardless of your location. We continuously monitor performance metrics and have built-in optimization features that adapt to your usage patterns. The system scales automatically to handle peak loads without any performance degradation."
-        
-        # Customization questions
-        elif any(word in question_lower for word in ["customize", "custom", "personalize", "configure", "settings"]):
-            return f"Absolutely! {product_name} is highly customizable to fit your specific business needs. You can customize workflows, user interfaces, data fields, reporting dashboards, and notification settings. We also support custom branding, white-labeling options, and can develop custom features for enterprise clients. The platform includes a visual configuration interface, so you don't need technical expertise to make most customizations."
-        
-        # Comparison questions
-        elif any(word in question_lower for word in ["competitor", "compare", "alternative", "versus", "better than", "different from"]):
-            return f"Great question! {product_name} stands out from alternatives through our focus on user experience, comprehensive feature set, and exceptional customer support. Unlike many competitors, we provide unlimited customization options, transparent pricing, and dedicated account management. Our platform is also designed with future-proofing in mind, ensuring that your investment continues to provide value as your business grows. I'd be happy to show you specific features that differentiate us from other solutions."
-        
-        # Technical questions
-        elif any(word in question_lower for word in ["technical", "requirements", "system", "server", "database", "infrastructure"]):
-            return f"{product_name} is built on modern, cloud-native infrastructure that requires minimal technical requirements from your end. It's a web-based solution that works on any modern browser, with mobile apps available for iOS and Android. We handle all the backend infrastructure, databases, and server management, so you don't need to worry about technical maintenance. For enterprise clients, we also offer on-premise deployment options with full technical support."
-        
-        # Scale/Growth questions
-        elif any(word in question_lower for word in ["scale", "growth", "expand", "users", "volume", "enterprise"]):
-            return f"{product_name} is designed to scale with your business from startup to enterprise level. Our architecture automatically scales to handle increased users, data volume, and transaction loads. We support unlimited users on our enterprise plans and have customers processing millions of transactions daily. The platform grows with you, adding new features and capabilities as your needs evolve, without requiring migration or system changes."
-        
-        # Demo-specific questions
-        elif any(word in question_lower for word in ["demo", "showing", "screen", "example", "sample"]):
-            return f"In this live demo of {product_name}, I'm showing you our core features in action using real-world scenarios. What you're seeing represents the actual user experience - this isn't a mock-up or simulation. The interface you see is exactly what you and your team would use daily. I can demonstrate any specific workflow or feature you're curious about. Feel free to ask me to show you particular use cases that are relevant to your business needs."
+        answers = self._answers_for(product_name)
+        if question_norm is None:
+            question_norm = _normalize_question(question)
+        category = _category_for(question_norm)
+        if category is not None:
+            return answers[category]
         
         # General/fallback answer
-        else:
-            # Try to use demo executor if available for domain-specific questions
-            if self.demo_executor and hasattr(self.demo_executor, 'handle_demo_question'):
-                try:
-                    return self.demo_executor.handle_demo_question(question)
-                except Exception as demo_error:
-                    print(f"⚠️ Demo executor question error: {demo_error}")
-            
-            # Fallback to general helpful response
-            return f"That's an excellent question about {product_name}! Based on what we're demonstrating here, our platform is designed to address exactly these kinds of business challenges. Let me give you a comprehensive answer: {product_name} provides robust solutions that are user-friendly, scalable, and designed with your success in mind. We've built this platform based on years of customer feedback and industry best practices. Would you like me to demonstrate a specific aspect that relates to your question, or would you prefer to see how this would work in your particular use case?"
+        # Try to use demo executor if available for domain-specific questions
+        if self._demo_question_fn is not None:
+            try:
+                return self._demo_question_fn(question)
+            except Exception as demo_error:
+                _log.warning(f"⚠️ Demo executor question error: {demo_error}")
+        
+        # Fallback to general helpful response
+        return answers["fallback"]
     
     def end_live_demo(self) -> Dict[str, Any]:
         """End the live demo session"""
@@ -628,45 +971,45 @@ class LiveDemoMeetingManager:
             
             session = self.current_session
             
-            # Stop demo if running
-            if self.demo_active:
-                self.demo_active = False
+            # Stop the demo: a queued worker is cancelled, a running one stops before its next step.
+            # demo_active is cleared by _on_demo_done once the worker has really finished.
+            self._demo_stop.set()
+            if self._demo_future is not None:
+                self._demo_future.cancel()
             
             # Update session status
-            session["status"] = "completed"
-            session["ended_at"] = datetime.now().isoformat()
+            session.status = "completed"
+            session.ended_at = _now_iso()
             
             # Calculate session duration
-            if "demo_started_at" in session:
-                start_time = datetime.fromisoformat(session["demo_started_at"])
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds() / 60
-                session["duration_minutes"] = round(duration, 2)
+            if session.demo_started_monotonic is not None:
+                duration = (time.monotonic() - session.demo_started_monotonic) / 60
+                session.duration_minutes = round(duration, 2)
             
             # Final thank you message
-            if self.voice_agent:
-                demo_config = session.get("demo_config")
+            voice_agent = self.voice_agent
+            if voice_agent:
+                demo_config = session.demo_config
                 if demo_config:
                     final_msg = f"Thank you for joining our live demonstration of {demo_config.product_name}! If you have any follow-up questions, please don't hesitate to reach out."
                 else:
                     final_msg = "Thank you for joining our live demonstration! We hope you found it valuable."
-                self.voice_agent.speak_response(final_msg)
+                voice_agent.speak_response(final_msg)
             
             # Generate session summary
             summary = self.generate_session_summary(session)
             
             # Clear current session
-            completed_session = self.current_session
             self.current_session = None
             self.meeting_active = False
             
-            print(f"🎬 Live demo session ended: {completed_session['session_id']}")
+            print(f"🎬 Live demo session ended: {session.session_id}")
             
             return {
                 "success": True,
                 "message": "Live demo session ended successfully",
                 "session_summary": summary,
-                "completed_session": completed_session
+                "completed_session": session.to_dict()
             }
             
         except Exception as e:
@@ -677,40 +1020,23 @@ class LiveDemoMeetingManager:
                 "error": error_msg
             }
     
-    def generate_session_summary(self, session: Dict) -> Dict[str, Any]:
+    def generate_session_summary(self, session: LiveSession) -> Dict[str, Any]:
         """Generate a summary of the demo session"""
         try:
-            demo_config = session.get("demo_config")
-            questions = session.get("questions", [])
+            demo_config = session.demo_config
+            question_count = len(session.questions)
             
             summary = {
-                "session_id": session["session_id"],
+                "session_id": session.session_id,
                 "product_demo": demo_config.product_name if demo_config else "Generic Demo",
-                "duration_minutes": session.get("duration_minutes", 0),
-                "questions_asked": len(questions),
-                "customer_engagement": "High" if len(questions) > 3 else "Medium" if len(questions) > 0 else "Low",
-                "demo_completed": session.get("status") == "completed",
-                "key_topics": []
+                "duration_minutes": session.duration_minutes or 0,
+                "questions_asked": question_count,
+                "customer_engagement": "High" if question_count > 3 else "Medium" if question_count > 0 else "Low",
+                "demo_completed": session.status == "completed",
+                # Topics are extracted as each question is logged, so no pass over questions here
+                "key_topics": list(session.topics)
             }
             
-            # Extract key topics from questions
-            if questions:
-                topics = set()
-                for q in questions:
-                    question_text = q["question"].lower()
-                    if any(word in question_text for word in ["price", "cost", "pricing"]):
-                        topics.add("Pricing")
-                    if any(word in question_text for word in ["feature", "functionality", "capability"]):
-                        topics.add("Features")
-                    if any(word in question_text for word in ["security", "safe", "secure"]):
-                        topics.add("Security")
-                    if any(word in question_text for word in ["integration", "api", "connect"]):
-                        topics.add("Integration")
-                    if any(word in question_text for word in ["support", "help", "assistance"]):
-                        topics.add("Support")
-                
-                summary["key_topics"] = list(topics)
-            
             return summary
             
         except Exception as e:
@@ -720,7 +1046,8 @@ class LiveDemoMeetingManager:
     def start_screen_sharing(self, platform: str = "auto") -> Dict[str, Any]:
         """Manually start screen sharing"""
         try:
-            if not SCREEN_SHARE_AVAILABLE:
+            screen_share_manager = _get_screen_share()
+            if screen_share_manager is None:
                 return {
                     "success": False,
                     "error": "Screen sharing dependencies not available"
@@ -748,7 +1075,8 @@ class LiveDemoMeetingManager:
     def stop_screen_sharing(self) -> Dict[str, Any]:
         """Stop screen sharing"""
         try:
-            if not SCREEN_SHARE_AVAILABLE:
+            screen_share_manager = _get_screen_share()
+            if screen_share_manager is None:
                 return {
                     "success": False,
                     "error": "Screen sharing dependencies not available"
@@ -765,7 +1093,8 @@ class LiveDemoMeetingManager:
     
     def get_screen_share_status(self) -> Dict[str, Any]:
         """Get screen sharing status"""
-        if not SCREEN_SHARE_AVAILABLE:
+        screen_share_manager = _get_screen_share()
+        if screen_share_manager is None:
             return {
                 "available": False,
                 "message": "Screen sharing dependencies not installed"
@@ -785,10 +1114,10 @@ class LiveDemoMeetingManager:
         
         return {
             "active": True,
-            "session": self.current_session,
+            "session": self.current_session.to_dict(),
             "meeting_active": self.meeting_active,
             "demo_active": self.demo_active,
-            "status": self.current_session.get("status", "unknown")
+            "status": self.current_session.status
         }
 
 # Global live demo manager
@@ -6,9 +6,122 @@ Handles automatic screen sharing for live demos
 import subprocess
 import platform
 import time
-import pyautogui
-import psutil
-from typing import Dict, Any, Optional
+import ctypes
+from ctypes import wintypes
+from typing import Dict, Any, Optional, FrozenSet
+
+# Process-name fragments of the meeting apps auto-detection looks for
+MEETING_APPS = frozenset({'zoom', 'teams', 'chrome', 'edge', 'firefox'})
+APPS_CACHE_TTL = 2.0  # seconds a process scan is reused
+# (running app, share method) in the order auto-detection tries them
+SHARE_PRIORITY = (
+    ('zoom', 'start_screen_share_zoom'),
+    ('teams', 'start_screen_share_teams'),
+    ('chrome', 'start_screen_share_google_meet'),
+    ('edge', 'start_screen_share_google_meet'),
+)
+
+# Window-title fragments of the platforms' "choose what to share" pickers
+SHARE_DIALOG_TITLES = ('choose what to share', 'share your screen', 'share screen', 'share content', 'select a window', 'entire screen')
+
+# Step-by-step manual sharing instructions per platform
+SHARE_INSTRUCTIONS = {
+    "google_meet": (
+        "1. In Google Meet, click the 'Present now' button (screen icon)",
+        "2. Select 'Your entire screen'",
+        "3. Choose your main screen",
+        "4. Click 'Share'",
+        "Alternative: Press Ctrl+Alt+S"
+    ),
+    "zoom": (
+        "1. In Zoom, click the 'Share Screen' button",
+        "2. Select your screen",
+        "3. Click 'Share'",
+        "Alternative: Press Alt+S"
+    ),
+    "teams": (
+        "1. In Teams, click the 'Share content' button",
+        "2. Select 'Desktop'",
+        "3. Choose your screen",
+        "4. Click 'Confirm'",
+        "Alternative: Press Ctrl+Shift+E"
+    ),
+    "generic": (
+        "1. Look for a 'Share Screen' or 'Present' button in your meeting",
+        "2. Click it and select your entire screen",
+        "3. Confirm the sharing",
+        "Common shortcuts: Ctrl+Alt+S (Meet), Alt+S (Zoom), Ctrl+Shift+E (Teams)"
+    )
+}
+
+MANUAL_SHARE_INSTRUCTIONS = (
+    "1. Look for a 'Share Screen' or 'Present' button in your meeting",
+    "2. Click it and select your entire screen",
+    "3. The demo will appear on your shared screen",
+    "4. Your audience will see the live demo!"
+)
+
+# Key combinations sent by the share/stop flows (pressed together, released in reverse)
+GMEET_SHARE_KEYS = ('ctrl', 'alt', 's')
+GMEET_SHARE_ALT_KEYS = ('ctrl', 'alt', 'here')
+ZOOM_SHARE_KEYS = ('alt', 's')
+ZOOM_SHARE_ALT_KEYS = ('alt', 'shift', 's')
+TEAMS_SHARE_KEYS = ('ctrl', 'shift', 'e')
+TAB_KEY = ('tab',)
+ENTER_KEY = ('enter',)
+
+# Windows virtual-key codes for the keys above
+_VK_CODES = {'ctrl': 0x11, 'alt': 0x12, 'shift': 0x10, 'tab': 0x09, 'enter': 0x0D, 's': 0x53, 'e': 0x45}
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _INPUTUNION(ctypes.Union):
+    # The mouse member sets the union size SendInput expects
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+_key_inputs = {}  # key combination -> prebuilt INPUT array (or None if not mappable)
+
+def _build_key_inputs(keys):
+    """INPUT array pressing keys in order and releasing them in reverse"""
+    if any(key not in _VK_CODES for key in keys):
+        return None
+    events = [(key, 0) for key in keys] + [(key, _KEYEVENTF_KEYUP) for key in reversed(keys)]
+    inputs = (_INPUT * len(events))()
+    for slot, (key, flags) in zip(inputs, events):
+        slot.type = _INPUT_KEYBOARD
+        slot.u.ki = _KEYBDINPUT(wVk=_VK_CODES[key], dwFlags=flags)
+    return inputs
+
+def _send_input(keys) -> bool:
+    """Send a key combination with one SendInput call (Windows); False if it can't be sent this way"""
+    if keys not in _key_inputs:
+        _key_inputs[keys] = _build_key_inputs(keys)
+    inputs = _key_inputs[keys]
+    if inputs is None:
+        return False
+    sent = ctypes.windll.user32.SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+    return sent == len(inputs)
+
+def _load_pyautogui():
+    """Import pyautogui on first use - it pulls in Pillow and the display backend"""
+    import pyautogui
+    return pyautogui
+
+def _load_psutil():
+    """Import psutil on first use"""
+    import psutil
+    return psutil
 
 class ScreenShareManager:
     """Manages screen sharing across different platforms"""
@@ -17,23 +130,31 @@ class ScreenShareManager:
         self.is_sharing = False
         self.sharing_process = None
         self.platform = platform.system().lower()
+        self._apps_cache = frozenset()
+        self._apps_cache_ts = None
+        self._pyautogui = None
         
+    @property
+    def gui(self):
+        """pyautogui module, imported the first time a shortcut is sent"""
+        if self._pyautogui is None:
+            self._pyautogui = _load_pyautogui()
+        return self._pyautogui
+    
     def start_screen_share_google_meet(self) -> Dict[str, Any]:
         """Start screen sharing in Google Meet"""
         try:
             print("🖥️ Starting screen share in Google Meet...")
             
             # Wait for Google Meet to be ready
-            time.sleep(2)
+            self._wait_for_window(('meet',), 2.0)
             
             # Use keyboard shortcut Ctrl+Alt+S (Google Meet screen share shortcut)
-            pyautogui.hotkey('ctrl', 'alt', 's')
-            time.sleep(1)
+            self._send_keys(GMEET_SHARE_KEYS)
             
             # Alternative: Try Ctrl+Alt+Here for some Google Meet versions
             if not self._check_screen_share_dialog():
-                pyautogui.hotkey('ctrl', 'alt', 'here')
-                time.sleep(1)
+                self._send_keys(GMEET_SHARE_ALT_KEYS)
             
             # If still no dialog, try clicking the screen share button
             if not self._check_screen_share_dialog():
@@ -41,11 +162,11 @@ class ScreenShareManager:
             
             # Select entire screen option
             time.sleep(1)
-            pyautogui.press('tab')  # Navigate to "Entire screen"
+            self._send_keys(TAB_KEY)  # Navigate to "Entire screen"
             time.sleep(0.5)
-            pyautogui.press('enter')  # Select entire screen
+            self._send_keys(ENTER_KEY)  # Select entire screen
             time.sleep(1)
-            pyautogui.press('enter')  # Confirm share
+            self._send_keys(ENTER_KEY)  # Confirm share
             
             self.is_sharing = True
             
@@ -67,20 +188,19 @@ class ScreenShareManager:
             print("🖥️ Starting screen share in Zoom...")
             
             # Wait for Zoom to be ready
-            time.sleep(2)
+            self._wait_for_window(('zoom',), 2.0)
             
             # Use keyboard shortcut Alt+S (Zoom screen share shortcut)
-            pyautogui.hotkey('alt', 's')
-            time.sleep(1)
+            self._send_keys(ZOOM_SHARE_KEYS)
             
             # Alternative shortcut for some Zoom versions
             if not self._check_screen_share_dialog():
-                pyautogui.hotkey('alt', 'shift', 's')
-                time.sleep(1)
+                self._send_keys(ZOOM_SHARE_ALT_KEYS)
+                self._check_screen_share_dialog(1.0)
             
             # Select entire screen and start sharing
             time.sleep(1)
-            pyautogui.press('enter')  # Usually selects the first screen by default
+            self._send_keys(ENTER_KEY)  # Usually selects the first screen by default
             
             self.is_sharing = True
             
@@ -102,18 +222,18 @@ class ScreenShareManager:
             print("🖥️ Starting screen share in Microsoft Teams...")
             
             # Wait for Teams to be ready
-            time.sleep(2)
+            self._wait_for_window(('teams',), 2.0)
             
             # Use keyboard shortcut Ctrl+Shift+E (Teams screen share shortcut)
-            pyautogui.hotkey('ctrl', 'shift', 'e')
-            time.sleep(2)
+            self._send_keys(TEAMS_SHARE_KEYS)
+            self._check_screen_share_dialog(2.0)
             
             # Select desktop and confirm
-            pyautogui.press('tab')  # Navigate to desktop option
+            self._send_keys(TAB_KEY)  # Navigate to desktop option
             time.sleep(0.5)
-            pyautogui.press('enter')  # Select desktop
+            self._send_keys(ENTER_KEY)  # Select desktop
             time.sleep(1)
-            pyautogui.press('enter')  # Confirm share
+            self._send_keys(ENTER_KEY)  # Confirm share
             
             self.is_sharing = True
             
@@ -135,19 +255,14 @@ class ScreenShareManager:
             # Check which meeting app is running
             running_apps = self._get_running_meeting_apps()
             
-            if 'chrome' in running_apps or 'edge' in running_apps:
-                # Likely Google Meet (web-based)
-                result = self.start_screen_share_google_meet()
-                if result["success"]:
-                    return result
-            
-            if 'zoom' in running_apps:
-                result = self.start_screen_share_zoom()
-                if result["success"]:
-                    return result
-            
-            if 'teams' in running_apps:
-                result = self.start_screen_share_teams()
+            # Dedicated apps first - a browser is usually open anyway, so it is
+            # only a weak hint for Google Meet
+            tried = set()
+            for app, method in SHARE_PRIORITY:
+                if app not in running_apps or method in tried:
+                    continue
+                tried.add(method)
+                result = getattr(self, method)()
                 if result["success"]:
                     return result
             
@@ -162,37 +277,8 @@ class ScreenShareManager:
     
     def show_screen_share_instructions(self, platform: str = "auto") -> Dict[str, Any]:
         """Show screen sharing instructions for the platform"""
-        instructions = {
-            "google_meet": [
-                "1. In Google Meet, click the 'Present now' button (screen icon)",
-                "2. Select 'Your entire screen'",
-                "3. Choose your main screen",
-                "4. Click 'Share'",
-                "Alternative: Press Ctrl+Alt+S"
-            ],
-            "zoom": [
-                "1. In Zoom, click the 'Share Screen' button",
-                "2. Select your screen",
-                "3. Click 'Share'",
-                "Alternative: Press Alt+S"
-            ],
-            "teams": [
-                "1. In Teams, click the 'Share content' button",
-                "2. Select 'Desktop'",
-                "3. Choose your screen",
-                "4. Click 'Confirm'",
-                "Alternative: Press Ctrl+Shift+E"
-            ],
-            "generic": [
-                "1. Look for a 'Share Screen' or 'Present' button in your meeting",
-                "2. Click it and select your entire screen",
-                "3. Confirm the sharing",
-                "Common shortcuts: Ctrl+Alt+S (Meet), Alt+S (Zoom), Ctrl+Shift+E (Teams)"
-            ]
-        }
-        
         platform_key = platform.lower().replace(" ", "_") if platform != "auto" else "generic"
-        selected_instructions = instructions.get(platform_key, instructions["generic"])
+        selected_instructions = SHARE_INSTRUCTIONS.get(platform_key, SHARE_INSTRUCTIONS["generic"])
         
         return {
             "success": True,
@@ -201,26 +287,75 @@ class ScreenShareManager:
             "message": f"Screen sharing instructions for {platform}"
         }
     
-    def _get_running_meeting_apps(self) -> list:
-        """Get list of running meeting applications"""
-        running_apps = []
+    def _get_running_meeting_apps(self) -> FrozenSet[str]:
+        """Get the set of MEETING_APPS currently running (cached for APPS_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        if self._apps_cache_ts is not None and now - self._apps_cache_ts < APPS_CACHE_TTL:
+            return self._apps_cache
         
+        found = set()
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                proc_name = proc.info['name'].lower()
-                if any(app in proc_name for app in ['zoom', 'teams', 'chrome', 'edge', 'firefox']):
-                    running_apps.append(proc_name)
+            for proc in _load_psutil().process_iter(['name']):
+                proc_name = (proc.info['name'] or '').lower()
+                for app in MEETING_APPS - found:
+                    if app in proc_name:
+                        found.add(app)
+                # Every target seen - no need to walk the remaining processes
+                if len(found) == len(MEETING_APPS):
+                    break
         except Exception as e:
             print(f"⚠️ Error detecting running apps: {e}")
         
-        return running_apps
+        self._apps_cache = frozenset(found)
+        self._apps_cache_ts = now
+        return self._apps_cache
+    
+    def _send_keys(self, keys):
+        """Press a key combination - one native SendInput batch on Windows, pyautogui elsewhere"""
+        if self.platform == 'windows' and _send_input(keys):
+            return
+        if len(keys) == 1:
+            self.gui.press(keys[0])
+        else:
+            self.gui.hotkey(*keys)
     
-    def _check_screen_share_dialog(self) -> bool:
-        """Check if screen share dialog is open"""
+    def _active_window_title(self) -> Optional[str]:
+        """Lower-cased title of the focused window, or None where pyautogui can't report it"""
+        get_title = getattr(self.gui, 'getActiveWindowTitle', None)  # Windows only
+        if get_title is None:
+            return None
         try:
-            # This is a simplified check - in practice, you'd use more sophisticated detection
-            time.sleep(0.5)
-            return True  # Assume dialog opened for now
+            return (get_title() or '').lower()
+        except Exception:
+            return None
+    
+    def _wait_for(self, pred, timeout: float = 3.0, interval: float = 0.05) -> bool:
+        """Poll pred until it returns True or timeout seconds pass"""
+        deadline = time.monotonic() + timeout
+        while True:
+            if pred():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+    
+    def _wait_for_window(self, fragments, timeout: float) -> bool:
+        """
+        Wait until the focused window's title contains one of fragments.
+        Where the title can't be read, wait the full timeout and assume it appeared.
+        """
+        if self._active_window_title() is None:
+            time.sleep(timeout)
+            return True
+        return self._wait_for(
+            lambda: any(fragment in (self._active_window_title() or '') for fragment in fragments),
+            timeout
+        )
+    
+    def _check_screen_share_dialog(self, timeout: float = 1.5) -> bool:
+        """Check if screen share dialog is open, returning as soon as it appears"""
+        try:
+            return self._wait_for_window(SHARE_DIALOG_TITLES, timeout)
         except Exception:
             return False
     
@@ -238,12 +373,7 @@ class ScreenShareManager:
         return {
             "success": True,
             "message": "Please manually start screen sharing",
-            "instructions": [
-                "1. Look for a 'Share Screen' or 'Present' button in your meeting",
-                "2. Click it and select your entire screen",
-                "3. The demo will appear on your shared screen",
-                "4. Your audience will see the live demo!"
-            ],
+            "instructions": MANUAL_SHARE_INSTRUCTIONS,
             "shortcuts": {
                 "Google Meet": "Ctrl+Alt+S",
                 "Zoom": "Alt+S", 
@@ -261,9 +391,9 @@ class ScreenShareManager:
                 }
             
             # Try common stop sharing shortcuts
-            pyautogui.hotkey('ctrl', 'alt', 's')  # Google Meet toggle
+            self._send_keys(GMEET_SHARE_KEYS)  # Google Meet toggle
             time.sleep(0.5)
-            pyautogui.hotkey('alt', 's')  # Zoom toggle
+            self._send_keys(ZOOM_SHARE_KEYS)  # Zoom toggle
             
             self.is_sharing = False
             
@@ -290,5 +420,18 @@ class ScreenShareManager:
             }
         }
 
-# Global screen share manager
-screen_share_manager = ScreenShareManager()
+# Global screen share manager, built on first access
+_manager = None
+
+def get_screen_share_manager() -> ScreenShareManager:
+    """Return the shared screen share manager, building it on first access"""
+    global _manager
+    if _manager is None:
+        _manager = ScreenShareManager()
+    return _manager
+
+def __getattr__(name):
+    # Keeps `from screen_share_integration import screen_share_manager` working
+    if name == "screen_share_manager":
+        return get_screen_share_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
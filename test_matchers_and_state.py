@@ -0,0 +1,221 @@
+"""
+Test Keyword Matching and Shared State
+Checks that both KeywordClassifier paths agree on the real routing tables,
+that AtomicRef and the demo config registry hold up under concurrent writers,
+that live sessions stay JSON-serializable once narration is preloaded,
+and that oversized request bodies are rejected with 413
+"""
+
+import threading
+
+import keyword_matcher
+from keyword_matcher import KeywordClassifier
+from app_state import AtomicRef, SystemState
+from demo_config import DemoConfigManager
+
+WRITERS = 8
+WRITES_PER_THREAD = 50
+
+# Hand-picked phrasings on top of the generated ones (word boundaries, priority clashes)
+SAMPLE_TEXTS = (
+    "",
+    "hello there",
+    "what is the price of a ticket",
+    "how do i book a ticket and check my profile",
+    "show me how it works",
+    "is it secure and does it integrate with our api",
+    "go to signin please",
+    "navigate to signup",
+    "blog inside the showroom",
+    "what's the pricing for enterprise users",
+    "can you customize the demo screen",
+    "i need help with login and register",
+    "somehow the features feel slow",
+)
+
+def _keyword_tables():
+    """(name, classifier) for every KeywordClassifier table used by the app"""
+    from live_meeting_integration import _ANSWER_CLASSIFIER, _TOPIC_CLASSIFIER
+    from web_interface import _NAV_ROUTES, _KEYWORD_ROUTES
+    from dynamic_demo_executor import QUESTION_CLASSIFIER
+
+    return (
+        ("_ANSWER_CLASSIFIER", _ANSWER_CLASSIFIER),
+        ("_TOPIC_CLASSIFIER", _TOPIC_CLASSIFIER),
+        ("_NAV_ROUTES", _NAV_ROUTES),
+        ("_KEYWORD_ROUTES", _KEYWORD_ROUTES),
+        ("QUESTION_CLASSIFIER", QUESTION_CLASSIFIER),
+    )
+
+def _fallback_twin(classifier):
+    """Same buckets as classifier, forced onto the token/regex path"""
+    twin = KeywordClassifier([(label, words) for label, words in classifier.buckets],
+                             whole_words=classifier.whole_words)
+    twin._automaton = None
+    return twin
+
+def _texts_for(classifier):
+    """Sample texts plus every keyword alone, in a sentence, and inside longer words"""
+    texts = list(SAMPLE_TEXTS)
+    for _, words in classifier.buckets:
+        for word in sorted(words):
+            texts += [
+                word,
+                f"tell me about {word} today",
+                f"x{word}y",
+                f"{word}s and more",
+                f"un{word}",
+                f"{word}, really?",
+            ]
+    return texts
+
+def check_classifier_paths_agree(name, classifier):
+    """Assert classify() and matches() give identical results on both paths"""
+    twin = _fallback_twin(classifier)
+    texts = _texts_for(classifier)
+
+    for text in texts:
+        assert classifier.classify(text) == twin.classify(text), \
+            f"{name}.classify({text!r}): automaton={classifier.classify(text)!r} fallback={twin.classify(text)!r}"
+        assert classifier.matches(text) == twin.matches(text), \
+            f"{name}.matches({text!r}): automaton={classifier.matches(text)!r} fallback={twin.matches(text)!r}"
+
+    print(f"  ✅ {name}: {len(texts)} texts agree")
+
+def test_keyword_classifier_paths_agree():
+    """The Aho-Corasick and fallback paths classify every table identically"""
+    print("🧪 Comparing KeywordClassifier paths")
+    if not keyword_matcher.AHOCORASICK_AVAILABLE:
+        print("  ⚠️ pyahocorasick not installed - only the fallback path is available")
+        return
+
+    for name, classifier in _keyword_tables():
+        check_classifier_paths_agree(name, classifier)
+
+def test_atomic_ref_concurrent_swaps():
+    """No increment is lost when many threads swap at once"""
+    print("🧪 AtomicRef concurrent swaps")
+    counter = AtomicRef(0)
+
+    def writer():
+        for _ in range(WRITES_PER_THREAD):
+            counter.swap(lambda value: value + 1)
+
+    threads = [threading.Thread(target=writer) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.get() == WRITERS * WRITES_PER_THREAD, counter.get()
+
+    state = AtomicRef(SystemState())
+    state.update(listening=True, last_command="demo")
+    snapshot = state.get()
+    state.update(listening=False)
+    assert snapshot.listening and snapshot.last_command == "demo", "published snapshot changed"
+    print(f"  ✅ {counter.get()} swaps, snapshots unchanged after later updates")
+
+def test_demo_config_concurrent_adds():
+    """Concurrent add_custom_config calls get distinct ids and every body serves its own config"""
+    print("🧪 DemoConfigManager concurrent adds")
+    manager = DemoConfigManager()
+    initial = len(manager.list_configs())
+    ids = []
+    ids_lock = threading.Lock()
+    errors = []
+
+    def writer(n):
+        for i in range(WRITES_PER_THREAD):
+            config = manager.create_config_from_input({
+                'product_name': f"Product {n}-{i}",
+                'base_url': 'https://example.com',
+                'description': 'Concurrency test'
+            })
+            config_id = manager.add_custom_config(config)
+            with ids_lock:
+                ids.append(config_id)
+
+    def reader():
+        # Every body served must describe the config currently registered under that id
+        for _ in range(WRITES_PER_THREAD):
+            for config_id in list(manager.list_configs()):
+                body = manager.config_response_json(config_id)
+                config = manager.get_config(config_id)
+                if body is None or config.product_name.encode() not in body:
+                    errors.append(config_id)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, f"stale or missing bodies for {errors[:5]}"
+    assert len(set(ids)) == len(ids) == WRITERS * WRITES_PER_THREAD, "duplicate config ids"
+    assert len(manager.list_configs()) == initial + len(ids), "lost registry writes"
+
+    # Replacing a config under an existing id must not keep serving the old body
+    manager.config_response_json('giki_transport')
+    replacement = manager.create_config_from_input({
+        'product_name': 'Replacement Product',
+        'base_url': 'https://example.com',
+        'description': 'Replaces the default'
+    })
+    replacement.config_id = 'giki_transport'
+    manager.add_custom_config(replacement)
+    assert b'Replacement Product' in manager.config_response_json('giki_transport'), "stale body after replace"
+    print(f"  ✅ {len(ids)} concurrent adds, ids unique, bodies current")
+
+class _FakeSound:
+    """Stands in for a decoded pygame Sound (not JSON-serializable)"""
+
+class _FakeVoiceAgent:
+    def load_sound(self, text):
+        return _FakeSound()
+
+def test_live_session_with_preloaded_sound():
+    """A live session embedding a config with preloaded narration still encodes as JSON"""
+    print("🧪 Live session JSON with preloaded sounds")
+    from live_meeting_integration import LiveSession
+    from web_interface import app
+
+    manager = DemoConfigManager()
+    manager.preload_voice_scripts(_FakeVoiceAgent())
+    config = manager.get_config('giki_transport')
+    step = config.demo_steps[0]
+    assert isinstance(manager.preloaded_sound('giki_transport', 0, step), _FakeSound), "sound not preloaded"
+
+    session = LiveSession(session_id="test", created_at="now", provider="generic",
+                          meeting_info={}, demo_config=config)
+    body = app.json.dumps(session.to_dict())
+    assert config.product_name in body
+    print("  ✅ Session with preloaded sounds serializes")
+
+def test_oversized_post_rejected():
+    """Bodies past MAX_CONTENT_LENGTH get a 413 on every kind of route handler"""
+    print("🧪 Oversized POST bodies")
+    import web_interface
+    from web_interface import app
+
+    body = b'{"command": "' + b"x" * app.config['MAX_CONTENT_LENGTH'] + b'"}'
+    client = app.test_client()
+    # Generic handler, 500 handler, and _error_response (past the live meeting guard)
+    routes = ['/api/execute', '/api/demos/create', '/api/live-meeting/create']
+    manager, web_interface.live_demo_manager = web_interface.live_demo_manager, object()
+    try:
+        for route in routes:
+            response = client.post(route, data=body, content_type='application/json')
+            assert response.status_code == 413, f"{route}: {response.status_code}"
+    finally:
+        web_interface.live_demo_manager = manager
+    print(f"  ✅ {len(routes)} routes answer 413")
+
+if __name__ == "__main__":
+    test_atomic_ref_concurrent_swaps()
+    test_demo_config_concurrent_adds()
+    test_keyword_classifier_paths_agree()
+    test_live_session_with_preloaded_sound()
+    test_oversized_post_rejected()
+    print("\n✅ Matching and shared state tests completed!")
@@ -4,59 +4,427 @@ Modern web-based voice interface with good UI
 """
 
 import logging
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context
+from werkzeug.exceptions import HTTPException
+from werkzeug.serving import WSGIRequestHandler
 import os
+import base64
+import functools
+import hashlib
+import socket
 import threading
 import json
 import time
-from datetime import datetime
-from demo_config import demo_config_manager, ProductConfig
-from dynamic_demo_executor import DynamicDemoExecutor
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from demo_config import demo_config_manager, ProductConfig, DEMO_CONFIG_DIR
+from dynamic_demo_executor import DynamicDemoExecutor, driver_pool
 from live_meeting_integration import LiveDemoMeetingManager
+from keyword_matcher import KeywordClassifier
+from answer_cache import AnswerCache
+from app_state import AtomicRef, SystemState, VoiceRecordingState, DemoState, CustomDemoState
+
+# Optional push channel for state changes (clients fall back to polling without it)
+try:
+    from flask_socketio import SocketIO, emit
+    SOCKETIO_AVAILABLE = True
+except ImportError:
+    SOCKETIO_AVAILABLE = False
+
+# Optional response compression for the large demo config JSON
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Faster JSON for jsonify() and request.get_json() when orjson is installed
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask's JSON provider with encoding and decoding done by orjson"""
+        
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            # Flask's fallback still covers types orjson doesn't know (Decimal, __html__)
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+    
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging to reduce Flask output
 logging.getLogger('werkzeug').setLevel(logging.WARNING)
 
-from agents.voice_agent import VoiceAgent
-from agents.intent_parsing_agent import IntentParsingAgent
+from agents.voice_agent import VoiceAgent, AudioStreamTranscriber
+from agents.intent_parsing_agent import IntentParsingAgent, QA_MODEL
 from agents.browser_automation_agent_new import BrowserAutomationAgent
 
 app = Flask(__name__)
+# FLASK_DEV=1 turns on debug mode and template reloading; otherwise templates compile once
+FLASK_DEV = bool(os.environ.get('FLASK_DEV'))
+app.config['TEMPLATES_AUTO_RELOAD'] = FLASK_DEV
+app.jinja_env.auto_reload = FLASK_DEV
+# JSON bodies are parsed whole (orjson), so bound them: larger requests get 413 before any parsing
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
+if ORJSON_AVAILABLE:
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+# Compact, unsorted JSON even under debug=True (the API is read by scripts, not people)
+app.json.compact = True
+app.json.sort_keys = False
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    # Streamed responses (NDJSON progress) must flush line by line
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+# Threading mode keeps the blocking agent calls (Selenium, pygame) working unpatched;
+# gunicorn.conf.py switches it to gevent to match its workers
+SOCKETIO_ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'threading')
+socketio = SocketIO(app, async_mode=SOCKETIO_ASYNC_MODE) if SOCKETIO_AVAILABLE else None
 
 # Global agents
 voice_agent = None
 intent_agent = None
 browser_agent = None
-dynamic_demo = None
+# browser_agent.interactive_demo, resolved once when the agents are built
+interactive_demo = None
 live_demo_manager = None
-current_demo_config = None
+# The live meeting is one shared session: starting and ending it never overlap
+live_demo_lock = threading.Lock()
+
+# Dynamic demo executor and the custom config loaded into it, swapped as one snapshot
+custom_demo = AtomicRef(CustomDemoState())
 
 # System state
-system_state = {
-    "initialized": False,
-    "listening": False,
-    "last_command": "",
-    "last_response": "",
-    "error": None
-}
+system_state = AtomicRef(SystemState())
 
 # Global voice recording state
-voice_recording_state = {
-    "is_recording": False,
-    "transcription": "",
-    "error": None
-}
+voice_recording_state = AtomicRef(VoiceRecordingState())
+
+# The microphone is one device: a single ASR worker runs every server-side
+# transcription in order while request threads wait on its Future
+ASR_TIMEOUT = 60  # seconds, covers queueing plus listen timeout and phrase limit
+asr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+
+# Voice-command and demo sessions share a small pool instead of a new thread each
+SESSION_WORKERS = 4
+session_executor = ThreadPoolExecutor(max_workers=SESSION_WORKERS, thread_name_prefix="session")
+
+# Pending /api/listen transcriptions: job id -> (Future, submitted at)
+_voice_jobs = {}
+VOICE_JOB_TTL = 120  # seconds a finished job waits to be collected
+
+# Open microphone streams, keyed by Socket.IO session id
+asr_streams = {}
+
+# Repeated Q&A test questions skip the LLM round trip
+qa_answer_cache = AnswerCache()
 
 # Global demo state for interactive Q&A
-demo_state = {
-    "is_running": False,
-    "qa_enabled": False,
-    "demo_agent": None
+demo_state = AtomicRef(DemoState())
+
+# Set once initialize_agents() has built every agent; handlers never construct their own
+AGENTS_READY = threading.Event()
+
+_STATES = {
+    "system": system_state,
+    "voice_recording": voice_recording_state,
+    "demo": demo_state
 }
 
+SIGNIN_URL = "https://giktransport.giki.edu.pk:8038/auth/signin/"
+SIGNUP_URL = "https://giktransport.giki.edu.pk:8038/auth/signup/"
+
+# Command routing: the command is lower-cased once and each table is one scan
+_NAV_ROUTES = KeywordClassifier([
+    ("signin_nav", ("go to signin", "go to login", "navigate to signin")),
+    ("signup_nav", ("go to signup", "navigate to signup"))
+], whole_words=False)
+
+_EXACT_ROUTES = {
+    "signin": "signin", "sign in": "signin",
+    "signup": "signup", "sign up": "signup",
+    "show demo": "demo", "demo": "demo"
+}
+
+# Keyword routes applied after intent parsing (substring matches, like the old chain)
+_KEYWORD_ROUTES = KeywordClassifier([
+    ("question", ("what", "how")),
+    ("book", ("book",)),
+    ("ticket", ("ticket",)),
+    ("profile", ("profile",)),
+    ("demo", ("demo",))
+], whole_words=False)
+
+def _navigate_or_explain(url, message):
+    """Navigate to url, or report why there is nowhere to go"""
+    if url:
+        return browser_agent.navigate_to_url(url)
+    return {"success": False, "message": message}
+
+# Handlers take (command, argument from the routing decision) and always run
+_ROUTE_HANDLERS = {
+    "signin_nav": lambda command, arg: browser_agent.navigate_to_url(SIGNIN_URL),
+    "signup_nav": lambda command, arg: browser_agent.navigate_to_url(SIGNUP_URL),
+    "signin": lambda command, arg: browser_agent.handle_signin(),
+    "signup": lambda command, arg: browser_agent.handle_signup(),
+    # Use the interactive demo instead of automated demo
+    "demo": lambda command, arg: browser_agent.run_interactive_demo(),
+    "navigate": lambda command, arg: _navigate_or_explain(arg, "Could not determine where to navigate"),
+    "question": lambda command, arg: {"success": True, "message": intent_agent.answer_question(command)},
+    "book_ticket": lambda command, arg: browser_agent.click_book_ticket_button(),
+    "booking": lambda command, arg: browser_agent.handle_booking_flow(),
+    "tickets": lambda command, arg: browser_agent.check_tickets(),
+    "profile": lambda command, arg: browser_agent.check_profile(),
+    "automated_demo": lambda command, arg: browser_agent.run_automated_demo(),
+    # Default to navigation if we can find a URL
+    "fallback": lambda command, arg: _navigate_or_explain(arg, "I didn't understand that command. Try asking about GIKI Transport or use navigation commands like 'go to my profile' or 'book now'.")
+}
+
+# Routes decided from a successful intent parse, so repeated commands skip the LLM call.
+# Keyword-fallback parses (LLM timeout or error) are never stored.
+_command_routes = OrderedDict()
+_command_routes_lock = threading.Lock()
+COMMAND_ROUTE_CACHE_SIZE = 256
+
+def _classify_command(command):
+    """
+    Decide how to handle a command; the handlers themselves always run.
+    
+    Args:
+        command: Whitespace-normalized command text
+        
+    Returns:
+        (route name, intent label, route argument or None)
+    """
+    lowered = command.lower()
+    
+    # Explicit navigation and exact commands skip intent parsing
+    route = _NAV_ROUTES.classify(lowered) or _EXACT_ROUTES.get(lowered)
+    if route:
+        return route, route, None
+    
+    with _command_routes_lock:
+        decision = _command_routes.get(command)
+        if decision is not None:
+            _command_routes.move_to_end(command)
+            return decision
+    
+    intent_data = intent_agent.parse_command(command)
+    decision = _route_from_intent(command, lowered, intent_data)
+    
+    if not intent_data.get('fallback'):
+        with _command_routes_lock:
+            _command_routes[command] = decision
+            _command_routes.move_to_end(command)
+            while len(_command_routes) > COMMAND_ROUTE_CACHE_SIZE:
+                _command_routes.popitem(last=False)
+    return decision
+
+def _route_from_intent(command, lowered, intent_data):
+    """(route name, intent label, route argument or None) for a parsed intent"""
+    intent_type = intent_data.get('intent', 'unknown')
+    keywords = _KEYWORD_ROUTES.matches(lowered)
+    
+    if intent_type == 'navigate':
+        # Use the URL from the parsed intent or extract it
+        return 'navigate', intent_type, intent_data.get('target_url') or intent_agent.extract_url_from_command(command)
+    if intent_type == 'question' or 'question' in keywords:
+        return 'question', intent_type, None
+    if 'book' in keywords:
+        return ('book_ticket' if 'ticket' in keywords else 'booking'), intent_type, None
+    if 'ticket' in keywords:
+        return 'tickets', intent_type, None
+    if 'profile' in keywords:
+        return 'profile', intent_type, None
+    if 'demo' in keywords:
+        return 'automated_demo', intent_type, None
+    return 'fallback', intent_type, intent_agent.extract_url_from_command(command)
+
+def _route_command(command):
+    """
+    Run a typed or spoken command against the browser and intent agents.
+    
+    Args:
+        command: Raw command text
+        
+    Returns:
+        (result dict, intent label)
+    """
+    command = " ".join(command.split())
+    route, intent_type, arg = _classify_command(command)
+    return _ROUTE_HANDLERS[route](command, arg), intent_type
+
+def now_ms():
+    """Epoch milliseconds for response timestamps (browsers format them locally)"""
+    return time.time_ns() // 1_000_000
+
+def _transcribe():
+    """Queue a microphone transcription on the ASR worker and wait for the text"""
+    return asr_executor.submit(voice_agent.listen_and_transcribe).result(timeout=ASR_TIMEOUT)
+
+# Every possible demo status payload, keyed by (active, has_demo_agent); never mutated
+_DEMO_STATUSES = {
+    (active, has_demo_agent): {
+        "active": active,
+        "is_running": active,  # For backward compatibility
+        "qa_enabled": active,  # Q&A is enabled when demo is active
+        "has_demo_agent": has_demo_agent
+    }
+    for active in (False, True)
+    for has_demo_agent in (False, True)
+}
+
+def _demo_status():
+    """Current interactive demo status as exposed to clients"""
+    # The worker flag covers the gap before the interactive demo object exists
+    is_demo_active = demo_state.get().is_running or (
+        interactive_demo is not None and interactive_demo.demo_active
+    )
+    return _DEMO_STATUSES[bool(is_demo_active), browser_agent is not None]
+
+def _state_payload(name):
+    """JSON-safe snapshot of one state"""
+    if name == "demo":
+        return _demo_status()
+    return asdict(_STATES[name].get())
+
+def _set_state(name, **changes):
+    """Swap in an updated state snapshot and push a state_update event to connected clients"""
+    _STATES[name].update(**changes)
+    _push_state(name)
+
+def _claim_state(name, flag, **changes):
+    """
+    Set a boolean state flag (plus any other changes) unless it is already set.
+    
+    Returns:
+        True if this caller set the flag, False if another request already holds it
+    """
+    def claim(value):
+        return value if getattr(value, flag) else replace(value, **{flag: True}, **changes)
+    
+    # Test and set in one swap, so two concurrent requests can't both claim the flag
+    if getattr(_STATES[name].get_and_swap(claim), flag):
+        return False
+    _push_state(name)
+    return True
+
+def _push_state(name):
+    """Push the current snapshot of one state to connected clients"""
+    if socketio is not None:
+        try:
+            socketio.emit('state_update', {name: _state_payload(name)})
+        except Exception as e:
+            print(f"⚠️ State push failed: {e}")
+
+@functools.lru_cache(maxsize=128)
+def _brotli(body: bytes) -> bytes:
+    """Brotli form of a cached response body (each body is compressed once)"""
+    return brotli.compress(body, quality=4)
+
+def _json_body_response(body: bytes):
+    """Response for a pre-serialized JSON body, precompressed when the client accepts br"""
+    if BROTLI_AVAILABLE and 'br' in request.headers.get('Accept-Encoding', ''):
+        # Content-Encoding set here also tells Flask-Compress to leave it alone
+        response = Response(_brotli(body), mimetype='application/json')
+        response.headers['Content-Encoding'] = 'br'
+    else:
+        response = Response(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
+
+class NoDelayRequestHandler(WSGIRequestHandler):
+    """Dev-server handler with Nagle disabled, so small status responses go out immediately"""
+    
+    def setup(self):
+        super().setup()
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
+def _request_json():
+    """
+    Parsed JSON body of the current request ({} when empty).
+    
+    Raises werkzeug's RequestEntityTooLarge past MAX_CONTENT_LENGTH - routes let
+    HTTPException through their generic handlers so the client gets the 413.
+    """
+    # Decoded straight through app.json (orjson when installed), whatever the Content-Type
+    body = request.get_data(cache=False)
+    return app.json.loads(body) if body else {}
+
+def _constant_json(payload, status=200):
+    """
+    Encode a constant JSON payload once.
+    
+    Returns:
+        Function building a fresh Response over the pre-encoded bytes (Responses
+        are mutable, so one instance is never shared between requests)
+    """
+    body = app.json.dumps(payload).encode()
+    return lambda: Response(body, status=status, mimetype='application/json')
+
+# Live status payloads are re-encoded at most this often, however fast the UI polls
+STATUS_TTL = 0.25  # seconds
+_status_cache = {}  # name -> (monotonic time, encoded body)
+
+def _cached_status(name, build):
+    """JSON response for a status payload, rebuilt only when the cached body is older than STATUS_TTL"""
+    now = time.monotonic()
+    cached = _status_cache.get(name)
+    if cached is None or now - cached[0] >= STATUS_TTL:
+        cached = _status_cache[name] = (now, app.json.dumps(build()).encode())
+    return Response(cached[1], mimetype='application/json')
+
+def _invalidate_status():
+    """Drop cached status bodies after a request that changes the live session"""
+    _status_cache.clear()
+
+def _error_response(error, status=500):
+    """Standard failure response for an exception caught in a route"""
+    if isinstance(error, HTTPException):
+        raise error
+    return jsonify({'success': False, 'error': str(error)}), status
+
+# Guard responses for routes whose agents are missing
+SYSTEM_NOT_INITIALIZED = _constant_json({"success": False, "error": "System not initialized"})
+VOICE_NOT_AVAILABLE = _constant_json({'success': False, 'error': 'Voice agent not available'}, 500)
+LIVE_NOT_INITIALIZED = _constant_json({'success': False, 'error': 'Live meeting system not initialized'}, 500)
+LIVE_STATUS_NOT_INITIALIZED = _constant_json({'active': False, 'error': 'Live meeting system not initialized'})
+SCREEN_SHARE_NOT_INITIALIZED = _constant_json({'available': False, 'error': 'Live meeting system not initialized'})
+
+def _agents_not_ready():
+    """503 response for requests that arrive before the agents are built"""
+    error = system_state.get().error
+    return jsonify({
+        "success": False,
+        "error": f"Agents failed to initialize: {error}" if error else "Agents are warming up"
+    }), 503
+
 def initialize_agents():
     """Initialize all agents"""
-    global voice_agent, intent_agent, browser_agent, dynamic_demo, system_state
+    global voice_agent, intent_agent, browser_agent, interactive_demo
     
     try:
         print("🔄 Initializing agents...")
@@ -67,199 +435,261 @@ def initialize_agents():
         
         # Set the agents for the browser agent
         browser_agent.set_agents(voice_agent, intent_agent)
+        interactive_demo = getattr(browser_agent, 'interactive_demo', None)
         
         # Initialize Dynamic Demo Executor
-        dynamic_demo = DynamicDemoExecutor(voice_agent)
+        dynamic_demo = custom_demo.update(executor=DynamicDemoExecutor(voice_agent)).executor
+        if driver_pool.size:
+            threading.Thread(target=driver_pool.warm, daemon=True).start()
         
         # Initialize Live Demo Meeting Manager
         global live_demo_manager
         live_demo_manager = LiveDemoMeetingManager(voice_agent, dynamic_demo)
         
-        system_state["initialized"] = True
-        system_state["error"] = None
+        _set_state("system", initialized=True, error=None)
+        AGENTS_READY.set()
         
         print("✅ All agents initialized successfully!")
         
+        # Warm the TTS cache with the static demo scripts and Q&A fallback answers
+        demo_config_manager.preload_voice_scripts(voice_agent)
+        voice_agent.preload_phrases([answer for _, answer in QA_FALLBACK_ANSWERS] + [QA_DEFAULT_ANSWER])
+        
     except Exception as e:
-        system_state["error"] = str(e)
+        _set_state("system", error=str(e))
         print(f"❌ Error initializing agents: {e}")
 
 @app.route('/')
 def index():
     """Main page"""
-    return render_template('index.html')
+    return render_template('index.html', socketio_enabled=SOCKETIO_AVAILABLE)
 
 @app.route('/api/status')
 def get_status():
     """Get system status"""
-    return jsonify(system_state)
+    return jsonify(asdict(system_state.get()))
+
+if socketio is not None:
+    @socketio.on('connect')
+    def on_connect():
+        """Send the full state to a newly connected client"""
+        emit('state_update', {name: _state_payload(name) for name in _STATES})
+    
+    @socketio.on('tts_request')
+    def on_tts_request(data):
+        """Stream synthesized speech for an answer back to the requesting client"""
+        data = data or {}
+        text = data.get('text', '').strip()
+        if not text:
+            emit('tts_error', {'id': data.get('id'), 'error': 'No text provided'})
+            return
+        if not AGENTS_READY.is_set():
+            emit('tts_error', {'id': data.get('id'), 'error': 'Agents are warming up'})
+            return
+        socketio.start_background_task(_stream_tts, request.sid, data.get('id'), text)
+    
+    @socketio.on('qa_request')
+    def on_qa_request(data):
+        """Answer a Q&A test question, streaming tokens and audio back to the client"""
+        data = data or {}
+        question = data.get('question', '').strip()
+        if not question:
+            emit('qa_answer', {'id': data.get('id'), 'error': 'No question provided'})
+            return
+        if not AGENTS_READY.is_set():
+            emit('qa_answer', {'id': data.get('id'), 'error': 'Agents are warming up'})
+            return
+        socketio.start_background_task(_stream_qa_answer, request.sid, data.get('id'), question)
+    
+    @socketio.on('start_stream')
+    def on_start_stream(data):
+        """Open an incremental transcription stream for this client"""
+        if not AGENTS_READY.is_set():
+            emit('final', {'text': '', 'is_final': True, 'error': 'Agents are warming up'})
+            return
+        
+        sid = request.sid
+        try:
+            previous = asr_streams.pop(sid, None)
+            if previous:
+                previous.close()
+            
+            def on_partial(text):
+                socketio.emit('partial', {'text': text, 'is_final': False}, to=sid)
+            
+            sample_rate = int((data or {}).get('sample_rate', 16000))
+            asr_streams[sid] = AudioStreamTranscriber(voice_agent, sample_rate, on_partial)
+            _set_state("voice_recording", is_recording=True, transcription="", error=None)
+            print("🎙️ Started streaming voice recording")
+        except Exception as e:
+            print(f"❌ Voice stream start error: {str(e)}")
+            emit('final', {'text': '', 'is_final': True, 'error': str(e)})
+    
+    @socketio.on('audio_chunk')
+    def on_audio_chunk(chunk):
+        """Append a 16-bit PCM chunk to the client's open stream"""
+        stream = asr_streams.get(request.sid)
+        if stream is not None and chunk:
+            stream.push(chunk)
+    
+    @socketio.on('commit')
+    def on_commit():
+        """Finish the client's utterance and send back the final transcript"""
+        stream = asr_streams.pop(request.sid, None)
+        if stream is None:
+            emit('final', {'text': '', 'is_final': True, 'error': 'Not currently recording'})
+            return
+        socketio.start_background_task(_finish_asr_stream, request.sid, stream)
+    
+    @socketio.on('disconnect')
+    def on_disconnect():
+        """Drop any stream the client left open"""
+        stream = asr_streams.pop(request.sid, None)
+        if stream is not None:
+            stream.close()
+
+def _finish_asr_stream(sid, stream):
+    """Transcribe a committed stream and emit the final text"""
+    try:
+        transcription = stream.commit()
+        print(f"📝 Transcribed: {transcription}")
+        _set_state("voice_recording", is_recording=False, transcription=transcription)
+        socketio.emit('final', {'text': transcription, 'is_final': True}, to=sid)
+    except Exception as e:
+        print(f"⚠️ Transcription error: {e}")
+        _set_state("voice_recording", is_recording=False, error=str(e))
+        socketio.emit('final', {'text': '', 'is_final': True, 'error': str(e)}, to=sid)
+
+def _emit_audio(sid, stream_id, chunks):
+    """Send MP3 chunks to one client as base64 tts_chunk events, then tts_done"""
+    count = 0
+    for chunk in chunks:
+        socketio.emit('tts_chunk', {
+            'id': stream_id,
+            'seq': count,
+            'audio': base64.b64encode(chunk).decode('ascii')
+        }, to=sid)
+        count += 1
+    
+    if count:
+        socketio.emit('tts_done', {'id': stream_id, 'chunks': count}, to=sid)
+    else:
+        socketio.emit('tts_error', {'id': stream_id, 'error': 'TTS not available'}, to=sid)
+
+def _stream_tts(sid, stream_id, text):
+    """Emit base64 MP3 chunks to one client as they come back from TTS"""
+    try:
+        print(f"🔊 Streaming answer: {text[:30]}{'...' if len(text) > 30 else ''}")
+        _emit_audio(sid, stream_id, voice_agent.speak_response_stream(text))
+    except Exception as e:
+        print(f"❌ TTS stream error: {str(e)}")
+        socketio.emit('tts_error', {'id': stream_id, 'error': str(e)}, to=sid)
+
+def _stream_qa_answer(sid, stream_id, question):
+    """
+    Answer a Q&A test question with LLM tokens piped straight into streaming TTS,
+    so audio starts before the answer is complete
+    """
+    print(f"📝 Q&A Test - Question: {question}")
+    
+    answer = qa_answer_cache.lookup(question)
+    if answer is not None:
+        socketio.emit('qa_answer', {'id': stream_id, 'answer': answer}, to=sid)
+        _stream_tts(sid, stream_id, answer)
+        return
+    
+    tokens = []
+    
+    def answer_tokens():
+        for token in intent_agent.stream_completion(
+            f"GIKI Transport question: {question}",
+            system=QA_SYSTEM_PROMPT,
+            max_tokens=QA_MAX_TOKENS,
+            temperature=0.3,
+            model=QA_MODEL,
+            stop=QA_STOP
+        ):
+            tokens.append(token)
+            socketio.emit('qa_token', {'id': stream_id, 'text': token}, to=sid)
+            yield token
+    
+    try:
+        _emit_audio(sid, stream_id, voice_agent.stream_text_to_speech(answer_tokens()))
+        answer = "".join(tokens).strip()
+        if answer:
+            qa_answer_cache.store(question, answer)
+        print(f"💡 Generated answer: {answer}")
+        socketio.emit('qa_answer', {'id': stream_id, 'answer': answer}, to=sid)
+    except Exception as e:
+        if tokens:
+            print(f"❌ Q&A stream error: {str(e)}")
+            socketio.emit('qa_answer', {'id': stream_id, 'answer': "".join(tokens).strip()}, to=sid)
+            socketio.emit('tts_error', {'id': stream_id, 'error': str(e)}, to=sid)
+            return
+        print(f"⚠️ LLM error: {e}")
+        answer = _fallback_qa_answer(question)
+        socketio.emit('qa_answer', {'id': stream_id, 'answer': answer}, to=sid)
+        _stream_tts(sid, stream_id, answer)
 
 @app.route('/api/execute', methods=['POST'])
 def execute_command():
     """Execute a command"""
-    global system_state
-    
     try:
-        data = request.get_json()
+        data = _request_json()
         command = data.get('command', '').strip()
         
         if not command:
             return jsonify({"success": False, "error": "No command provided"})
         
-        if not system_state["initialized"]:
-            return jsonify({"success": False, "error": "System not initialized"})
+        if not system_state.get().initialized:
+            return SYSTEM_NOT_INITIALIZED()
         
         # Update state
-        system_state["last_command"] = command
-        
-        # Handle explicit navigation commands FIRST (before intent parsing)
-        if 'go to signin' in command.lower() or 'go to login' in command.lower() or 'navigate to signin' in command.lower():
-            result = browser_agent.navigate_to_url("https://giktransport.giki.edu.pk:8038/auth/signin/")
+        _set_state("system", last_command=command)
         
-        elif 'go to signup' in command.lower() or 'navigate to signup' in command.lower():
-            result = browser_agent.navigate_to_url("https://giktransport.giki.edu.pk:8038/auth/signup/")
-        
-        elif command.lower() == 'signin' or command.lower() == 'sign in':
-            result = browser_agent.handle_signin()
-        
-        elif command.lower() == 'signup' or command.lower() == 'sign up':
-            result = browser_agent.handle_signup()
-        
-        elif command.lower() == 'show demo' or command.lower() == 'demo':
-            # Use the interactive demo instead of automated demo
-            result = browser_agent.run_interactive_demo()
-        
-        else:
-            # Parse intent for other commands
-            intent_data = intent_agent.parse_command(command)
-            intent_type = intent_data.get('intent', 'unknown')
-            
-            # Execute command based on intent
-            if intent_type == 'navigate':
-                # Use the URL from the parsed intent or extract it
-                target_url = intent_data.get('target_url') or intent_agent.extract_url_from_command(command)
-                if target_url:
-                    result = browser_agent.navigate_to_url(target_url)
-                else:
-                    result = {"success": False, "message": "Could not determine where to navigate"}
-            
-            elif intent_type == 'question' or 'what' in command.lower() or 'how' in command.lower():
-                answer = intent_agent.answer_question(command)
-                result = {"success": True, "message": answer}
-            
-            elif 'book' in command.lower():
-                if 'ticket' in command.lower():
-                    result = browser_agent.click_book_ticket_button()
-                else:
-                    result = browser_agent.handle_booking_flow()
-            
-            elif 'ticket' in command.lower():
-                result = browser_agent.check_tickets()
-            
-            elif 'profile' in command.lower():
-                result = browser_agent.check_profile()
-            
-            else:
-                # Default to navigation if we can find a URL
-                url = intent_agent.extract_url_from_command(command)
-                if url:
-                    result = browser_agent.navigate_to_url(url)
-                else:
-                    result = {"success": False, "message": "I didn't understand that command. Try asking about GIKI Transport or use navigation commands like 'go to my profile' or 'book now'."}
+        result, intent_type = _route_command(command)
         
         # Get response message
         response_message = result.get('message', 'Command executed')
-        system_state["last_response"] = response_message
+        _set_state("system", last_response=response_message)
         
         return jsonify({
             "success": result.get('success', False),
             "message": response_message,
             "intent": intent_type,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_ms()
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         error_msg = f"Error executing command: {str(e)}"
-        system_state["error"] = error_msg
+        _set_state("system", error=error_msg)
         return jsonify({"success": False, "error": error_msg})
 
 @app.route('/api/voice/start', methods=['POST'])
 def start_voice():
     """Start voice listening"""
-    global system_state
-    
     try:
-        if not system_state["initialized"]:
-            return jsonify({"success": False, "error": "System not initialized"})
+        if not system_state.get().initialized:
+            return SYSTEM_NOT_INITIALIZED()
         
-        if system_state["listening"]:
+        if not _claim_state("system", "listening"):
             return jsonify({"success": False, "error": "Already listening"})
         
         # Start voice recognition in background
         def voice_worker():
             try:
-                system_state["listening"] = True
-                command = voice_agent.get_voice_input()
-                system_state["listening"] = False
+                command = _transcribe()
+                _set_state("system", listening=False)
                 
                 if command and command.strip():
-                    system_state["last_command"] = command
-                    
-                    # Use same command handling as execute_command
-                    # Handle explicit navigation commands FIRST
-                    if 'go to signin' in command.lower() or 'go to login' in command.lower() or 'navigate to signin' in command.lower():
-                        result = browser_agent.navigate_to_url("https://giktransport.giki.edu.pk:8038/auth/signin/")
+                    _set_state("system", last_command=command)
                     
-                    elif 'go to signup' in command.lower() or 'navigate to signup' in command.lower():
-                        result = browser_agent.navigate_to_url("https://giktransport.giki.edu.pk:8038/auth/signup/")
-                    
-                    elif command.lower() == 'signin' or command.lower() == 'sign in':
-                        result = browser_agent.handle_signin()
-                    
-                    elif command.lower() == 'signup' or command.lower() == 'sign up':
-                        result = browser_agent.handle_signup()
-                    
-                    else:
-                        # Parse intent for other commands
-                        intent_data = intent_agent.parse_command(command)
-                        intent_type = intent_data.get('intent', 'unknown')
-                        
-                        # Execute command based on intent
-                        if intent_type == 'navigate':
-                            target_url = intent_data.get('target_url') or intent_agent.extract_url_from_command(command)
-                            if target_url:
-                                result = browser_agent.navigate_to_url(target_url)
-                            else:
-                                result = {"success": False, "message": "Could not determine where to navigate"}
-                        
-                        elif intent_type == 'question' or 'what' in command.lower() or 'how' in command.lower():
-                            answer = intent_agent.answer_question(command)
-                            result = {"success": True, "message": answer}
-                        
-                        elif 'book' in command.lower():
-                            if 'ticket' in command.lower():
-                                result = browser_agent.click_book_ticket_button()
-                            else:
-                                result = browser_agent.handle_booking_flow()
-                        
-                        elif 'ticket' in command.lower():
-                            result = browser_agent.check_tickets()
-                        
-                        elif 'profile' in command.lower():
-                            result = browser_agent.check_profile()
-                        
-                        elif 'demo' in command.lower() or 'show demo' in command.lower():
-                            result = browser_agent.run_automated_demo()
-                        
-                        else:
-                            url = intent_agent.extract_url_from_command(command)
-                            if url:
-                                result = browser_agent.navigate_to_url(url)
-                            else:
-                                result = {"success": False, "message": "I didn't understand that command."}
+                    result, _ = _route_command(command)
                     
                     response_message = result.get('message', 'Command executed')
-                    system_state["last_response"] = response_message
+                    _set_state("system", last_response=response_message)
                     
                     # Speak response simply
                     if result.get('success'):
@@ -269,11 +699,14 @@ def start_voice():
                             print(f"TTS error: {e}")
                 
             except Exception as e:
-                system_state["listening"] = False
-                system_state["error"] = str(e)
+                _set_state("system", listening=False, error=str(e))
                 print(f"Voice recognition error: {e}")
         
-        threading.Thread(target=voice_worker, daemon=True).start()
+        try:
+            session_executor.submit(voice_worker)
+        except Exception:
+            _set_state("system", listening=False)
+            raise
         
         return jsonify({"success": True, "message": "Voice recognition started"})
         
@@ -283,9 +716,7 @@ def start_voice():
 @app.route('/api/voice/stop', methods=['POST'])
 def stop_voice():
     """Stop voice listening"""
-    global system_state
-    
-    system_state["listening"] = False
+    _set_state("system", listening=False)
     
     # Stop any playing audio
     try:
@@ -299,17 +730,55 @@ def stop_voice():
 @app.route('/qa_test_page')
 def qa_test_page():
     """Serve the Q&A testing page"""
-    return render_template('qa_test.html')
+    return render_template('qa_test.html', socketio_enabled=SOCKETIO_AVAILABLE)
+
+QA_SYSTEM_PROMPT = "Answer in exactly 1-2 short sentences about GIKI Transport. Be very concise and clear."
+QA_MAX_TOKENS = 25  # Very short answers
+QA_STOP = ["\n\n"]
+
+def _generate_qa_answer(question):
+    """Ask the LLM for a 1-2 sentence answer to a Q&A test question"""
+    # Through _chat so the pooled client, retries and service tier apply here too
+    response = intent_agent._chat(
+        [{"role": "user", "content": f"GIKI Transport question: {question}"}],
+        system=QA_SYSTEM_PROMPT,
+        model=QA_MODEL,
+        max_tokens=QA_MAX_TOKENS,
+        temperature=0.3,
+        stop=QA_STOP
+    )
+    return response.choices[0].message.content.strip()
+
+# Short canned answers used when the LLM is unavailable (first keyword match wins);
+# their audio is synthesized at start-up so speaking them never waits on TTS
+QA_FALLBACK_ANSWERS = (
+    ('book', "Use voice commands to book tickets instantly."),
+    ('voice', "Complete voice control for all features."),
+    ('profile', "Manage account settings and information."),
+    ('ticket', "View and manage your transport tickets."),
+    ('dashboard', "Central hub for all transport services.")
+)
+QA_DEFAULT_ANSWER = "GIKI Transport offers comprehensive transport services."
+
+def _fallback_qa_answer(question):
+    """Short canned answer used when the LLM is unavailable"""
+    question = question.lower()
+    for keyword, answer in QA_FALLBACK_ANSWERS:
+        if keyword in question:
+            return answer
+    return QA_DEFAULT_ANSWER
 
 @app.route('/qa_test', methods=['POST'])
 def qa_test():
     """Handle Q&A testing requests"""
-    global voice_agent, intent_agent
+    if not AGENTS_READY.is_set():
+        return _agents_not_ready()
     
     try:
-        data = request.get_json()
+        data = _request_json()
         question = data.get('question', '').strip()
         volume = int(data.get('volume', 80))
+        stream_audio = data.get('stream_audio', False)
         
         if not question:
             return jsonify({
@@ -319,67 +788,37 @@ def qa_test():
         
         print(f"📝 Q&A Test - Question: {question}")
         
-        # Initialize agents if needed
-        if not intent_agent:
-            intent_agent = IntentParsingAgent()
-        if not voice_agent:
-            voice_agent = VoiceAgent()
-            
         # Set volume (0-100 to 0.0-1.0)
         voice_agent.volume = volume / 100.0
         
-        # Generate short answer using LLM
+        # Generate short answer using LLM (cached by question)
         try:
-            response = intent_agent.groq_client.chat.completions.create(
-                model="llama3-8b-8192",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "Answer in exactly 1-2 short sentences about GIKI Transport. Be very concise and clear."
-                    },
-                    {
-                        "role": "user", 
-                        "content": f"GIKI Transport question: {question}"
-                    }
-                ],
-                max_tokens=40,  # Very short answers
-                temperature=0.3
-            )
-            answer = response.choices[0].message.content.strip()
+            answer = qa_answer_cache.get_or_create(question, lambda: _generate_qa_answer(question))
         except Exception as llm_error:
             print(f"⚠️ LLM error: {llm_error}")
-            # Short fallback answers
-            if 'book' in question.lower():
-                answer = "Use voice commands to book tickets instantly."
-            elif 'voice' in question.lower():
-                answer = "Complete voice control for all features."
-            elif 'profile' in question.lower():
-                answer = "Manage account settings and information."
-            elif 'ticket' in question.lower():
-                answer = "View and manage your transport tickets."
-            elif 'dashboard' in question.lower():
-                answer = "Central hub for all transport services."
-            else:
-                answer = "GIKI Transport offers comprehensive transport services."
+            answer = _fallback_qa_answer(question)
         
         print(f"💡 Generated answer: {answer}")
         
-        # Speak the answer
-        try:
-            print("🔊 Speaking answer...")
-            voice_agent.speak_response(answer)
-            print("✅ Answer spoken")
-            
-        except Exception as tts_error:
-            print(f"⚠️ TTS error: {tts_error}")
+        # The browser requests the audio over the socket (tts_request) when it can
+        if not (stream_audio and SOCKETIO_AVAILABLE):
+            try:
+                print("🔊 Speaking answer...")
+                voice_agent.speak_response(answer)
+                print("✅ Answer spoken")
+                
+            except Exception as tts_error:
+                print(f"⚠️ TTS error: {tts_error}")
         
         return jsonify({
             "success": True,
             "question": question,
             "answer": answer,
-            "timestamp": datetime.now().strftime("%H:%M:%S")
+            "timestamp": now_ms()
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Q&A test error: {str(e)}")
         return jsonify({
@@ -390,15 +829,11 @@ def qa_test():
 @app.route('/start_voice_recording', methods=['POST'])
 def start_voice_recording():
     """Start voice recording for Q&A"""
-    global voice_recording_state, voice_agent
+    if not AGENTS_READY.is_set():
+        return _agents_not_ready()
     
     try:
-        if not voice_agent:
-            voice_agent = VoiceAgent()
-            
-        voice_recording_state["is_recording"] = True
-        voice_recording_state["transcription"] = ""
-        voice_recording_state["error"] = None
+        _set_state("voice_recording", is_recording=True, transcription="", error=None)
         
         print("🎙️ Started voice recording for Q&A")
         
@@ -417,23 +852,21 @@ def start_voice_recording():
 @app.route('/stop_voice_recording', methods=['POST'])
 def stop_voice_recording():
     """Stop voice recording and get transcription"""
-    global voice_recording_state, voice_agent
-    
     try:
-        if not voice_recording_state["is_recording"]:
+        if not voice_recording_state.get().is_recording:
             return jsonify({
                 "success": False,
                 "error": "Not currently recording"
             })
         
-        voice_recording_state["is_recording"] = False
+        _set_state("voice_recording", is_recording=False)
         print("🎙️ Stopping voice recording and transcribing...")
         
         # Get transcription
         if voice_agent:
             try:
-                transcription = voice_agent.listen_and_transcribe()
-                voice_recording_state["transcription"] = transcription
+                transcription = _transcribe()
+                _set_state("voice_recording", transcription=transcription)
                 
                 print(f"📝 Transcribed: {transcription}")
                 
@@ -463,11 +896,15 @@ def stop_voice_recording():
 
 @app.route('/play_answer', methods=['POST'])
 def play_answer():
-    """Play an answer using TTS"""
-    global voice_agent
+    """
+    Play an answer using TTS on the server.
+    Deprecated: clients with Socket.IO stream audio via the tts_request event.
+    """
+    if not AGENTS_READY.is_set():
+        return _agents_not_ready()
     
     try:
-        data = request.get_json()
+        data = _request_json()
         answer = data.get('answer', '').strip()
         volume = int(data.get('volume', 80))
         
@@ -477,9 +914,6 @@ def play_answer():
                 "error": "No answer provided"
             })
         
-        if not voice_agent:
-            voice_agent = VoiceAgent()
-            
         # Set volume
         voice_agent.volume = volume / 100.0
         
@@ -494,6 +928,8 @@ def play_answer():
             "message": "Answer played successfully"
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Answer playback error: {str(e)}")
         return jsonify({
@@ -504,10 +940,11 @@ def play_answer():
 @app.route('/api/demo/start', methods=['POST'])
 def start_interactive_demo():
     """Start the interactive demo with Q&A support"""
-    global demo_state, browser_agent, voice_agent, intent_agent
+    if not AGENTS_READY.is_set():
+        return _agents_not_ready()
     
     try:
-        if demo_state["is_running"]:
+        if not _claim_state("demo", "is_running", qa_enabled=True, demo_agent=browser_agent):
             return jsonify({
                 "success": False,
                 "error": "Demo is already running"
@@ -515,45 +952,31 @@ def start_interactive_demo():
         
         print("🎬 Starting interactive demo with Q&A support...")
         
-        # Initialize agents if needed
-        if not browser_agent:
-            browser_agent = BrowserAutomationAgent()
-        if not voice_agent:
-            voice_agent = VoiceAgent()
-        if not intent_agent:
-            intent_agent = IntentParsingAgent()
-        
-        # Set agents for interactive demo
-        browser_agent.set_agents(voice_agent, intent_agent)
-        
         # Start demo in background
         def demo_worker():
             try:
                 print("🎬 Demo worker starting...")
-                demo_state["is_running"] = True
-                demo_state["qa_enabled"] = True
-                demo_state["demo_agent"] = browser_agent
                 
                 print("🎬 Calling run_interactive_demo...")
                 result = browser_agent.run_interactive_demo()
                 print(f"🎬 Demo result: {result}")
                 
-                demo_state["is_running"] = False
-                demo_state["qa_enabled"] = False
-                demo_state["demo_agent"] = None
+                _set_state("demo", is_running=False, qa_enabled=False, demo_agent=None)
                 
                 print("✅ Interactive demo completed")
                 
             except Exception as e:
-                demo_state["is_running"] = False
-                demo_state["qa_enabled"] = False
-                demo_state["demo_agent"] = None
+                _set_state("demo", is_running=False, qa_enabled=False, demo_agent=None)
                 print(f"❌ Demo error: {str(e)}")
                 import traceback
                 traceback.print_exc()
         
-        print("🎬 Starting demo worker thread...")
-        threading.Thread(target=demo_worker, daemon=True).start()
+        print("🎬 Queueing demo worker...")
+        try:
+            session_executor.submit(demo_worker)
+        except Exception:
+            _set_state("demo", is_running=False, qa_enabled=False, demo_agent=None)
+            raise
         
         return jsonify({
             "success": True,
@@ -570,16 +993,15 @@ def start_interactive_demo():
 @app.route('/api/demo/question', methods=['POST'])
 def ask_demo_question():
     """Ask a question during the demo"""
-    global demo_state, voice_agent
-    
     try:
-        if not demo_state["is_running"] or not demo_state["qa_enabled"]:
+        demo = demo_state.get()
+        if not demo.is_running or not demo.qa_enabled:
             return jsonify({
                 "success": False,
                 "error": "Demo is not running or Q&A is not enabled"
             })
         
-        data = request.get_json()
+        data = _request_json()
         question = data.get('question', '').strip()
         use_voice = data.get('use_voice', False)
         volume = int(data.get('volume', 80))
@@ -595,7 +1017,7 @@ def ask_demo_question():
             try:
                 if voice_agent:
                     voice_agent.volume = volume / 100.0
-                    question = voice_agent.listen_and_transcribe()
+                    question = _transcribe()
                     if not question:
                         return jsonify({
                             "success": False,
@@ -615,8 +1037,8 @@ def ask_demo_question():
         print(f"🤔 Demo question received: {question}")
         
         # Handle the question during demo - use the interactive demo directly
-        if browser_agent and hasattr(browser_agent, 'interactive_demo') and browser_agent.interactive_demo:
-            result = browser_agent.interactive_demo.handle_demo_question(question)
+        if interactive_demo is not None:
+            result = interactive_demo.handle_demo_question(question)
             
             if result["success"]:
                 return jsonify({
@@ -624,7 +1046,7 @@ def ask_demo_question():
                     "question": question,
                     "answer": result["answer"],
                     "demo_step": result.get("demo_step", 0),
-                    "timestamp": result.get("timestamp", "")
+                    "timestamp": result.get("timestamp") or now_ms()
                 })
             else:
                 return jsonify({
@@ -653,7 +1075,7 @@ def ask_demo_question():
                     "question": question,
                     "answer": answer,
                     "demo_step": 0,
-                    "timestamp": time.strftime("%H:%M:%S")
+                    "timestamp": now_ms()
                 })
             except Exception as fallback_error:
                 return jsonify({
@@ -661,6 +1083,8 @@ def ask_demo_question():
                     "error": f"Fallback Q&A failed: {str(fallback_error)}"
                 })
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ Demo question error: {str(e)}")
         return jsonify({
@@ -671,36 +1095,18 @@ def ask_demo_question():
 @app.route('/api/demo/status')
 def get_demo_status():
     """Get current demo status"""
-    global browser_agent
-    
-    # Check if interactive demo is actually running
-    is_demo_active = False
-    qa_enabled = False
-    
-    if browser_agent and hasattr(browser_agent, 'interactive_demo') and browser_agent.interactive_demo:
-        is_demo_active = browser_agent.interactive_demo.demo_active
-        qa_enabled = is_demo_active  # Q&A is enabled when demo is active
-    
-    return jsonify({
-        "active": is_demo_active,
-        "is_running": is_demo_active,  # For backward compatibility
-        "qa_enabled": qa_enabled,
-        "has_demo_agent": browser_agent is not None
-    })
+    return jsonify(_demo_status())
 
 @app.route('/api/demo/stop', methods=['POST'])
 def stop_demo():
     """Stop the interactive demo"""
-    global demo_state
     try:
-        if demo_state.get('active', False):
-            demo_state['active'] = False
-            demo_state['paused'] = False
-            demo_state['current_step'] = 0
+        if _demo_status()["active"]:
+            _set_state("demo", is_running=False, qa_enabled=False)
             
             # Stop the demo in the browser agent
-            if hasattr(browser_agent, 'interactive_demo') and browser_agent.interactive_demo:
-                browser_agent.interactive_demo.stop_demo()
+            if interactive_demo is not None:
+                interactive_demo.stop_demo()
             
             return jsonify({
                 'success': True,
@@ -742,7 +1148,7 @@ def list_demos():
 def create_demo():
     """Create new demo configuration"""
     try:
-        data = request.json
+        data = _request_json()
         
         # Validate required fields
         required_fields = ['product_name', 'base_url', 'description', 'steps']
@@ -758,12 +1164,8 @@ def create_demo():
         config_id = demo_config_manager.add_custom_config(config)
         
         # Optionally save to file
-        import os
-        config_dir = 'demo_configs'
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-        
-        filename = f"{config_dir}/{config_id}.json"
+        os.makedirs(DEMO_CONFIG_DIR, exist_ok=True)
+        filename = os.path.join(DEMO_CONFIG_DIR, f"{config_id}.json")
         demo_config_manager.save_config_to_file(config, filename)
         
         return jsonify({
@@ -772,6 +1174,8 @@ def create_demo():
             'message': 'Demo configuration created successfully'
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         return jsonify({
             'success': False,
@@ -782,38 +1186,15 @@ def create_demo():
 def get_demo_config(config_id):
     """Get specific demo configuration"""
     try:
-        config = demo_config_manager.get_config(config_id)
-        if not config:
+        # Body is serialized once per config and reused until a config is added
+        body = demo_config_manager.config_response_json(config_id)
+        if body is None:
             return jsonify({
                 'success': False,
                 'message': 'Demo configuration not found'
             }), 404
         
-        # Convert config to dictionary for JSON response
-        config_dict = {
-            'product_name': config.product_name,
-            'base_url': config.base_url,
-            'description': config.description,
-            'welcome_message': config.welcome_message,
-            'closing_message': config.closing_message,
-            'login_credentials': config.login_credentials,
-            'demo_steps': [
-                {
-                    'name': step.name,
-                    'description': step.description,
-                    'url': step.url,
-                    'action_type': step.action_type,
-                    'wait_time': step.wait_time,
-                    'voice_script': step.voice_script
-                }
-                for step in config.demo_steps
-            ]
-        }
-        
-        return jsonify({
-            'success': True,
-            'config': config_dict
-        })
+        return _json_body_response(body)
         
     except Exception as e:
         return jsonify({
@@ -825,7 +1206,7 @@ def get_demo_config(config_id):
 def run_custom_demo():
     """Run a specific demo configuration"""
     try:
-        data = request.json
+        data = _request_json()
         config_id = data.get('demo_id')
         
         if not config_id:
@@ -841,13 +1222,14 @@ def run_custom_demo():
                 'message': 'Demo configuration not found'
             }), 404
         
-        # Update the dynamic demo with new configuration
-        global dynamic_demo, current_demo_config
-        if dynamic_demo:
-            dynamic_demo.set_demo_config(config)
+        # Load the config into the dynamic demo and record it in one step,
+        # so concurrent runs can't leave the executor and the record disagreeing
+        def load_config(state):
+            if state.executor:
+                state.executor.set_demo_config(config)
+            return replace(state, config=config)
         
-        # Store current demo config globally
-        current_demo_config = config
+        custom_demo.swap(load_config)
         
         return jsonify({
             'success': True,
@@ -855,6 +1237,8 @@ def run_custom_demo():
             'redirect': '/'
         })
         
+    except HTTPException:
+        raise
     except Exception as e:
         return jsonify({
             'success': False,
@@ -862,74 +1246,102 @@ def run_custom_demo():
         }), 500
 
 # Live Meeting API
+@functools.cache
+def _static_page(template):
+    """(html, etag) of a template with no per-request context, rendered once"""
+    html = render_template(template)
+    return html, hashlib.md5(html.encode()).hexdigest()
+
 @app.route('/live-demo')
 def live_demo_page():
-    return render_template('live_demo.html')
+    if FLASK_DEV:
+        return render_template('live_demo.html')
+    
+    html, etag = _static_page('live_demo.html')
+    response = Response(html, mimetype='text/html')
+    # Repeat visits get a 304 while the page is unchanged
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @app.route('/api/live-meeting/create', methods=['POST'])
 def create_live_meeting():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
-        data = request.get_json()
+            return LIVE_NOT_INITIALIZED()
+        data = _request_json()
         provider = data.get('provider', 'google_meet')
         demo_config_id = data.get('demo_config_id')
         customer_info = data.get('customer_info', {})
         demo_config = demo_config_manager.get_config(demo_config_id) if demo_config_id else None
         result = live_demo_manager.create_demo_meeting(provider, demo_config, customer_info)
+        _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/live-meeting/start', methods=['POST'])
 def start_live_meeting():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
-        data = request.get_json()
-        result = live_demo_manager.start_live_demo(data.get('join_meeting', True))
+            return LIVE_NOT_INITIALIZED()
+        data = _request_json()
+        with live_demo_lock:
+            result = live_demo_manager.start_live_demo(data.get('join_meeting', True))
+            _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/live-meeting/run-demo', methods=['POST'])
 def run_live_demo():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
+            return LIVE_NOT_INITIALIZED()
         result = live_demo_manager.run_live_demo()
+        _invalidate_status()
+        
+        # Clients that ask for NDJSON get the start result, then a line per progress update
+        if result.get('success') and request.accept_mimetypes.best == 'application/x-ndjson':
+            def lines():
+                yield app.json.dumps(result).encode() + b'\n'
+                for update in live_demo_manager.demo_progress():
+                    yield app.json.dumps(update).encode() + b'\n'
+            return Response(stream_with_context(lines()), mimetype='application/x-ndjson')
+        
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/live-meeting/question', methods=['POST'])
 def handle_live_question():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
-        data = request.get_json()
+            return LIVE_NOT_INITIALIZED()
+        data = _request_json()
         result = live_demo_manager.handle_live_question(data.get('question', ''), data.get('participant', 'Customer'))
+        _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/live-meeting/end', methods=['POST'])
 def end_live_meeting():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
-        result = live_demo_manager.end_live_demo()
+            return LIVE_NOT_INITIALIZED()
+        with live_demo_lock:
+            result = live_demo_manager.end_live_demo()
+            _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/live-meeting/status')
 def get_live_meeting_status():
     try:
         if not live_demo_manager:
-            return jsonify({'active': False, 'error': 'Live meeting system not initialized'})
-        status = live_demo_manager.get_session_status()
-        return jsonify(status)
+            return LIVE_STATUS_NOT_INITIALIZED()
+        return _cached_status('live', live_demo_manager.get_session_status)
     except Exception as e:
         return jsonify({'active': False, 'error': str(e)}), 500
 
@@ -938,58 +1350,115 @@ def get_live_meeting_status():
 def start_screen_share():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
-        data = request.get_json()
+            return LIVE_NOT_INITIALIZED()
+        data = _request_json()
         platform = data.get('platform', 'auto')
         result = live_demo_manager.start_screen_sharing(platform)
+        _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/screen-share/stop', methods=['POST'])
 def stop_screen_share():
     try:
         if not live_demo_manager:
-            return jsonify({'success': False, 'error': 'Live meeting system not initialized'}), 500
+            return LIVE_NOT_INITIALIZED()
         result = live_demo_manager.stop_screen_sharing()
+        _invalidate_status()
         return jsonify(result)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _error_response(e)
 
 @app.route('/api/screen-share/status')
 def get_screen_share_status():
     try:
         if not live_demo_manager:
-            return jsonify({'available': False, 'error': 'Live meeting system not initialized'})
-        status = live_demo_manager.get_screen_share_status()
-        return jsonify(status)
+            return SCREEN_SHARE_NOT_INITIALIZED()
+        return _cached_status('screen', live_demo_manager.get_screen_share_status)
     except Exception as e:
         return jsonify({'available': False, 'error': str(e)}), 500
 
+@app.route('/api/state')
+def get_live_state():
+    """Live meeting and screen share status in one response, for the live demo page poller"""
+    try:
+        if not live_demo_manager:
+            return jsonify({
+                'live': {'active': False, 'error': 'Live meeting system not initialized'},
+                'screen': {'available': False, 'error': 'Live meeting system not initialized'}
+            })
+        return _cached_status('state', lambda: {
+            'live': live_demo_manager.get_session_status(),
+            'screen': live_demo_manager.get_screen_share_status()
+        })
+    except Exception as e:
+        return _error_response(e)
+
 @app.route('/api/listen', methods=['POST'])
 def voice_listen():
-    """Voice listening endpoint for live demo questions"""
+    """Start listening for a live demo question; poll /api/listen/<job_id> for the text"""
     try:
         if not voice_agent:
-            return jsonify({'success': False, 'error': 'Voice agent not available'}), 500
+            return VOICE_NOT_AVAILABLE()
+        
+        # Forget finished jobs nobody came back for
+        now = time.monotonic()
+        for job_id, (future, submitted) in list(_voice_jobs.items()):
+            if future.done() and now - submitted > VOICE_JOB_TTL:
+                _voice_jobs.pop(job_id, None)
         
-        # Listen for voice input
-        transcription = voice_agent.listen_and_transcribe()
+        # Listening runs on the ASR worker, so this request returns straight away
+        job_id = uuid.uuid4().hex
+        _voice_jobs[job_id] = (asr_executor.submit(voice_agent.listen_and_transcribe), now)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id
+        }), 202
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Voice recognition error: {str(e)}'
+        }), 500
+
+@app.route('/api/listen/<job_id>', methods=['GET'])
+def voice_listen_result(job_id):
+    """Result of a listening job started by POST /api/listen"""
+    job = _voice_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'done': True,
+            'error': 'Unknown listening job'
+        }), 404
+    
+    future = job[0]
+    if not future.done():
+        return jsonify({'success': True, 'done': False})
+    
+    _voice_jobs.pop(job_id, None)
+    try:
+        transcription = future.result()
         
         if transcription and transcription.strip():
             return jsonify({
                 'success': True,
+                'done': True,
                 'text': transcription.strip()
             })
         else:
             return jsonify({
                 'success': False,
+                'done': True,
                 'error': 'No speech detected or transcription failed'
             })
             
     except Exception as e:
         return jsonify({
             'success': False,
+            'done': True,
             'error': f'Voice recognition error: {str(e)}'
         }), 500
 
@@ -1007,6 +1476,18 @@ if __name__ == '__main__':
     print("🎤 Voice recognition and browser automation ready!")
     print()
     
+    # Debug mode (reloader, debugger) only with FLASK_DEV=1; otherwise a plain threaded
+    # server - for deployment use `gunicorn web_interface:app` (see gunicorn.conf.py)
+    if not FLASK_DEV:
+        print("💡 Running without the reloader; set FLASK_DEV=1 for debug mode or use gunicorn for deployment")
+    
     # Start Flask app on port 5001
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    if socketio is not None:
+        # The request handler only applies to the Werkzeug server used in threading mode
+        server_options = {'request_handler': NoDelayRequestHandler} if SOCKETIO_ASYNC_MODE == 'threading' else {}
+        socketio.run(app, debug=FLASK_DEV, host='0.0.0.0', port=5001, allow_unsafe_werkzeug=True,
+                     **server_options)
+    else:
+        app.run(debug=FLASK_DEV, host='0.0.0.0', port=5001, threaded=True,
+                request_handler=NoDelayRequestHandler)
 